@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+도메인 사전 교정 벤치마크
+
+SymSpell 색인 조회와 전체 용어 대상 편집 거리 비교(brute force)의 토큰당 비용 비교
+실행: python benchmarks/bench_lexicon.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.lexicon import get_domain_lexicon, bounded_edit_distance
+
+
+def corrupt(word, rng):
+    """OCR 오류 흉내: 한 글자 치환/삭제"""
+    i = rng.randrange(len(word))
+    if rng.random() < 0.5:
+        return word[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + word[i + 1:]
+    return word[:i] + word[i + 1:]
+
+
+def brute_force_lookup(lexicon, token, max_distance):
+    key = token.lower()
+    best, best_distance = None, max_distance + 1
+    for candidate in lexicon.canonical:
+        distance = bounded_edit_distance(key, candidate, max_distance)
+        if distance < best_distance:
+            best, best_distance = candidate, distance
+    return best
+
+
+def main():
+    rng = random.Random(42)
+
+    start = time.perf_counter()
+    lexicon = get_domain_lexicon()
+    build_ms = (time.perf_counter() - start) * 1000
+
+    words = [word for word in lexicon.canonical.values() if len(word) >= 5]
+    tokens = [corrupt(rng.choice(words), rng).capitalize() for _ in range(5000)]
+    tokens += ["Experience", "Manager", "Compensation", "Leadership", "Transition"] * 1000
+
+    start = time.perf_counter()
+    for token in tokens:
+        lexicon.correct_token(token)
+    symspell_us = (time.perf_counter() - start) * 1e6 / len(tokens)
+
+    start = time.perf_counter()
+    for token in tokens:
+        brute_force_lookup(lexicon, token, 2)
+    brute_us = (time.perf_counter() - start) * 1e6 / len(tokens)
+
+    print(f"사전 크기: {len(lexicon)}개 용어, 색인 생성 {build_ms:.1f}ms")
+    print(f"SymSpell 조회:    {symspell_us:8.1f} us/token")
+    print(f"전체 비교(brute): {brute_us:8.1f} us/token ({brute_us / symspell_us:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
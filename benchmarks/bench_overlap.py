@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+스크롤 중첩 탐색 벤치마크
+
+기존 방식(모든 중첩 길이에 대해 SequenceMatcher)과 줄 해시 + KMP 방식의 프레임당 비용 비교
+실행: python benchmarks/bench_overlap.py
+"""
+
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.overlap import find_line_overlap
+
+
+def sequence_matcher_overlap(prev_lines, curr_lines):
+    """기존 CaptureWidget.extract_incremental_content의 중첩 탐색"""
+    for overlap_len in range(min(len(prev_lines), len(curr_lines)), 0, -1):
+        if SequenceMatcher(None, prev_lines[-overlap_len:], curr_lines[:overlap_len]).ratio() > 0.7:
+            return overlap_len
+    return 0
+
+
+def make_frames(rng, pane_lines, scroll, corrupt):
+    """
+    채팅창이 scroll줄 스크롤된 두 프레임 (현재 프레임에 OCR 오류 corrupt줄)
+
+    Returns:
+        tuple: (prev_lines, curr_lines, 실제 중첩 줄 수)
+    """
+    words = "experience payroll team manager relocate years onsite benefits salary project".split()
+    transcript = [
+        f"Speaker{i % 2}: " + " ".join(rng.choice(words) for _ in range(rng.randint(4, 10)))
+        for i in range(pane_lines + scroll)
+    ]
+    prev_lines = transcript[:pane_lines]
+    curr_lines = transcript[scroll:scroll + pane_lines]
+    overlap = max(0, pane_lines - scroll)
+    for index in rng.sample(range(overlap), min(corrupt, overlap)):
+        curr_lines[index] = curr_lines[index].replace("e", "c", 1)
+    return prev_lines, curr_lines, overlap
+
+
+def measure(function, frames, repeat):
+    """
+    Returns:
+        tuple: (프레임당 ms, 실제 중첩 줄 수를 맞힌 비율)
+    """
+    correct = sum(1 for prev_lines, curr_lines, overlap in frames
+                  if function(prev_lines, curr_lines) == overlap)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for prev_lines, curr_lines, _ in frames:
+            function(prev_lines, curr_lines)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / (repeat * len(frames))
+    return elapsed_ms, correct / len(frames)
+
+
+def main():
+    rng = random.Random(7)
+    scenarios = [
+        ("작은 스크롤", lambda pane: rng.randint(1, 5)),
+        ("절반 스크롤", lambda pane: pane // 2 + rng.randint(0, 3)),
+        ("화면 전환", lambda pane: pane),
+    ]
+    for pane_lines in (20, 60, 120):
+        for name, scroll_of in scenarios:
+            for corrupt in (0, 2):
+                frames = [make_frames(rng, pane_lines, scroll_of(pane_lines), corrupt) for _ in range(10)]
+                repeat = 2 if pane_lines >= 120 else 5
+                old_ms, old_ok = measure(sequence_matcher_overlap, frames, repeat)
+                new_ms, new_ok = measure(find_line_overlap, frames, repeat)
+                print(f"{pane_lines:4d}줄 {name}, 손상 {corrupt}줄: "
+                      f"SequenceMatcher {old_ms:9.3f}ms (정확 {old_ok:4.0%})  "
+                      f"해시+KMP {new_ms:7.3f}ms (정확 {new_ok:4.0%})  {old_ms / new_ms:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
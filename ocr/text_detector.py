@@ -1,7 +1,8 @@
-from difflib import SequenceMatcher
 import time
 from typing import Optional, Tuple
 
+from src.core.similarity import is_similar
+
 class TextChangeDetector:
     def __init__(self, similarity_threshold: float = 0.8):
         """
@@ -24,10 +25,8 @@ class TextChangeDetector:
             self.previous_text = current_text
             return True, current_text
 
-        # 텍스트 유사도 계산
-        similarity = SequenceMatcher(None, self.previous_text, current_text).ratio()
-        
-        if similarity < self.similarity_threshold:
+        # 텍스트 유사도 비교 (SequenceMatcher 비율 기준, 저렴한 상한으로 먼저 거름)
+        if not is_similar(self.previous_text, current_text, self.similarity_threshold):
             self.previous_text = current_text
             self.last_update_time = time.time()
             return True, current_text
@@ -11,11 +11,61 @@ DEFAULT_SETTINGS = {
     "ocr": {
         "language": "kor+eng",  # OCR 언어 설정
         "confidence": 60,  # 최소 신뢰도 (%)
+        "line_cache_size": 512,  # 줄 이미지 인식 결과 캐시 크기 (줄 수)
+        "reocr_confidence": 60,  # 이 신뢰도 미만 단어만 확대하여 재인식 (%)
+        "reocr_scale": 2,  # 재인식 시 확대 배율
+        "workers": 4,  # 줄 단위 병렬 인식 워커 수
+        "omp_thread_limit": 1,  # Tesseract 프로세스당 OpenMP 스레드 수 (시작 시 OMP_THREAD_LIMIT로 설정, 이미 있으면 유지, None이면 설정 안 함)
+        "speaker_layout": True,  # 말풍선 배치/색으로 화자 판별
+        "domain_lexicon": True,  # HR 시스템/회사명 등 도메인 용어 OCR 오류 교정
+        "lexicon_terms": [],  # 도메인 사전에 추가할 고유 명칭
+        "quality_gate": {  # LLM으로 보내기 전 OCR 결과 품질 검사
+            "min_word_confidence": 60,  # 이 신뢰도 이상 단어를 신뢰할 수 있는 단어로 봄 (%)
+            "min_confident_ratio": 0.5,  # 신뢰할 수 있는 단어의 최소 비율
+            "min_dictionary_ratio": 0.35,  # 사전에 있는 영어 단어의 최소 비율 (신뢰할 수 있는 단어는 적중으로 봄)
+            "min_words": 2,  # 최소 단어 수
+            "wordlist_path": None,  # 영어 단어 목록 파일 (한 줄에 한 단어, None이면 시스템 단어 목록 또는 기본 단어)
+        },
+        "consensus": {  # 여러 프레임의 판독을 투표로 합쳐 안정된 줄만 확정
+            "enabled": True,
+            "match_threshold": 0.75,  # 같은 줄로 볼 최소 유사도
+            "min_stable_frames": 3,  # 합의가 이 프레임 수만큼 같으면 확정
+            "max_missed_frames": 2,  # 이 프레임 수만큼 보이지 않으면 확정 (스크롤되어 사라진 줄)
+            "max_pending": 60,  # 확정 대기 줄 상한
+            "max_readings": 8,  # 줄마다 투표에 쓸 최근 판독 수 (프레임당 비용 상한)
+        },
+    },
+    "transcript": {
+        "hot_lines": 2000,  # 메모리에 유지할 최근 전사 줄 수 (나머지는 세그먼트 파일로 이동)
+        "spill_dir": None,  # 세그먼트 파일 디렉터리 (None이면 시스템 임시 디렉터리)
+        "seen_window": 20000,  # 스크롤백 중복 판정에 기억할 최근 줄/블록 해시 수
+        "live_view_max_blocks": 500,  # 실시간 텍스트 표시 영역에 유지할 최대 문단 수
     },
     "gpt": {
         "model": "gpt-3.5-turbo",  # GPT 모델
         "temperature": 0.7,  # 생성 온도
         "max_tokens": 1000,  # 최대 토큰 수
+        "max_concurrency": 4,  # 동시에 진행할 수 있는 API 호출 수
+        "max_connections": 8,  # 공유 HTTP 연결 풀 크기 (keep-alive)
+        "timeout": 60,  # API 호출 제한 시간 (초)
+        "max_retries": 2,  # 일시적 오류 재시도 횟수
+        "cache": {  # 디스크 응답 캐시 (같은 요청의 반복 호출 비용 절약)
+            "enabled": True,
+            "path": "config/llm_cache.sqlite",
+            "max_bytes": 52428800,  # 최대 저장 크기 (압축 후, LRU로 제거)
+            "ttl_seconds": 604800,  # 항목 유효 기간 (7일)
+            "max_temperature": 0.3,  # 이 온도 이하 호출만 캐시 (결과가 거의 결정적)
+        },
+        "token_budget": {  # 전체 인터뷰 분석 호출의 전사 텍스트 토큰 예산
+            "context_tokens": None,  # 컨텍스트 창 크기 (None이면 모델 기본값)
+            "safety_margin": 256,  # 토큰 수 오차 대비 여유분
+            "steps": {  # 단계별 전사 텍스트 최대 토큰 수
+                "profile": 6000,
+                "comprehensive": 10000,
+                "improve_notes": 8000,
+                "fallback": 1500,
+            },
+        },
     },
     "ui": {
         "theme": "light",  # UI 테마
@@ -0,0 +1,243 @@
+from collections import defaultdict, deque
+from difflib import SequenceMatcher
+
+from src.core.overlap import normalize_line
+from src.core.similarity import is_similar
+
+
+def vote_words(readings):
+    """
+    여러 판독 결과의 단어별 가중 투표 (ROVER 방식)
+
+    가중치가 가장 큰 판독을 기준으로 삼고, 나머지 판독을 단어 단위로 정렬해
+    기준의 각 단어 위치와 단어 사이 빈자리마다 후보 단어에 가중치를 더한다.
+    위치마다 가중치 합이 가장 큰 후보(빈 단어 포함)를 고른다.
+
+    Args:
+        readings (list): (단어 리스트, 가중치) 튜플 리스트
+
+    Returns:
+        list: 합의된 단어 리스트
+    """
+    if not readings:
+        return []
+    pivot, pivot_weight = max(readings, key=lambda reading: reading[1])
+    total = sum(weight for _, weight in readings)
+
+    # slots[i]: 기준 단어 i에 대한 후보, gaps[i]: 기준 단어 i 앞에 끼어드는 단어 후보
+    slots = [defaultdict(float) for _ in pivot]
+    gaps = [defaultdict(float) for _ in range(len(pivot) + 1)]
+    for i, word in enumerate(pivot):
+        slots[i][word] += pivot_weight
+
+    matcher = SequenceMatcher(autojunk=False)
+    matcher.set_seq2(pivot)
+    skipped_pivot = False
+    for words, weight in readings:
+        if words is pivot and not skipped_pivot:
+            skipped_pivot = True
+            continue
+        matcher.set_seq1(words)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal' or (tag == 'replace' and i2 - i1 == j2 - j1):
+                for offset in range(j2 - j1):
+                    slots[j1 + offset][words[i1 + offset]] += weight
+            elif tag == 'delete':
+                gaps[j1][" ".join(words[i1:i2])] += weight
+            elif tag == 'insert':
+                for j in range(j1, j2):
+                    slots[j][""] += weight
+            else:
+                # 길이가 다른 치환: 구간 전체를 하나의 후보로 보고 첫 위치에 투표
+                slots[j1][" ".join(words[i1:i2])] += weight
+                for j in range(j1 + 1, j2):
+                    slots[j][""] += weight
+
+    result = []
+    for i in range(len(pivot) + 1):
+        inserted = gaps[i]
+        if inserted:
+            word, weight = max(inserted.items(), key=lambda item: item[1])
+            if weight > total - sum(inserted.values()):  # 끼워 넣지 않은 판독보다 많아야 채택
+                result.append(word)
+        if i < len(pivot):
+            word = max(slots[i].items(), key=lambda item: item[1])[0]
+            if word:
+                result.append(word)
+    return result
+
+
+class LineSlot:
+    """화면에 보이는 한 줄 (최근 max_readings 프레임의 판독 결과를 모음)"""
+
+    __slots__ = ('readings', 'text', 'key', 'frames', 'stable_frames', 'missed', 'committed')
+
+    def __init__(self, text, weight, max_readings=8):
+        self.readings = deque(maxlen=max(1, max_readings))
+        self.text = ""
+        self.key = ""
+        self.frames = 0
+        self.stable_frames = 0
+        self.missed = 0
+        self.committed = False
+        self.add(text, weight)
+
+    def add(self, text, weight):
+        """
+        판독 추가 후 합의 텍스트 갱신, 합의가 바뀌지 않은 연속 프레임 수를 셈
+
+        투표는 최근 판독만으로 하므로 줄이 오래 화면에 남아도 프레임당 비용이 일정하다.
+        """
+        self.readings.append((text.split(), max(weight, 1.0)))
+        self.frames += 1
+        self.missed = 0
+        consensus = " ".join(vote_words(self.readings))
+        if consensus == self.text:
+            self.stable_frames += 1
+        else:
+            self.text = consensus
+            self.key = normalize_line(consensus)
+            self.stable_frames = 1
+
+
+class LineConsensus:
+    """
+    다중 프레임 합의 OCR
+
+    같은 채팅 줄은 보통 여러 프레임에 연속으로 보이므로, 줄마다 프레임별 판독을
+    모아 신뢰도 가중 단어 투표로 합의 텍스트를 만든다. 합의가 min_stable_frames
+    프레임 동안 바뀌지 않거나 줄이 화면에서 사라지면 확정하며, 확정은 화면 순서대로
+    한 번만 한다. 확정된 줄도 화면에 남아 있는 동안은 계속 매칭되어 다시 확정되지 않으며,
+    확정 후에는 더 이상 투표하지 않는다.
+    """
+
+    def __init__(self, match_threshold=0.75, min_stable_frames=3, max_missed_frames=2, max_pending=60,
+                 max_readings=8):
+        """
+        Args:
+            match_threshold (float): 같은 줄로 볼 최소 유사도
+            min_stable_frames (int): 합의가 이 프레임 수만큼 같으면 확정
+            max_missed_frames (int): 이 프레임 수만큼 보이지 않으면 (스크롤되어 사라지면) 확정
+            max_pending (int): 확정 대기 줄이 이보다 많으면 앞에서부터 강제 확정
+            max_readings (int): 줄마다 투표에 쓸 최근 판독 수
+        """
+        self.match_threshold = match_threshold
+        self.min_stable_frames = max(1, min_stable_frames)
+        self.max_missed_frames = max(0, max_missed_frames)
+        self.max_pending = max(1, max_pending)
+        self.max_readings = max(1, max_readings)
+        self.slots = []  # 화면 순서 (위 → 아래)
+        self.readings = 0
+        self.committed_lines = 0
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings['ocr']['consensus'] 설정으로 생성"""
+        consensus_settings = settings.get('ocr', {}).get('consensus', {})
+        return cls(
+            match_threshold=consensus_settings.get('match_threshold', 0.75),
+            min_stable_frames=consensus_settings.get('min_stable_frames', 3),
+            max_missed_frames=consensus_settings.get('max_missed_frames', 2),
+            max_pending=consensus_settings.get('max_pending', 60),
+            max_readings=consensus_settings.get('max_readings', 8),
+        )
+
+    def feed(self, lines, confidences=None):
+        """
+        한 프레임의 줄들을 투표에 반영하고 새로 확정된 줄 반환
+
+        Args:
+            lines (list): 프레임의 줄 텍스트 (위 → 아래)
+            confidences (list): 줄별 OCR 신뢰도 (없거나 길이가 다르면 모두 같은 가중치)
+
+        Returns:
+            list: 새로 확정된 줄 텍스트 (화면 순서)
+        """
+        if not confidences or len(confidences) != len(lines):
+            confidences = [1.0] * len(lines)
+
+        matched = set()
+        insert_at = 0
+        for text, confidence in zip(lines, confidences):
+            text = " ".join(text.split())
+            if not text:
+                continue
+            self.readings += 1
+            index = self._match(text, insert_at, matched)
+            if index is None:
+                # 직전에 매칭된 줄 바로 아래에 새 줄 추가
+                self.slots.insert(insert_at, LineSlot(text, confidence or 1.0, self.max_readings))
+                index = insert_at
+            elif self.slots[index].committed:
+                # 확정된 줄은 화면에 보인다는 것만 기록 (투표하지 않음)
+                self.slots[index].missed = 0
+            else:
+                self.slots[index].add(text, confidence or 1.0)
+            matched.add(id(self.slots[index]))
+            insert_at = index + 1
+
+        for slot in self.slots:
+            if id(slot) not in matched:
+                slot.missed += 1
+
+        committed = self._commit_ready()
+        # 확정되었고 화면에서 사라진 줄은 더 이상 추적하지 않음
+        self.slots = [
+            slot for slot in self.slots
+            if not (slot.committed and slot.missed > self.max_missed_frames)
+        ]
+        return committed
+
+    def flush(self):
+        """대기 중인 줄을 모두 확정 (캡처 종료 시)"""
+        committed = [slot.text for slot in self.slots if not slot.committed and slot.text]
+        self.committed_lines += len(committed)
+        self.slots = []
+        return committed
+
+    def reset(self):
+        self.slots = []
+
+    def stats(self):
+        """판독 수, 확정 줄 수 (판독 수 / 확정 줄 수 = 줄당 평균 투표 수)"""
+        return {
+            'readings': self.readings,
+            'committed': self.committed_lines,
+            'pending': sum(1 for slot in self.slots if not slot.committed),
+        }
+
+    def _match(self, text, start, matched):
+        """
+        같은 줄로 볼 수 있는 슬롯 인덱스 (없으면 None)
+
+        화면 순서가 유지되므로 직전 매칭 위치부터 찾고, 정규화 텍스트가 같으면 바로 채택한다.
+        """
+        key = normalize_line(text)
+        order = list(range(start, len(self.slots))) + list(range(start))
+        for index in order:
+            slot = self.slots[index]
+            if id(slot) not in matched and slot.key == key:
+                return index
+        for index in order:
+            slot = self.slots[index]
+            if id(slot) not in matched and is_similar(slot.key, key, self.match_threshold):
+                return index
+        return None
+
+    def _commit_ready(self):
+        """화면 순서대로, 앞의 줄이 모두 확정 가능한 범위까지 확정"""
+        pending = [slot for slot in self.slots if not slot.committed]
+        committed = []
+        for position, slot in enumerate(pending):
+            ready = (
+                slot.stable_frames >= self.min_stable_frames
+                or slot.missed > self.max_missed_frames
+                or len(pending) - position > self.max_pending
+            )
+            if not ready:
+                break
+            slot.committed = True
+            if slot.text:
+                committed.append(slot.text)
+        self.committed_lines += len(committed)
+        return committed
@@ -0,0 +1,224 @@
+import re
+from collections import Counter, deque
+
+from src.core.domain_terms import MEANINGFUL_KEYWORDS
+
+# 분석 결과에 있으면 의미 없는 내용으로 보는 문구 (InterviewWidget._is_meaningful_assessment)
+MEANINGLESS_PHRASES = [
+    "no specific information provided",
+    "not provided in the transcript",
+    "no information available",
+    "information not specified",
+    "details not mentioned",
+    "not discussed in detail",
+    "no relevant information",
+    "information unavailable",
+    "not covered in interview",
+    "transcript does not contain",
+    "no data available",
+    "insufficient information",
+    "candidate did not provide",
+    "not applicable",
+    "not relevant",
+    "analysis error",
+    "analysis failed",
+    "processing failed",
+    "[category_name]",
+    "{'other':",
+    "{\"other\":",
+    "content not provided",
+    "information was not mentioned",
+    # 내용 없는 소개 문구
+    "briefly introduced himself",
+    "mentioned his current role",
+    "introduced herself",
+    "mentioned her current role",
+    "candidate introduced",
+    "mentioned their role",
+    "general introduction",
+    "basic introduction",
+    "candidate briefly",
+    "mentioned working at",
+    "talked about their",
+    "discussed their current",
+    "provided general information",
+    "gave an overview",
+    "shared basic details",
+    # 메타 코멘트
+    "interview text appears to be",
+    "does not provide any meaningful information",
+    "text appears garbled",
+    "no meaningful information",
+    "appears to be garbled",
+    "does not provide meaningful",
+    "text does not provide",
+    "information appears to be",
+    "content appears to be",
+    "seems to be garbled",
+    "analysis appears incomplete",
+]
+
+# 구체적 정보 패턴: (규칙 그룹, 정규식) - 대소문자 무시
+SPECIFIC_PATTERNS = [
+    ('number', r'\d+'),
+    ('amount', r'\$[\d,]+'),
+    ('company', r'[A-Z][a-zA-Z\s&]+(?:Inc|Corp|LLC|Company|Solutions|Logistics|Group)'),
+    ('person_name', r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'),
+    ('job_title', r'\b(?:manager|director|analyst|specialist|coordinator|supervisor|lead|executive)\b'),
+    ('experience_period', r'\b(?:years?|months?)\s+(?:of\s+)?(?:experience|work)'),
+    ('education', r'\b(?:bachelor|master|mba|phd|degree|certification)\b'),
+    ('hr_system', r'\b(?:payroll|HRIS|SAP|Oracle|Workday|SuccessFactors)\b'),
+    ('work_mode', r'\b(?:onsite|remote|hybrid|relocate|travel)\b'),
+    # HR 전문 용어
+    ('hr_term', r'\b(?:benefits|compensation|labor\s+relations|union|grievance|compliance|OSHA|FMLA|EEOC)\b'),
+    ('hr_term', r'\b(?:recruitment|hiring|onboarding|training|performance|appraisal)\b'),
+    ('hr_term', r'\b(?:policies|procedures|handbook|documentation|audit)\b'),
+    ('hr_term', r'\b(?:coordination|administration|management|oversight|supervision)\b'),
+    ('hr_term', r'\b(?:multi-state|multi-site|cross-functional|direct\s+reports)\b'),
+    ('hr_term', r'\b(?:negotiation|contract|agreement|policy)\b'),
+    # 동작/행위 관련 구체적 표현
+    ('action', r'\b(?:led|managed|coordinated|administered|supervised|implemented|developed|established)\b'),
+    ('action', r'\b(?:expertise|experience|proficient|skilled|knowledgeable)\b'),
+    # 감정/동기/가치관
+    ('motivation', r'\b(?:passionate|excited|motivated|enthusiastic|interested|drawn|attracted)\b'),
+    ('motivation', r'\b(?:believe|value|prioritize|focus|emphasize|commit)\b'),
+    ('motivation', r'\b(?:goal|aspiration|vision|mission|purpose|objective)\b'),
+    ('motivation', r'\b(?:challenging|opportunity|growth|development|learning|improvement)\b'),
+    ('culture_fit', r'\b(?:culture|environment|team|collaboration|relationship|communication)\b'),
+    ('culture_fit', r'\b(?:innovation|creativity|problem-solving|solution|strategic)\b'),
+    ('culture_fit', r'\b(?:leadership|responsibility|accountability|integrity|transparency)\b'),
+    ('culture_fit', r'\b(?:work-life|balance|flexibility|autonomy|empowerment)\b'),
+    # 감정 표현 구문
+    ('statement', r'(?:I\s+(?:am|feel|think|believe|want|hope|enjoy|love|prefer))'),
+    ('statement', r'(?:what\s+(?:excites|motivates|drives|inspires)\s+me)'),
+    ('statement', r'(?:(?:my|our)\s+(?:goal|mission|vision|approach|philosophy))'),
+    ('statement', r'(?:looking\s+for|seeking|hoping\s+to|wanting\s+to)'),
+    # 위치/타이밍/회사/산업 (스크립트 기반)
+    ('location', r'\b(?:Savannah|Atlanta|Chicago|New York|Los Angeles|relocate|relocation)\b'),
+    ('timing', r'\b(?:notice|timeline|available|start|transition)\b'),
+    ('industry', r'\b(?:Kenco|Hyundai|Glovis|automotive|manufacturing|packaging)\b'),
+    ('quantity', r'\b\d+\s*(?:week|staff|member|direct\s+report)'),
+    ('leadership', r'\b(?:VP|General\s+Manager|Director|accessibility|diverse)'),
+]
+
+
+class AhoCorasick:
+    """
+    여러 고정 문자열을 한 번에 찾는 Aho-Corasick 자동자
+
+    패턴 수와 무관하게 텍스트를 한 번만 훑는다. 부분 문자열 일치(단어 경계 없음)라서
+    기존 `keyword in text` 검사와 결과가 같다.
+    """
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns (iterable): 찾을 문자열들 (대소문자 구분, 필요하면 호출 측에서 소문자화)
+        """
+        self.patterns = list(patterns)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # 실패 링크 (너비 우선)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text):
+        """(끝 위치, 패턴 번호)를 텍스트 순서대로 생성"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for position, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in output[state]:
+                yield position, index
+
+    def find_all(self, text):
+        """텍스트에 나타나는 패턴 번호 집합"""
+        return {index for _, index in self.iter_matches(text)}
+
+    def first(self, text):
+        """가장 먼저 끝나는 일치 패턴 번호 (없으면 None)"""
+        for _, index in self.iter_matches(text):
+            return index
+        return None
+
+
+class ContentFilters:
+    """
+    InterviewWidget 내용 필터용 사전 컴파일 매처
+
+    키워드/문구는 Aho-Corasick 자동자 하나씩으로, 구체적 정보 패턴은 이름 있는 그룹의
+    단일 정규식으로 템플릿마다 한 번만 만든다. 분석 결과 항목마다 수십 번의
+    부분 문자열 검사와 re.findall을 반복하지 않는다.
+    """
+
+    def __init__(self, meaningful_keywords=MEANINGFUL_KEYWORDS, meaningless_phrases=MEANINGLESS_PHRASES,
+                 specific_patterns=SPECIFIC_PATTERNS):
+        """
+        Args:
+            meaningful_keywords (list): 의미 있는 내용 키워드 (목록에 두 번 있으면 두 번 센다)
+            meaningless_phrases (list): 의미 없는 분석 결과 문구
+            specific_patterns (list): (규칙 그룹, 정규식) 구체적 정보 패턴
+        """
+        # 같은 키워드가 목록에 여러 번 있으면 기존 합계처럼 그 횟수만큼 센다
+        self._keyword_weights = Counter(keyword.lower() for keyword in meaningful_keywords)
+        self._keywords = AhoCorasick(self._keyword_weights)
+        self._phrases = AhoCorasick(phrase.lower() for phrase in meaningless_phrases)
+
+        self._pattern_groups = {}
+        alternatives = []
+        for i, (group, pattern) in enumerate(specific_patterns):
+            name = f'p{i}'
+            self._pattern_groups[name] = group
+            alternatives.append(f'(?P<{name}>{pattern})')
+        self._specific = re.compile('|'.join(alternatives), re.IGNORECASE)
+
+    def meaningful_keyword_count(self, text):
+        """텍스트에 나타난 서로 다른 키워드 수 (목록 중복 가중)"""
+        found = self._keywords.find_all(text.lower())
+        return sum(self._keyword_weights[self._keywords.patterns[index]] for index in found)
+
+    def find_meaningless_phrase(self, text):
+        """텍스트에 있는 의미 없는 문구 (없으면 None)"""
+        index = self._phrases.first(text.lower())
+        return None if index is None else self._phrases.patterns[index]
+
+    def has_specific_information(self, text):
+        """구체적 정보 패턴이 하나라도 있는지"""
+        return self._specific.search(text) is not None
+
+    def count_specific(self, text):
+        """규칙 그룹별 구체적 정보 일치 수 (텍스트 한 번 훑기)"""
+        counts = Counter()
+        for match in self._specific.finditer(text):
+            counts[self._pattern_groups[match.lastgroup]] += 1
+        return counts
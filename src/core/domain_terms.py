@@ -0,0 +1,68 @@
+"""
+인터뷰 도메인 용어 목록
+
+OCR 교정 사전(lexicon)과 InterviewWidget의 내용 필터가 같은 목록을 공유한다.
+"""
+
+# 인터뷰에서 중요한 키워드들 (InterviewWidget._has_meaningful_content)
+MEANINGFUL_KEYWORDS = [
+    # 직업/경력 관련
+    "manager", "director", "experience", "years", "company", "work", "job", "position", "role",
+    # 기술/스킬 관련
+    "skills", "technical", "project", "system", "tools", "software", "certification",
+    # 교육/자격 관련
+    "education", "degree", "university", "college", "training", "certification",
+    # 급여/조건 관련
+    "salary", "compensation", "benefits", "location", "relocate", "remote", "onsite",
+    # 한국어 키워드들
+    "경험", "회사", "연봉", "기술", "프로젝트", "관리", "팀", "업무", "담당", "개발"
+]
+
+# 구체적 정보로 보는 용어들 (InterviewWidget._has_specific_information의 단어 패턴)
+SPECIFIC_TERMS = [
+    # 직책
+    "manager", "director", "analyst", "specialist", "coordinator", "supervisor", "lead", "executive",
+    # 학력/자격
+    "bachelor", "master", "degree", "certification",
+    # 근무 조건
+    "onsite", "remote", "hybrid", "relocate", "relocation", "travel",
+    # HR 전문 용어
+    "benefits", "compensation", "union", "grievance", "compliance",
+    "recruitment", "hiring", "onboarding", "training", "performance", "appraisal",
+    "policies", "procedures", "handbook", "documentation", "audit",
+    "coordination", "administration", "management", "oversight", "supervision",
+    "negotiation", "contract", "agreement", "policy",
+    # 동작/행위
+    "led", "managed", "coordinated", "administered", "supervised", "implemented", "developed", "established",
+    "expertise", "experience", "proficient", "skilled", "knowledgeable",
+    # 감정/동기/가치관
+    "passionate", "excited", "motivated", "enthusiastic", "interested", "drawn", "attracted",
+    "believe", "value", "prioritize", "focus", "emphasize", "commit",
+    "goal", "aspiration", "vision", "mission", "purpose", "objective",
+    "challenging", "opportunity", "growth", "development", "learning", "improvement",
+    "culture", "environment", "team", "collaboration", "relationship", "communication",
+    "innovation", "creativity", "solution", "strategic",
+    "leadership", "responsibility", "accountability", "integrity", "transparency",
+    "balance", "flexibility", "autonomy", "empowerment",
+    # 타이밍/산업
+    "notice", "timeline", "available", "start", "transition",
+    "automotive", "manufacturing", "packaging", "accessibility", "diverse",
+]
+
+# HR 시스템/도구 (대소문자 표기가 정해진 고유 명칭)
+HR_SYSTEMS = [
+    "SAP", "SuccessFactors", "Workday", "Oracle", "PeopleSoft", "HRIS", "ADP", "Paychex",
+    "Paycom", "Paylocity", "UKG", "Kronos", "Ceridian", "Dayforce", "BambooHR", "Greenhouse",
+    "iCIMS", "Taleo", "Cornerstone", "ServiceNow", "Salesforce", "Tableau",
+]
+
+# 회사명/지명 (대소문자 표기가 정해진 고유 명칭)
+COMPANY_NAMES = [
+    "Hyundai", "Glovis", "Kia", "Samsung", "LG", "SK", "Kenco", "Johnson", "Amazon", "Google",
+    "Microsoft", "Savannah", "Atlanta", "Chicago", "Georgia", "Alabama", "LATAM", "EMEA", "APAC",
+]
+
+# HR 약어
+HR_ACRONYMS = [
+    "FMLA", "EEOC", "OSHA", "ADA", "FLSA", "HRBP", "MBA", "PhD", "SHRM", "PHR", "SPHR", "VP",
+]
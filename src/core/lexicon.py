@@ -0,0 +1,241 @@
+import re
+import threading
+
+from src.core.domain_terms import (
+    MEANINGFUL_KEYWORDS, SPECIFIC_TERMS, HR_SYSTEMS, COMPANY_NAMES, HR_ACRONYMS
+)
+from src.core.wordlist import COMMON_WORDS, is_known_word
+
+# 영문 토큰 (OCR이 O를 0으로 읽는 경우가 있어 중간 숫자 허용: "EE0C")
+TOKEN_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9'&-]*[A-Za-z]")
+
+# 사람 이름 위치: "Jordan Johnston (Candidate):", "Jordan Johnston:" 줄 머리, "my name is ...", "I'm ..."
+PERSON_NAME_PATTERN = re.compile(
+    r"^[ \t]*(?P<header>[A-Z][\w.'-]*(?:[ \t]+[A-Z][\w.'-]*){0,3})[ \t]*(?:\([A-Za-z ]+\))?[ \t]*:"
+    r"|\b(?:[Mm]y name is|I'm|I am|[Tt]his is|[Cc]all me)[ \t]+(?P<name>[A-Z][\w'-]*(?:[ \t]+[A-Z][\w'-]*)?)",
+    re.MULTILINE,
+)
+
+
+def bounded_edit_distance(a, b, max_distance):
+    """
+    제한된 최적 문자열 정렬(OSA, 인접 전치 포함) 편집 거리
+
+    Returns:
+        int: 편집 거리, max_distance를 넘으면 max_distance + 1
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class SymSpellLexicon:
+    """
+    대칭 삭제(SymSpell) 색인 기반 도메인 용어 교정 사전
+
+    용어마다 최대 편집 거리까지의 삭제 변형을 미리 색인해 두고, 입력 토큰의 삭제
+    변형만 조회하여 후보를 찾는다. 용어 수와 무관하게 토큰당 조회 비용이 거의 일정하다.
+
+    교정 대상은 표기가 정해진 고유 명칭(HR 시스템, 회사명, 약어)뿐이고, 일반 키워드는
+    "이미 올바른 단어"로만 쓰인다 (예: "worked"를 "work"로 바꾸지 않음). 고유 명칭은
+    대문자로 시작하므로 소문자로 시작하는 토큰은 교정하지 않는다 ("gloves" → "Glovis" 방지).
+
+    편집 거리 교정은 OCR 손상으로 보이는 토큰에만 한다: 글자 사이에 숫자/기호가 있거나
+    ("W0rkday", "EE0C") 대소문자가 불규칙하거나("WorkDay"), 신뢰도가 낮게 읽힌 약어("EEDC").
+    형태가 온전한 대문자 단어("Kenzo", "Taleb", "Gloves")는 사람 이름이나 일반 단어일 수
+    있으므로 고치지 않고, 대소문자 표기만 다른 용어("Successfactors")만 표기를 통일한다.
+    """
+
+    def __init__(self, proper_terms, known_words=(), max_edit_distance=2, prefix_length=7):
+        """
+        Args:
+            proper_terms (iterable): 교정 대상 고유 명칭 (여러 단어면 단어별로 등록)
+            known_words (iterable): 교정하지 않을 올바른 단어들
+            max_edit_distance (int): 최대 편집 거리
+            prefix_length (int): 삭제 변형을 만들 접두어 길이 (색인 크기 제한)
+        """
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.canonical = {}  # 소문자 → 표기
+        self.known = set()
+        self._deletes = {}
+
+        for term in proper_terms:
+            for word in term.split():
+                key = word.lower()
+                if key not in self.canonical:
+                    self.canonical[key] = word
+                    self._index(key)
+        for word in known_words:
+            for part in word.split():
+                self.known.add(part.lower())
+
+        self.corrections = 0
+
+    def __len__(self):
+        return len(self.canonical)
+
+    def lookup(self, token):
+        """
+        토큰과 가장 가까운 고유 명칭 반환
+
+        Returns:
+            tuple: (표기, 편집 거리), 후보가 없으면 (None, None)
+        """
+        key = token.lower()
+        if key in self.canonical:
+            return self.canonical[key], 0
+
+        max_distance = self._allowed_distance(token)
+        if max_distance == 0:
+            return None, None
+
+        best, best_distance = None, max_distance + 1
+        seen = set()
+        for variant in self._variants(key[:self.prefix_length], max_distance):
+            for candidate in self._deletes.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = bounded_edit_distance(key, candidate, max_distance)
+                if distance < best_distance or (distance == best_distance and best is not None
+                                                and len(candidate) > len(best)):
+                    best, best_distance = candidate, distance
+        if best is None:
+            return None, None
+        return self.canonical[best], best_distance
+
+    def correct_token(self, token, uncertain_words=()):
+        """
+        토큰 하나를 교정 (교정 대상이 아니면 그대로 반환)
+
+        Args:
+            token (str): 영문 토큰
+            uncertain_words (set): 신뢰도가 낮게 읽힌 단어들 (소문자)
+        """
+        if not token[0].isupper():
+            return token
+        key = token.lower()
+        if key not in self.canonical and (not self._looks_damaged(token, uncertain_words)
+                                          or is_known_word(key, self.known)):
+            return token
+        term, distance = self.lookup(token)
+        if term is None or term == token:
+            return token
+        # 용어 뒤에 글자가 붙은 파생어 ("Georgian", "Workdays")
+        if distance > 0 and key.startswith(term.lower()):
+            return token
+        # 같은 단어의 대소문자만 다른 경우: 약어/고유 명칭 표기로 통일
+        if distance == 0 and not self._is_case_bearing(term):
+            return token
+        self.corrections += 1
+        return term
+
+    def correct_text(self, text, uncertain_words=()):
+        """
+        텍스트의 모든 영문 토큰 교정 (화자 헤더와 "my name is" 뒤의 사람 이름은 제외)
+
+        Args:
+            text (str): OCR 텍스트
+            uncertain_words (set): 신뢰도가 낮게 읽힌 단어들 (소문자)
+        """
+        if not text:
+            return text
+        protected = []
+        for match in PERSON_NAME_PATTERN.finditer(text):
+            group = 'header' if match.group('header') else 'name'
+            protected.append(match.span(group))
+
+        def correct(match):
+            start = match.start()
+            if any(begin <= start < end for begin, end in protected):
+                return match.group(0)
+            return self.correct_token(match.group(0), uncertain_words)
+
+        return TOKEN_PATTERN.sub(correct, text)
+
+    @staticmethod
+    def _looks_damaged(token, uncertain_words):
+        """OCR 손상으로 보이는 토큰인지 (형태가 온전한 단어는 이름/일반 단어일 수 있음)"""
+        if not token.replace("'", "").replace("-", "").isalpha():
+            return True  # 글자 사이의 숫자/기호
+        if token.istitle():
+            return False
+        if token.isupper():
+            return token.lower() in uncertain_words
+        return True  # 불규칙한 대소문자
+
+    def _allowed_distance(self, token):
+        """토큰 길이에 따른 허용 편집 거리 (짧은 단어는 오교정 위험이 크다)"""
+        if token.isupper() and len(token) >= 4:
+            return 1
+        if len(token) < 5:
+            return 0
+        if len(token) < 8:
+            return min(1, self.max_edit_distance)
+        return self.max_edit_distance
+
+    def _is_case_bearing(self, term):
+        return any(ch.isupper() for ch in term)
+
+    def _index(self, key):
+        prefix = key[:self.prefix_length]
+        for variant in self._variants(prefix, self.max_edit_distance):
+            self._deletes.setdefault(variant, []).append(key)
+
+    def _variants(self, word, max_distance):
+        """word와 삭제 변형들 (최대 max_distance개 문자 삭제)"""
+        variants = {word}
+        frontier = {word}
+        for _ in range(max_distance):
+            next_frontier = set()
+            for item in frontier:
+                if len(item) <= 1:
+                    continue
+                for i in range(len(item)):
+                    next_frontier.add(item[:i] + item[i + 1:])
+            next_frontier -= variants
+            variants |= next_frontier
+            frontier = next_frontier
+        return variants
+
+
+_domain_lexicon = None
+_domain_lexicon_lock = threading.Lock()
+
+
+def get_domain_lexicon(extra_terms=()):
+    """
+    도메인 교정 사전 반환 (처음 호출할 때 한 번만 색인 생성)
+
+    Args:
+        extra_terms (iterable): 배포별로 추가할 고유 명칭
+    """
+    global _domain_lexicon
+    if _domain_lexicon is None:
+        with _domain_lexicon_lock:
+            if _domain_lexicon is None:
+                _domain_lexicon = SymSpellLexicon(
+                    list(HR_SYSTEMS) + list(COMPANY_NAMES) + list(HR_ACRONYMS) + list(extra_terms),
+                    known_words=(list(MEANINGFUL_KEYWORDS) + list(SPECIFIC_TERMS)
+                                 + list(COMMON_WORDS)),
+                )
+                print(f"[Lexicon] 도메인 사전 로드: {len(_domain_lexicon)}개 용어")
+    return _domain_lexicon
@@ -0,0 +1,78 @@
+import hashlib
+from collections import OrderedDict
+
+
+def line_image_key(line_array):
+    """
+    이진화된 줄 이미지의 해시 키 생성
+
+    Args:
+        line_array (numpy.ndarray): 이진화된 줄 이미지 (uint8)
+
+    Returns:
+        bytes: 줄 이미지의 크기와 픽셀 내용을 반영한 해시 키
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(line_array.shape).encode('ascii'))
+    digest.update(line_array.tobytes())
+    return digest.digest()
+
+
+class LineCache:
+    """줄 이미지 해시 → (텍스트, 신뢰도, 단어별 신뢰도) LRU 캐시"""
+
+    def __init__(self, max_entries=512):
+        """
+        줄 캐시 초기화
+
+        Args:
+            max_entries (int): 최대 저장 줄 수 (초과 시 가장 오래 사용되지 않은 줄 제거)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        캐시 조회
+
+        Args:
+            key (bytes): line_image_key()로 만든 키
+
+        Returns:
+            tuple: (text, confidence, word_confidences), 없으면 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, text, confidence, word_confidences=()):
+        """캐시에 인식 결과 저장"""
+        self._entries[key] = (text, confidence, tuple(word_confidences))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """캐시 및 통계 초기화"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """캐시 통계 반환"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -3,7 +3,16 @@ pytesseract.pytesseract.tesseract_cmd = r"C:\\Program Files\\Tesseract-OCR\\tess
 from PIL import Image, ImageFilter, ImageEnhance
 import numpy as np
 import cv2
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from src.core.line_cache import LineCache, line_image_key
+from src.core.ocr_scheduler import OCRCancelled
+from src.core.speaker_layout import SpeakerAttributor, quantize_color
+from src.core.text_corrections import CorrectionEngine
+from src.core.lexicon import TOKEN_PATTERN, get_domain_lexicon
+from src.core.sentence_dedup import deduplicate_sentences
+from src.core.quality_gate import TextQualityGate
 
 class OCREngine:
     """고급 OCR 엔진 클래스"""
@@ -20,6 +29,40 @@ class OCREngine:
         self.confidence = max(70, settings['ocr']['confidence'])  # 최소 70% 신뢰도
         self.last_valid_text = ""  # 마지막 유효한 텍스트 저장
         
+        # 줄 단위 인식 결과 캐시 (변하지 않은 채팅 줄은 다시 인식하지 않음)
+        self.line_cache = LineCache(settings['ocr'].get('line_cache_size', 512))
+        
+        # 줄 분할 설정 (가로 투영 프로파일)
+        self.line_min_ink = 1  # 잉크 픽셀이 이 수 이상인 행만 텍스트 행으로 간주
+        self.line_merge_gap = 2  # 이 행 수 이하의 간격은 같은 줄로 병합
+        self.line_min_height = 6  # 이보다 얇은 줄은 노이즈로 제외
+        
+        # 캐시 미스 줄 병렬 인식 설정 (Tesseract는 줄마다 별도 프로세스로 실행됨)
+        # Tesseract 내부 OpenMP 스레드 수는 시작 시 main()에서 ocr.omp_thread_limit으로 제한
+        self.ocr_workers = settings['ocr'].get('workers', min(4, os.cpu_count() or 1))
+        self._line_executor = None
+        
+        # OCR 오류 교정 규칙 (배포별 규칙 포함, 생성 시 한 번만 컴파일)
+        self.corrections = CorrectionEngine.from_settings(settings)
+        
+        # 도메인 용어 교정 사전 (첫 사용 시 로드)
+        self.use_domain_lexicon = settings['ocr'].get('domain_lexicon', True)
+        self._lexicon = None
+        
+        # OCR 결과 품질 게이트 (단어별 신뢰도 + 사전 적중률)
+        self.quality_gate = TextQualityGate.from_settings(settings)
+        
+        # 말풍선 배치 기반 화자 판별 (OCR 텍스트 줄에 "화자: " 접두어 부여)
+        self.speaker_layout = settings['ocr'].get('speaker_layout', True)
+        self.speaker_attributor = SpeakerAttributor()
+        
+        # 저신뢰도 단어 선택적 고해상도 재인식 설정
+        self.ocr_padding = 10
+        self.reocr_confidence = settings['ocr'].get('reocr_confidence', 60)  # 이 미만이면 재인식
+        self.reocr_scale = settings['ocr'].get('reocr_scale', 2)  # 재인식 시 확대 배율
+        self.reocr_words = 0  # 재인식한 단어 수
+        self.reocr_improved = 0  # 재인식으로 교체된 단어 수
+        
     def preprocess_image(self, image):
         """
         OCR을 위한 이미지 전처리 강화
@@ -70,183 +113,368 @@ class OCREngine:
             print(f"[OCR] 이미지 전처리 실패: {e}")
             return image
         
-    def extract_text(self, image):
+    def binarize_image(self, image):
+        """
+        줄 분할 및 줄 단위 인식을 위한 이진화 (원본 해상도 유지)
+        
+        CLAHE는 이미지 전체에 고정된 타일 격자를 쓰기 때문에 스크롤로 줄이
+        이동하면 같은 줄도 다르게 이진화된다. 적응적 임계값이 이미 지역 대비를
+        보정하므로 여기서는 위치에 무관한 연산(메디안 블러 + 적응적 임계값)만 사용한다.
+        
+        Args:
+            image (PIL.Image): 원본 이미지
+            
+        Returns:
+            numpy.ndarray: 흰 배경에 검은 글자인 이진 이미지 (uint8)
+        """
+        img_array = np.array(image)
+        
+        if len(img_array.shape) == 3:
+            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        else:
+            gray = img_array
+        
+        denoised = cv2.medianBlur(gray, 3)
+        binary = cv2.adaptiveThreshold(
+            denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            cv2.THRESH_BINARY, 11, 2
+        )
+        
+        # 다크 모드 채팅창: 배경이 어두우면 반전하여 흰 배경/검은 글자로 통일
+        if binary.mean() < 127:
+            binary = cv2.bitwise_not(binary)
+        
+        return binary
+    
+    def segment_lines(self, binary):
+        """
+        가로 투영 프로파일로 텍스트 줄 분할 (NumPy 벡터 연산)
+        
+        Args:
+            binary (numpy.ndarray): binarize_image() 결과
+            
+        Returns:
+            list: 각 줄의 (top, bottom, left, right) 범위 리스트
+        """
+        ink = binary < 128
+        
+        # 1. 잉크가 있는 행 → 연속 구간(run)의 시작/끝 찾기
+        row_has_ink = ink.sum(axis=1) >= self.line_min_ink
+        edges = np.diff(np.concatenate(([0], row_has_ink.view(np.int8), [0])))
+        tops = np.flatnonzero(edges == 1)
+        bottoms = np.flatnonzero(edges == -1)
+        if len(tops) == 0:
+            return []
+        
+        # 2. 간격이 좁은 구간 병합 (i/j의 점, 한글 받침 등이 분리되지 않도록)
+        gaps = tops[1:] - bottoms[:-1]
+        split = np.flatnonzero(gaps > self.line_merge_gap)
+        tops = tops[np.concatenate(([0], split + 1))]
+        bottoms = bottoms[np.concatenate((split, [len(bottoms) - 1]))]
+        
+        # 3. 너무 얇은 줄(노이즈, 구분선) 제외
+        keep = (bottoms - tops) >= self.line_min_height
+        tops, bottoms = tops[keep], bottoms[keep]
+        
+        # 4. 줄별 좌우 여백 제거 (열 투영)
+        lines = []
+        for top, bottom in zip(tops.tolist(), bottoms.tolist()):
+            cols = np.flatnonzero(ink[top:bottom].any(axis=0))
+            lines.append((top, bottom, int(cols[0]), int(cols[-1]) + 1))
+        return lines
+    
+    def recognize_line(self, line_image, timeout=0):
+        """
+        단일 줄 이미지 인식 (PSM 7: 한 줄 텍스트로 가정)
+        
+        1차로 원본 해상도에서 인식하고, 신뢰도가 낮은 단어만 잘라서 확대 후
+        다시 인식하여 더 나은 결과로 교체한다. 대부분의 채팅 텍스트는 1배에서
+        깨끗하게 인식되므로 전체 이미지를 확대하는 비용을 피할 수 있다.
+        
+        Args:
+            line_image (numpy.ndarray): 이진화된 줄 이미지
+            timeout (float): Tesseract 프로세스 제한 시간(초), 0이면 제한 없음
+            
+        Returns:
+            tuple: (text, confidence, word_confidences)
+        """
+        words = self._recognize_words(line_image, timeout)
+        
+        for word in words:
+            if word['conf'] < self.reocr_confidence:
+                self._reocr_word(line_image, word, timeout)
+        
+        text = " ".join(word['text'] for word in words)
+        word_confidences = tuple(word['conf'] for word in words)
+        confidence = float(np.mean(word_confidences)) if words else 0.0
+        return text, confidence, word_confidences
+    
+    def _recognize_words(self, line_image, timeout=0, scale=1, psm=7):
+        """
+        줄(또는 단어) 이미지를 인식하여 단어별 텍스트/신뢰도/위치 반환
+        
+        Returns:
+            list: {'text', 'conf', 'left', 'top', 'width', 'height'} 딕셔너리 리스트
+                  (위치는 scale 적용 전 line_image 좌표)
+        """
+        pad = self.ocr_padding
+        if scale != 1:
+            height, width = line_image.shape
+            line_image = cv2.resize(line_image, (width*scale, height*scale), interpolation=cv2.INTER_CUBIC)
+        # 여백 추가 (Tesseract는 글자가 테두리에 붙어 있으면 인식률이 떨어짐)
+        padded = cv2.copyMakeBorder(line_image, pad, pad, pad, pad, cv2.BORDER_CONSTANT, value=255)
+        
+        data = pytesseract.image_to_data(
+            Image.fromarray(padded),
+            lang=self.language,
+            config=f'--oem 3 --psm {psm}',
+            output_type=pytesseract.Output.DICT,
+            timeout=timeout
+        )
+        
+        words = []
+        for i, word in enumerate(data['text']):
+            conf = float(data['conf'][i])
+            if conf < 0 or not word.strip():  # -1은 텍스트가 아닌 블록
+                continue
+            words.append({
+                'text': word.strip(),
+                'conf': conf,
+                'left': (data['left'][i] - pad) // scale,
+                'top': (data['top'][i] - pad) // scale,
+                'width': -(-data['width'][i] // scale),
+                'height': -(-data['height'][i] // scale),
+            })
+        return words
+    
+    def _reocr_word(self, line_image, word, timeout=0):
+        """
+        신뢰도가 낮은 단어만 잘라서 확대 후 재인식, 더 나으면 word를 갱신
+        
+        Args:
+            line_image (numpy.ndarray): 이진화된 줄 이미지
+            word (dict): _recognize_words()의 단어 (제자리에서 갱신됨)
+        """
+        height, width = line_image.shape
+        margin = 2
+        x0 = max(0, word['left'] - margin)
+        x1 = min(width, word['left'] + word['width'] + margin)
+        y0 = max(0, word['top'] - margin)
+        y1 = min(height, word['top'] + word['height'] + margin)
+        if x1 <= x0 or y1 <= y0:
+            return
+        
+        self.reocr_words += 1
+        # PSM 8: 단일 단어로 가정
+        candidates = self._recognize_words(line_image[y0:y1, x0:x1], timeout, scale=self.reocr_scale, psm=8)
+        if not candidates:
+            return
+        
+        retext = " ".join(candidate['text'] for candidate in candidates)
+        reconf = float(np.mean([candidate['conf'] for candidate in candidates]))
+        if reconf > word['conf']:
+            word['text'] = retext
+            word['conf'] = reconf
+            self.reocr_improved += 1
+    
+    def extract_text(self, image, job=None):
         """
-        이미지에서 텍스트 추출 (레이아웃 보존, 필터링 없음)
+        이미지에서 텍스트 추출 (줄 단위 인식 + 줄 이미지 캐시)
         
         Args:
             image (PIL.Image): 처리할 이미지
+            job (OCRJob): 스케줄러 작업 (있으면 마감을 넘기고 새 프레임에 밀렸을 때
+                줄 사이에서 OCRCancelled를 발생시킴)
             
         Returns:
-            dict: {'text': str, 'confidence': float} 형식의 결과
+            dict: {'text': str, 'confidence': float, 'word_confidences': list,
+                   'line_confidences': list} 형식의 결과 (line_confidences는 text의 줄 순서와 같음)
+                  (화자 판별 사용 시 'utterances': [{'speaker', 'content', 'is_interviewer'}] 포함)
         """
         try:
-            # 1. 이미지 전처리
-            processed_image = self.preprocess_image(image)
+            # 1. 이진화 및 줄 분할
+            binary = self.binarize_image(image)
+            line_ranges = self.segment_lines(binary)
             
-            # 2. OCR 설정 (PSM 4: 가변 크기의 단일 텍스트 열로 가정)
-            custom_config = r'--oem 3 --psm 4' 
+            # 2. 줄별 캐시 조회
+            line_images = [binary[top:bottom, left:right] for top, bottom, left, right in line_ranges]
+            keys = [line_image_key(line_image) for line_image in line_images]
+            results = [self.line_cache.get(key) for key in keys]
             
-            # 3. OCR 수행 (image_to_string 사용으로 레이아웃 보존)
-            text = pytesseract.image_to_string(
-                processed_image, 
-                lang=self.language,
-                config=custom_config
-            ).strip()
+            # 3. 캐시에 없는 줄만 Tesseract로 병렬 인식 (줄마다 별도 프로세스)
+            misses = [i for i, result in enumerate(results) if result is None]
+            recognized = self._recognize_lines(
+                [line_images[i] for i in misses], job
+            )
+            for i, result in zip(misses, recognized):
+                self.line_cache.put(keys[i], *result)
+                results[i] = result
+            
+            line_confidences = [confidence for text, confidence, _ in results if text]
+            word_confidences = [conf for text, _, confs in results if text for conf in confs]
+            text_line_confidences = line_confidences  # 본문 줄 순서와 같은 줄별 신뢰도
+            utterances = None
+            if self.speaker_layout:
+                # 4. 말풍선 배치/색으로 화자 판별, 헤더 행은 본문에서 제외
+                lines = self._layout_lines(image, binary, line_ranges, results)
+                attributed, utterances = self.speaker_attributor.attribute(lines, binary.shape[1])
+                line_texts = [f"{item['speaker']}: {item['content']}" for item in attributed]
+                text_line_confidences = [item['confidence'] for item in attributed]
+            else:
+                line_texts = [text for text, _, _ in results if text]
             
-            # 4. 텍스트가 없으면 즉시 반환
+            # 5. 텍스트가 없으면 즉시 반환
+            text = "\n".join(line_texts).strip()
             if not text:
                 return {'text': "", 'confidence': 0}
-
-            # 5. 신뢰도 계산
-            conf_data = pytesseract.image_to_data(
-                processed_image, 
-                lang=self.language,
-                config=custom_config,
-                output_type=pytesseract.Output.DICT
-            )
-            confidences = [int(c) for c in conf_data['conf'] if int(c) >= 0] # -1은 제외
-            avg_confidence = np.mean(confidences) if confidences else 0
             
-            # 6. 간단한 후처리만 수행
-            processed_text = self.advanced_text_processing(text)
+            avg_confidence = np.mean(line_confidences) if line_confidences else 0
+            
+            # 6. 간단한 후처리만 수행 (신뢰도가 낮게 읽힌 단어는 도메인 사전 교정 후보)
+            uncertain_words = {
+                token.lower()
+                for line_text, _, confs in results if line_text
+                for word, conf in zip(line_text.split(" "), confs)
+                if conf < self.quality_gate.min_word_confidence
+                for token in TOKEN_PATTERN.findall(word)
+            }
+            processed_text = self.advanced_text_processing(text, uncertain_words)
             
-            print(f"[OCR] 텍스트 추출 (No Filtering): {len(processed_text)}자 (평균 {avg_confidence:.1f}%)")
-            return {'text': processed_text, 'confidence': avg_confidence}
+            print(f"[OCR] 텍스트 추출: {len(processed_text)}자 (평균 {avg_confidence:.1f}%, "
+                  f"{len(line_ranges)}줄 중 {len(misses)}줄 인식, 캐시 {len(line_ranges) - len(misses)}줄, "
+                  f"재인식 누적 {self.reocr_improved}/{self.reocr_words}단어)")
+            result = {
+                'text': processed_text, 'confidence': avg_confidence,
+                'word_confidences': word_confidences, 'line_confidences': text_line_confidences,
+            }
+            if utterances is not None:
+                result['utterances'] = utterances
+            return result
 
+        except OCRCancelled:
+            raise
         except Exception as e:
             print(f"[OCR] 텍스트 추출 실패: {e}")
             return {'text': "", 'confidence': 0}
     
-    def advanced_text_processing(self, text):
+    def _layout_lines(self, image, binary, line_ranges, results):
         """
-        고급 텍스트 후처리 (대화 형식 유지)
+        화자 판별용 줄 정보 생성 (위치 + 말풍선 배경색)
         
-        Args:
-            text (str): 원본 텍스트
-            
         Returns:
-            str: 후처리된 텍스트
+            list: {'text', 'top', 'bottom', 'left', 'right', 'color', 'confidence'} 딕셔너리 리스트
         """
-        if not text:
-            return ""
-
-        # 1. 화자 이름 앞에 줄바꿈 추가 (e.g., "great! JT: I'm...")
-        # `\s`는 공백, `([A-Za-z]+:)`는 'JT:' 같은 화자 태그를 캡처.
-        text = re.sub(r'\s([A-Za-z]+:)', r'\n\1', text)
-
-        # 2. OCR 오류 패턴 수정
-        corrections = {
-            r'\b0\b': 'O',
-            r'\b1\b': 'I',
-            r'\bℓ\b': 'l',
-            r'\b5\b': 'S',
-            r'rn\b': 'm',
-            r'\bvv\b': 'w',
-            r'①②③④⑤⑥⑦⑧⑨⑩': '',
-            r'[◆■□▲▼★☆]': '',
-        }
-        
-        for pattern, replacement in corrections.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-
-        # 3. 줄 단위로 정리
-        lines = text.splitlines()
-        processed_lines = []
-        for line in lines:
-            # 3.1. 불필요한 문자 제거
-            line = re.sub(r'[^\w\s가-힣.,!?:;()[\]{}"\'/-]', '', line)
-            
-            # 3.2. 연속된 같은 문자 정리
-            line = re.sub(r'([a-zA-Z가-힣])\1{3,}', r'\1', line)
-            
-            # 3.3. 앞뒤 공백 제거
-            line = line.strip()
-
-            if line:
-                processed_lines.append(line)
+        rgb = np.asarray(image)
+        has_color = rgb.ndim == 3 and rgb.shape[:2] == binary.shape
         
-        # 4. 최종적으로 정리된 문장들을 다시 합침
-        return "\n".join(processed_lines)
+        lines = []
+        for (top, bottom, left, right), (text, confidence, _) in zip(line_ranges, results):
+            if not text:
+                continue
+            color = None
+            if has_color:
+                # 글자가 아닌 픽셀(배경)의 중앙값 = 말풍선 색
+                background = binary[top:bottom, left:right] >= 128
+                pixels = rgb[top:bottom, left:right, :3][background]
+                if len(pixels):
+                    color = quantize_color(np.median(pixels, axis=0))
+            lines.append({
+                'text': text, 'top': top, 'bottom': bottom,
+                'left': left, 'right': right, 'color': color, 'confidence': confidence,
+            })
+        return lines
+    
+    def set_interviewer_name(self, name):
+        """오른쪽 정렬(내 메시지) 말풍선의 화자 이름 설정"""
+        self.speaker_attributor.local_speaker = name
     
-    def is_valid_text(self, text):
+    def _recognize_lines(self, line_images, job):
         """
-        텍스트 품질 검증
+        여러 줄을 일괄 인식 (워커 수가 1보다 크면 스레드 풀로 병렬 처리)
         
-        Args:
-            text (str): 검증할 텍스트
-            
         Returns:
-            bool: 유효한 텍스트 여부
+            list: line_images 순서대로 (text, confidence, word_confidences) 리스트
         """
-        if not text or len(text) < 5:
-            return False
+        if not line_images:
+            return []
+        if self.ocr_workers <= 1 or len(line_images) == 1:
+            return [self._recognize_line_for_job(line_image, job) for line_image in line_images]
         
-        # 1. 의미있는 문자 비율 체크
-        meaningful_chars = len(re.findall(r'[a-zA-Z가-힣0-9]', text))
-        total_chars = len(text)
+        if self._line_executor is None:
+            self._line_executor = ThreadPoolExecutor(max_workers=self.ocr_workers, thread_name_prefix="OCRLine")
+        
+        futures = [
+            self._line_executor.submit(self._recognize_line_for_job, line_image, job)
+            for line_image in line_images
+        ]
+        try:
+            return [future.result() for future in futures]
+        except OCRCancelled:
+            for future in futures:
+                future.cancel()
+            raise
+    
+    def _recognize_line_for_job(self, line_image, job):
+        """스케줄러 작업의 마감/대체 여부를 반영하여 줄 인식"""
+        if job is None:
+            return self.recognize_line(line_image)
         
-        if meaningful_chars / total_chars < 0.7:  # 70% 이상이 의미있는 문자여야 함
-            return False
+        if job.should_cancel():
+            raise OCRCancelled()
         
-        # 2. 반복 패턴 체크
-        if len(set(text)) < len(text) * 0.3:  # 너무 많은 반복 문자
-            return False
+        # 이미 새 프레임이 대기 중이면 마감까지 남은 시간만 Tesseract에 허용
+        timeout = job.remaining() if job.is_superseded() else 0
+        try:
+            return self.recognize_line(line_image, timeout=timeout)
+        except RuntimeError as e:
+            if 'timeout' in str(e).lower():
+                raise OCRCancelled() from e
+            raise
+    
+    def advanced_text_processing(self, text, uncertain_words=()):
+        """
+        고급 텍스트 후처리 (대화 형식 유지)
         
-        # 3. 최소 단어 수 체크
-        words = text.split()
-        if len(words) < 2:  # 최소 2개 단어
-            return False
+        교정 규칙은 CorrectionEngine에 미리 컴파일되어 있으며 한 번에 적용된다.
+        이어서 도메인 사전으로 HR 시스템/회사명/약어의 OCR 오류를 교정한다.
         
-        return True
+        Args:
+            text (str): 원본 텍스트
+            uncertain_words (set): 신뢰도가 낮게 읽힌 단어들 (소문자, 도메인 사전 교정 후보)
+            
+        Returns:
+            str: 후처리된 텍스트
+        """
+        text = self.corrections.apply(text)
+        if self.use_domain_lexicon:
+            text = self.lexicon.correct_text(text, uncertain_words)
+        return text
+    
+    @property
+    def lexicon(self):
+        """도메인 용어 교정 사전 (처음 접근할 때 로드)"""
+        if self._lexicon is None:
+            self._lexicon = get_domain_lexicon(self.settings['ocr'].get('lexicon_terms', []))
+        return self._lexicon
     
-    def is_valid_text_relaxed(self, text):
+    def is_valid_text(self, text, word_confidences=None):
         """
-        텍스트 품질 검증 (실시간 인터뷰용 완화 버전)
+        텍스트 품질 검증 (단어별 신뢰도 + 사전 적중률, TextQualityGate 참고)
         
         Args:
             text (str): 검증할 텍스트
+            word_confidences (list): extract_text() 결과의 'word_confidences'
             
         Returns:
             bool: 유효한 텍스트 여부
         """
-        if not text or len(text) < 3:  # 최소 3글자 (기존 5글자에서 완화)
-            return False
-        
-        # 1. 의미있는 문자 비율 체크 (완화)
-        meaningful_chars = len(re.findall(r'[a-zA-Z가-힣0-9]', text))
-        total_chars = len(text)
-        
-        if meaningful_chars / total_chars < 0.5:  # 50% 이상 (기존 70%에서 완화)
-            return False
-        
-        # 2. 최소 단어 수 체크 (완화)
-        words = text.split()
-        if len(words) < 1:  # 최소 1개 단어 (기존 2개에서 완화)
-            return False
-        
-        # 3. 키워드 기반 추가 검증 (인터뷰 관련 단어가 있으면 허용)
-        interview_keywords = [
-            'experience', 'work', 'project', 'team', 'skill', 'years',
-            '경험', '업무', '프로젝트', '팀', '기술', '년', '회사', '담당',
-            'I', 'my', 'we', 'our', 'the', 'and', 'with', 'for'
-        ]
-        
-        text_lower = text.lower()
-        for keyword in interview_keywords:
-            if keyword.lower() in text_lower:
-                print(f"[OCR] 키워드 '{keyword}' 발견으로 텍스트 승인")
-                return True
-        
-        # 4. 반복 패턴 체크 (기존 유지)
-        if len(set(text)) < len(text) * 0.2:  # 너무 많은 반복 문자 (30%→20%로 완화)
-            return False
-        
-        return True
+        valid, reason = self.quality_gate.check(text, word_confidences)
+        return valid
         
     def set_language(self, language):
         """OCR 언어 설정"""
         self.language = language
+        self.line_cache.clear()  # 언어가 바뀌면 기존 인식 결과는 무효
         
     def set_confidence(self, confidence):
         """최소 신뢰도 설정"""
@@ -341,21 +569,8 @@ def text_to_sentences(text):
             sentence = re.sub(r'[.!?]+$', '', sentence)  # 끝의 문장부호 제거
             cleaned_sentences.append(sentence)
     
-    # 3. 중복 제거 (유사한 문장)
-    unique_sentences = []
-    for sentence in cleaned_sentences:
-        is_duplicate = False
-        for existing in unique_sentences:
-            # 80% 이상 유사하면 중복으로 간주
-            similarity = len(set(sentence.split()) & set(existing.split())) / max(len(sentence.split()), len(existing.split()))
-            if similarity > 0.8:
-                is_duplicate = True
-                break
-        
-        if not is_duplicate:
-            unique_sentences.append(sentence)
-    
-    return unique_sentences
+    # 3. 중복 제거 (80% 초과 단어가 겹치면 중복, 역색인으로 후보만 비교)
+    return deduplicate_sentences(cleaned_sentences, threshold=0.8)
 
 def format_sentences_output(sentences):
     """
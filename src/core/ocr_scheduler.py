@@ -0,0 +1,187 @@
+import threading
+import time
+from itertools import count
+
+
+class OCRCancelled(Exception):
+    """더 새로운 프레임에 밀려 중단된 OCR 작업"""
+
+
+class OCRJob:
+    """스케줄러에 제출된 한 프레임의 OCR 작업"""
+
+    def __init__(self, scheduler, frame_id, frame, deadline):
+        self.scheduler = scheduler
+        self.frame_id = frame_id
+        self.frame = frame
+        self.captured_at = time.time()  # 프레임 캡처(제출) 시각 - 전사 타임스탬프용 벽시계 시간
+        self.submitted_at = time.monotonic()
+        self.deadline = self.submitted_at + deadline
+
+    def remaining(self):
+        """마감까지 남은 시간(초), 지났으면 0"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def is_superseded(self):
+        """더 새로운 프레임이 대기 중인지 여부"""
+        return self.scheduler.has_newer_than(self.frame_id)
+
+    def should_cancel(self):
+        """마감을 넘겼고 더 새로운 프레임이 대기 중이면 중단"""
+        return self.remaining() == 0 and self.is_superseded()
+
+
+class OCRScheduler:
+    """
+    최신 프레임 우선(latest-wins) OCR 스케줄러
+
+    대기열은 한 칸뿐이다. 작업 중에 새 프레임이 들어오면 대기 중이던 프레임은
+    버려지고(dropped), 진행 중인 작업은 마감을 넘긴 상태에서 새 프레임이 있으면
+    줄 단위로 중단된다(cancelled). 부하가 걸려도 처리 지연이 한 프레임 이상
+    쌓이지 않는다. 더 새로운 프레임의 결과가 이미 나간 뒤에 끝난 작업의 결과는
+    전달하지 않는다(stale, process_now로 마지막 프레임을 먼저 처리한 경우).
+    """
+
+    def __init__(self, ocr_engine, on_result, deadline=2.0):
+        """
+        Args:
+            ocr_engine (OCREngine): 프레임을 처리할 OCR 엔진
+            on_result (callable): on_result(job, ocr_result) - 워커 스레드에서 호출됨
+            deadline (float): 프레임별 처리 마감 시간(초)
+        """
+        self.ocr_engine = ocr_engine
+        self.on_result = on_result
+        self.deadline = deadline
+
+        self._cond = threading.Condition()
+        self._busy = threading.Lock()  # OCR 엔진은 한 번에 한 작업만 사용
+        self._pending = None
+        self._frame_ids = count(1)
+        self._latest_id = 0
+        self._finished_id = 0  # 결과를 내보낸 가장 최신 프레임 ID
+        self._running = False
+        self._thread = None
+
+        self.submitted = 0
+        self.dropped = 0
+        self.cancelled = 0
+        self.completed = 0
+        self.stale = 0
+
+    def start(self):
+        """워커 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="OCRScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """워커 스레드 중지 (대기 중인 프레임은 버림)"""
+        with self._cond:
+            self._running = False
+            if self._pending is not None:
+                self.dropped += 1
+                self._pending = None
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, frame):
+        """
+        새 프레임 제출 (대기 중인 이전 프레임은 버려짐)
+
+        Returns:
+            int: 제출된 프레임 ID
+        """
+        with self._cond:
+            frame_id = next(self._frame_ids)
+            self._latest_id = frame_id
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = OCRJob(self, frame_id, frame, self.deadline)
+            self.submitted += 1
+            self._cond.notify()
+        return frame_id
+
+    def process_now(self, frame):
+        """
+        호출한 스레드에서 프레임을 즉시 처리 (캡처 종료 직전 마지막 프레임용)
+
+        대기 중인 프레임은 버리고 진행 중인 작업이 끝날 때까지 기다린다. 진행 중이던
+        작업의 결과는 이 프레임보다 오래되었으므로 전달하지 않는다.
+
+        Returns:
+            tuple: (OCRJob, OCR 결과), 중단되면 결과는 None
+        """
+        with self._cond:
+            frame_id = next(self._frame_ids)
+            self._latest_id = frame_id
+            if self._pending is not None:
+                self.dropped += 1
+                self._pending = None
+            self.submitted += 1
+        job = OCRJob(self, frame_id, frame, self.deadline)
+        with self._busy:
+            result = self._process(job)
+        self._claim(job)
+        return job, result
+
+    def has_newer_than(self, frame_id):
+        """frame_id 이후에 제출된 프레임이 있는지 여부"""
+        return self._latest_id > frame_id
+
+    def stats(self):
+        """작업 통계 반환"""
+        with self._cond:
+            return {
+                'submitted': self.submitted,
+                'dropped': self.dropped,
+                'cancelled': self.cancelled,
+                'completed': self.completed,
+                'stale': self.stale,
+            }
+
+    def _run(self):
+        """워커 루프: 항상 가장 최신 프레임만 처리"""
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                job = self._pending
+                self._pending = None
+
+            with self._busy:
+                result = self._process(job)
+            if result is not None and self._claim(job):
+                try:
+                    self.on_result(job, result)
+                except Exception as e:
+                    print(f"[OCRScheduler] 결과 처리 실패: {e}")
+
+    def _claim(self, job):
+        """job의 결과를 내보내도 되는지 (더 새로운 프레임의 결과가 이미 나갔으면 False)"""
+        with self._cond:
+            if job.frame_id < self._finished_id:
+                self.stale += 1
+                print(f"[OCRScheduler] 프레임 #{job.frame_id} 결과 버림 (#{self._finished_id} 결과가 이미 전달됨)")
+                return False
+            self._finished_id = job.frame_id
+            return True
+
+    def _process(self, job):
+        """작업 실행, 중단되면 None 반환"""
+        try:
+            result = self.ocr_engine.extract_text(job.frame, job=job)
+        except OCRCancelled:
+            with self._cond:
+                self.cancelled += 1
+            print(f"[OCRScheduler] 프레임 #{job.frame_id} 중단 (새 프레임으로 대체)")
+            return None
+        with self._cond:
+            self.completed += 1
+        return result
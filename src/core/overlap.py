@@ -0,0 +1,99 @@
+def normalize_line(line):
+    """줄 비교용 정규화 (대소문자, 공백 차이 무시)"""
+    return ' '.join(line.split()).lower()
+
+
+def line_hashes(lines):
+    """정규화된 줄 해시 리스트"""
+    return [hash(normalize_line(line)) for line in lines]
+
+
+def prefix_function(sequence):
+    """KMP 접두사 함수: pi[i] = sequence[:i+1]의 접두사이면서 접미사인 최장 길이 (자기 자신 제외)"""
+    pi = [0] * len(sequence)
+    k = 0
+    for i in range(1, len(sequence)):
+        while k and sequence[i] != sequence[k]:
+            k = pi[k - 1]
+        if sequence[i] == sequence[k]:
+            k += 1
+        pi[i] = k
+    return pi
+
+
+def exact_overlap(prev_hashes, curr_hashes):
+    """이전 줄들의 접미사 = 현재 줄들의 접두사인 최장 길이 (KMP, 선형 시간)"""
+    limit = min(len(prev_hashes), len(curr_hashes))
+    if not limit:
+        return 0
+    separator = object()  # 어떤 해시와도 같지 않은 구분자
+    pi = prefix_function(curr_hashes[:limit] + [separator] + prev_hashes[-limit:])
+    return pi[-1]
+
+
+def allowed_mismatches(length, min_match_ratio=0.7, max_mismatches=2):
+    """중첩 길이에 대해 허용되는 불일치 줄 수 (일치 비율이 min_match_ratio를 넘어야 함)"""
+    # (length - m) / length > min_match_ratio  ⇔  m < length * (1 - min_match_ratio)
+    limit = length * (1 - min_match_ratio)
+    mismatches = int(limit) - 1 if limit == int(limit) else int(limit)
+    return max(0, min(max_mismatches, mismatches))
+
+
+def find_line_overlap(prev_lines, curr_lines, min_match_ratio=0.7, max_mismatches=2):
+    """
+    스크롤 중첩 길이 탐색
+
+    이전 프레임의 마지막 L줄과 현재 프레임의 처음 L줄이 겹치는 최대 L을 찾는다.
+    정규화된 줄 해시에 KMP를 적용해 정확히 겹치는 최장 길이를 구한 뒤, OCR 오류로
+    한두 줄이 깨진 더 긴 중첩이 있는지 제한된 퍼지 검색으로 확인한다.
+
+    퍼지 검색: 불일치가 최대 k줄이면 현재 프레임의 처음 k+1줄 중 하나는 반드시
+    그대로 일치하므로, 그 줄들을 기준점으로 이전 프레임에서 같은 해시의 위치만
+    후보로 삼고 줄 단위 해밍 거리를 조기 종료하며 검증한다.
+
+    Args:
+        prev_lines (list): 이전 프레임 줄들
+        curr_lines (list): 현재 프레임 줄들
+        min_match_ratio (float): 중첩으로 인정할 최소 일치 줄 비율 (초과)
+        max_mismatches (int): 허용할 최대 불일치 줄 수
+
+    Returns:
+        int: 중첩 줄 수 (없으면 0)
+    """
+    prev_hashes = line_hashes(prev_lines)
+    curr_hashes = line_hashes(curr_lines)
+    best = exact_overlap(prev_hashes, curr_hashes)
+
+    limit = min(len(prev_hashes), len(curr_hashes))
+    if max_mismatches <= 0 or limit <= best:
+        return best
+
+    positions = {}
+    for index, value in enumerate(prev_hashes):
+        positions.setdefault(value, []).append(index)
+
+    prev_count = len(prev_hashes)
+    for anchor in range(min(max_mismatches + 1, len(curr_hashes))):
+        for prev_index in positions.get(curr_hashes[anchor], ()):
+            # prev[prev_index]와 curr[anchor]가 같은 줄이면 중첩 길이는 하나로 정해짐
+            length = prev_count - prev_index + anchor
+            if length <= best or length > limit:
+                continue
+            budget = allowed_mismatches(length, min_match_ratio, max_mismatches)
+            if anchor > budget:
+                continue
+            if _within_mismatches(prev_hashes, curr_hashes, length, budget):
+                best = length
+    return best
+
+
+def _within_mismatches(prev_hashes, curr_hashes, length, budget):
+    """prev의 마지막 length줄과 curr의 처음 length줄의 불일치가 budget 이하인지 (조기 종료)"""
+    offset = len(prev_hashes) - length
+    mismatches = 0
+    for i in range(length):
+        if prev_hashes[offset + i] != curr_hashes[i]:
+            mismatches += 1
+            if mismatches > budget:
+                return False
+    return True
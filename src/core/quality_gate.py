@@ -0,0 +1,146 @@
+import re
+from collections import Counter
+
+from src.core.domain_terms import (
+    MEANINGFUL_KEYWORDS, SPECIFIC_TERMS, HR_SYSTEMS, COMPANY_NAMES, HR_ACRONYMS
+)
+from src.core.speaker_layout import SPEAKER_PREFIX_PATTERN
+from src.core.wordlist import COMMON_WORDS, load_wordlist, is_known_word
+
+# 단어 토큰 (영문/숫자/한글)
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z'-]*|\d+(?:[.,]\d+)*|[가-힣]+")
+
+
+class TextQualityGate:
+    """
+    OCR 결과 품질 게이트
+
+    Tesseract가 이미 계산한 단어별 신뢰도와 사전 적중률로 프레임을 걸러낸다.
+    단어별 신뢰도가 있으면 높은 신뢰도로 읽힌 단어는 사전 적중으로 보고, 사전 적중률은
+    신뢰도가 낮은 단어에만 적용한다. 대부분의 단어가 높은 신뢰도로 읽힌 프레임은 사전에
+    없는 전문 용어/고유 명칭이 많아도 거부하지 않는다.
+    통과하지 못한 텍스트는 요약 버퍼와 분석 버퍼(= 유료 LLM 호출)로 가지 않으며,
+    거부 사유별 횟수를 세어 게이트가 줄인 호출 수를 확인할 수 있다.
+    """
+
+    def __init__(self, min_word_confidence=60, min_confident_ratio=0.5,
+                 min_dictionary_ratio=0.35, min_words=2, vocabulary=(), wordlist=None):
+        """
+        Args:
+            min_word_confidence (float): 이 값 이상이면 신뢰할 수 있는 단어
+            min_confident_ratio (float): 신뢰할 수 있는 단어의 최소 비율
+            min_dictionary_ratio (float): 사전에 있는 영어 단어의 최소 비율
+            min_words (int): 최소 단어 수
+            vocabulary (iterable): 단어 목록 외에 사전에 넣을 단어들
+            wordlist (iterable): 영어 단어 목록 (None이면 COMMON_WORDS)
+        """
+        self.min_word_confidence = min_word_confidence
+        self.min_confident_ratio = min_confident_ratio
+        self.min_dictionary_ratio = min_dictionary_ratio
+        self.min_words = min_words
+        self.vocabulary = set(COMMON_WORDS if wordlist is None else wordlist)
+        for term in vocabulary:
+            for word in term.lower().split():
+                self.vocabulary.add(word)
+
+        self.passed = 0
+        self.rejections = Counter()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings['ocr']['quality_gate'] 설정으로 게이트 생성 (도메인 용어 포함)"""
+        gate_settings = settings.get('ocr', {}).get('quality_gate', {})
+        return cls(
+            min_word_confidence=gate_settings.get('min_word_confidence', 60),
+            min_confident_ratio=gate_settings.get('min_confident_ratio', 0.5),
+            min_dictionary_ratio=gate_settings.get('min_dictionary_ratio', 0.35),
+            min_words=gate_settings.get('min_words', 2),
+            wordlist=load_wordlist(gate_settings.get('wordlist_path')),
+            vocabulary=(list(MEANINGFUL_KEYWORDS) + list(SPECIFIC_TERMS) + list(HR_SYSTEMS)
+                        + list(COMPANY_NAMES) + list(HR_ACRONYMS)),
+        )
+
+    def check(self, text, word_confidences=None):
+        """
+        텍스트 품질 판정
+
+        Args:
+            text (str): OCR 텍스트
+            word_confidences (list): 단어별 Tesseract 신뢰도 (없으면 신뢰도 검사 생략)
+
+        Returns:
+            tuple: (통과 여부, 거부 사유 또는 None)
+        """
+        reason = self._rejection_reason(text, word_confidences)
+        if reason:
+            self.rejections[reason] += 1
+            return False, reason
+        self.passed += 1
+        return True, None
+
+    def dictionary_ratio(self, text):
+        """
+        영어 단어 중 사전에 있는 단어의 비율
+
+        숫자는 적중으로 보고, 한글 토큰과 줄 앞의 화자 이름("Kim Lee:")은 계산에서 제외한다.
+
+        Returns:
+            float: 비율, 평가할 단어가 없으면 None
+        """
+        hits = 0
+        total = 0
+        tokens = []
+        for line in text.splitlines():
+            prefix_match = SPEAKER_PREFIX_PATTERN.match(line)
+            tokens.extend(WORD_PATTERN.findall(prefix_match.group(2) if prefix_match else line))
+        for token in tokens:
+            if token[0].isdigit():
+                hits += 1
+                total += 1
+                continue
+            if not token.isascii():
+                continue
+            total += 1
+            if self._is_known(token.lower()):
+                hits += 1
+        return hits / total if total else None
+
+    def stats(self):
+        """통과/거부 횟수와 거부 사유별 횟수"""
+        return {
+            'passed': self.passed,
+            'rejected': sum(self.rejections.values()),
+            'reasons': dict(self.rejections),
+        }
+
+    def _rejection_reason(self, text, word_confidences):
+        if not text or not text.strip():
+            return 'empty'
+
+        tokens = WORD_PATTERN.findall(text)
+        if len(tokens) < self.min_words:
+            return 'too_few_words'
+
+        # 의미 있는 문자 비율 (기호/노이즈 위주의 프레임)
+        meaningful_chars = sum(len(token) for token in tokens)
+        if meaningful_chars / len(text.replace(" ", "").replace("\n", "")) < 0.5:
+            return 'garbled'
+
+        confident_ratio = 0.0
+        if word_confidences:
+            confident = sum(1 for conf in word_confidences if conf >= self.min_word_confidence)
+            confident_ratio = confident / len(word_confidences)
+            if confident_ratio < self.min_confident_ratio:
+                return 'low_confidence'
+
+        ratio = self.dictionary_ratio(text)
+        if ratio is not None:
+            # 높은 신뢰도 단어는 적중으로 보고, 나머지(신뢰도가 낮은 단어)에만 사전 적중률 적용
+            ratio = confident_ratio + (1 - confident_ratio) * ratio
+            if ratio < self.min_dictionary_ratio:
+                return 'low_dictionary_hits'
+
+        return None
+
+    def _is_known(self, word):
+        return is_known_word(word, self.vocabulary)
@@ -0,0 +1,103 @@
+import mmap
+import os
+import tempfile
+import weakref
+from array import array
+
+
+def _remove_file(file, path):
+    file.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class SegmentFile:
+    """
+    추가 전용 줄 저장 파일 (메모리 맵으로 임의 접근)
+
+    줄을 UTF-8로 파일 끝에만 기록하고, 메모리에는 줄별 바이트/글자 오프셋 배열만
+    둔다 (줄당 16바이트). 읽을 때는 파일을 메모리 맵으로 열어 필요한 구간만 디코딩한다.
+    파일은 임시 파일이며 객체가 정리되거나 프로그램이 종료될 때 삭제된다.
+    """
+
+    def __init__(self, directory=None, prefix="transcript_"):
+        """
+        Args:
+            directory (str): 파일을 만들 디렉터리 (None이면 시스템 임시 디렉터리)
+            prefix (str): 파일 이름 접두사
+        """
+        fd, self.path = tempfile.mkstemp(prefix=prefix, suffix=".seg", dir=directory)
+        self._file = os.fdopen(fd, 'wb+')
+        self._byte_offsets = array('q', [0])  # 줄 i = [byte_offsets[i], byte_offsets[i+1]) (끝의 줄바꿈 포함)
+        self._char_offsets = array('q', [0])  # 줄 i까지의 글자 수 (줄바꿈 제외)
+        self._map = None
+        self._finalizer = weakref.finalize(self, _remove_file, self._file, self.path)
+
+    def __len__(self):
+        return len(self._byte_offsets) - 1
+
+    def append(self, lines):
+        """줄들을 파일 끝에 기록"""
+        if not lines:
+            return
+        self._unmap()  # 매핑된 채로 파일을 늘리지 않음 (Windows)
+        chunks = []
+        for line in lines:
+            data = line.encode('utf-8') + b"\n"
+            chunks.append(data)
+            self._byte_offsets.append(self._byte_offsets[-1] + len(data))
+            self._char_offsets.append(self._char_offsets[-1] + len(line))
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(b"".join(chunks))
+        self._file.flush()
+
+    def line(self, index):
+        """index번째 줄"""
+        data = self._mapped()[self._byte_offsets[index]:self._byte_offsets[index + 1] - 1]
+        return data.decode('utf-8')
+
+    def text(self, start=0, end=None):
+        """줄 구간 [start, end)를 줄바꿈으로 합친 텍스트"""
+        start, end = self._clamp(start, end)
+        if start >= end:
+            return ""
+        data = self._mapped()[self._byte_offsets[start]:self._byte_offsets[end] - 1]
+        return data.decode('utf-8')
+
+    def iter_text(self, start=0, end=None, batch_lines=1000):
+        """줄 구간 [start, end)를 batch_lines줄씩 합친 텍스트 조각 (조각 사이 줄바꿈 포함)"""
+        start, end = self._clamp(start, end)
+        for batch_start in range(start, end, batch_lines):
+            batch_end = min(end, batch_start + batch_lines)
+            if batch_start > start:
+                yield "\n"
+            yield self.text(batch_start, batch_end)
+
+    def char_count(self, start=0, end=None):
+        """줄 구간 [start, end)의 글자 수 (줄 사이 줄바꿈 포함)"""
+        start, end = self._clamp(start, end)
+        if start >= end:
+            return 0
+        return self._char_offsets[end] - self._char_offsets[start] + (end - start - 1)
+
+    def close(self):
+        """매핑과 파일을 닫고 삭제"""
+        self._unmap()
+        self._finalizer()
+
+    def _clamp(self, start, end):
+        count = len(self)
+        end = count if end is None else max(0, min(end, count))
+        return max(0, min(start, end)), end
+
+    def _mapped(self):
+        if self._map is None:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
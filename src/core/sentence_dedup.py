@@ -0,0 +1,109 @@
+class SentenceDeduplicator:
+    """
+    단어 겹침 비율 기반 문장 중복 판별기
+
+    두 문장은 공통 단어 수 / max(두 문장의 단어 수) > threshold 이면 중복이다
+    (text_to_sentences의 기존 판정과 동일). 모든 보관 문장과 쌍으로 비교하는 대신,
+    접두어 필터(prefix filtering)를 적용한 역색인으로 후보만 찾은 뒤 정확히 검증한다.
+
+    단어를 고정된 전역 순서(긴 단어 먼저)로 정렬하면, 필요한 최소 공통 단어 수 t를
+    넘는 두 문장은 각자의 앞쪽 (단어 집합 크기 - t + 1)개 단어 중 하나를 반드시 공유한다.
+    그래서 그 접두어 단어만 색인/조회해도 중복을 하나도 놓치지 않는다.
+    """
+
+    def __init__(self, threshold=0.8):
+        """
+        Args:
+            threshold (float): 중복으로 볼 겹침 비율 (이 값을 초과하면 중복)
+        """
+        self.threshold = threshold
+        self._entries = []  # (단어 집합, 단어 수)
+        self._index = {}  # 단어 → 접두어에 그 단어가 있는 문장 번호 리스트
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, sentence):
+        """
+        보관된 문장과 중복이 아니면 보관
+
+        Args:
+            sentence (str): 문장
+
+        Returns:
+            bool: 새 문장으로 보관했으면 True, 중복이면 False
+        """
+        words = sentence.split()
+        token_set = set(words)
+        word_count = len(words)
+        if not word_count:
+            return False
+
+        prefix = self._prefix(self._order(token_set), word_count)
+        if self._has_match(token_set, word_count, prefix):
+            return False
+
+        entry_id = len(self._entries)
+        self._entries.append((token_set, word_count))
+        for token in prefix:
+            self._index.setdefault(token, []).append(entry_id)
+        return True
+
+    def is_duplicate(self, sentence):
+        """보관하지 않고 중복 여부만 확인"""
+        words = sentence.split()
+        token_set = set(words)
+        word_count = len(words)
+        if not word_count:
+            return False
+
+        return self._has_match(token_set, word_count, self._prefix(self._order(token_set), word_count))
+
+    def clear(self):
+        self._entries.clear()
+        self._index.clear()
+        self.comparisons = 0
+
+    def _has_match(self, token_set, word_count, prefix):
+        """접두어 단어를 공유하는 후보 문장만 정확한 겹침 비율로 검증"""
+        checked = set()
+        for token in prefix:
+            for entry_id in self._index.get(token, ()):
+                if entry_id in checked:
+                    continue
+                checked.add(entry_id)
+                self.comparisons += 1
+                other_set, other_count = self._entries[entry_id]
+                overlap = len(token_set & other_set)
+                if overlap / max(word_count, other_count) > self.threshold:
+                    return True
+        return False
+
+    def _required_overlap(self, word_count):
+        """중복이 되려면 필요한 최소 공통 단어 수 (overlap / word_count > threshold)"""
+        return int(word_count * self.threshold) + 1
+
+    def _prefix(self, ordered, word_count):
+        """색인/조회할 접두어 단어들 (공통 단어가 필요 수보다 적을 수밖에 없으면 빈 리스트)"""
+        length = len(ordered) - self._required_overlap(word_count) + 1
+        return ordered[:length] if length > 0 else []
+
+    def _order(self, token_set):
+        """전역 단어 순서: 긴 단어(드문 단어)가 앞에 오도록 해 후보 목록을 짧게 유지"""
+        return sorted(token_set, key=lambda token: (-len(token), token))
+
+
+def deduplicate_sentences(sentences, threshold=0.8):
+    """
+    순서를 유지하며 유사 문장 제거
+
+    Args:
+        sentences (list): 문장 리스트
+        threshold (float): 중복으로 볼 단어 겹침 비율
+
+    Returns:
+        list: 앞에 나온 문장을 남긴 중복 제거 결과
+    """
+    deduplicator = SentenceDeduplicator(threshold)
+    return [sentence for sentence in sentences if deduplicator.add(sentence)]
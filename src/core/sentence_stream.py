@@ -0,0 +1,135 @@
+import re
+
+from src.core.speaker_layout import SPEAKER_PREFIX_PATTERN
+
+# 문장 끝: 문장부호 뒤 공백 (문장부호 바로 뒤 대문자/한글이 붙은 OCR 결과 포함)
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|(?<=[.!?])(?=[A-Z가-힣])')
+SENTENCE_END = re.compile(r'[.!?]["\')\]]*$')
+
+
+class StreamingSentenceSegmenter:
+    """
+    증분 텍스트를 받아 완성된 문장만 내보내는 스트리밍 문장 분할기
+
+    프레임 맨 아래에서 잘린 문장은 "대기 문장"으로 들고 있다가 다음 프레임에서
+    이어지는 내용과 합쳐 완성되면 한 번만 내보낸다. 다음 프레임이 잘린 줄을 다시
+    읽어 온 경우(대기 문장을 다시 포함한 줄)는 이어 붙이지 않고 대체한다.
+    프레임마다 새 텍스트만 처리하므로 비용은 누적 텍스트 길이와 무관하다.
+    """
+
+    def __init__(self, max_pending_chars=400):
+        """
+        Args:
+            max_pending_chars (int): 문장부호 없이 이 길이를 넘으면 완성된 문장으로 간주
+        """
+        self.max_pending_chars = max_pending_chars
+        self.min_resume_chars = 12  # 줄 중간에서 대기 문장을 찾을 최소 길이
+        self._pending = ""
+        self._speaker = None
+        self._next_id = 0
+
+    @property
+    def pending(self):
+        """아직 끝나지 않은 문장"""
+        return self._pending
+
+    def feed(self, text):
+        """
+        새 텍스트 추가
+
+        Args:
+            text (str): 새로 추출된 텍스트 ("화자: 내용" 줄 포함 가능)
+
+        Returns:
+            list: 완성된 문장 {'id', 'speaker', 'text'} 리스트 (발생 순서)
+        """
+        completed = []
+        for raw_line in (text or "").splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            speaker = None
+            content = line
+            prefix_match = SPEAKER_PREFIX_PATTERN.match(line)
+            if prefix_match and prefix_match.group(1).lower() not in ('http', 'https'):
+                speaker = prefix_match.group(1).strip()
+                content = prefix_match.group(2).strip()
+
+            same_speaker = speaker is None or speaker == self._speaker
+            resumed = self._resume_pending(content) if self._pending and same_speaker else None
+            if resumed is not None:
+                # 잘렸던 줄을 다시 읽은 경우: 이미 내보낸 앞부분은 버리고 대기 문장을 대체
+                content = resumed
+                self._pending = ""
+            elif speaker is not None and not same_speaker:
+                # 다른 화자의 발화 시작: 대기 문장은 끝난 것으로 간주
+                completed.extend(self._close_pending())
+
+            if speaker is not None:
+                self._speaker = speaker
+            completed.extend(self._append(content))
+        return completed
+
+    def flush(self):
+        """대기 문장을 완성된 문장으로 내보냄 (캡처 종료 시)"""
+        return self._close_pending()
+
+    def reset(self):
+        self._pending = ""
+        self._speaker = None
+
+    @staticmethod
+    def format(sentences):
+        """완성된 문장들을 "화자: 문장" 줄 텍스트로 변환"""
+        lines = []
+        for sentence in sentences:
+            if sentence['speaker']:
+                lines.append(f"{sentence['speaker']}: {sentence['text']}")
+            else:
+                lines.append(sentence['text'])
+        return "\n".join(lines)
+
+    def _resume_pending(self, content):
+        """
+        content가 대기 문장을 다시 포함하면 대기 문장 시작부터의 텍스트, 아니면 None
+
+        짧은 대기 문장은 우연히 겹칠 수 있으므로 줄 맨 앞에 있을 때만 인정한다.
+        """
+        pending = " ".join(self._pending.split())
+        normalized = " ".join(content.split())
+        if normalized.startswith(pending):
+            return normalized
+        if len(pending) >= self.min_resume_chars:
+            index = normalized.find(pending)
+            if index >= 0:
+                return normalized[index:]
+        return None
+
+    def _append(self, content):
+        buffer = f"{self._pending} {content}".strip() if self._pending else content
+        parts = [part for part in SENTENCE_BOUNDARY.split(buffer) if part.strip()]
+        if not parts:
+            self._pending = ""
+            return []
+
+        completed = [self._emit(part) for part in parts[:-1]]
+        last = parts[-1].strip()
+        if SENTENCE_END.search(last) or len(last) > self.max_pending_chars:
+            completed.append(self._emit(last))
+            self._pending = ""
+        else:
+            self._pending = last
+        return completed
+
+    def _close_pending(self):
+        if not self._pending:
+            return []
+        sentence = self._emit(self._pending)
+        self._pending = ""
+        return [sentence]
+
+    def _emit(self, text):
+        sentence = {'id': self._next_id, 'speaker': self._speaker, 'text': text.strip()}
+        self._next_id += 1
+        return sentence
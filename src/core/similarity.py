@@ -0,0 +1,90 @@
+from collections import Counter
+from difflib import SequenceMatcher
+
+# 삽입/삭제 거리 계산을 건너뛸 작업량 상한 (문자 수 × 허용 거리)
+MAX_INDEL_WORK = 400_000
+
+# 판정이 어느 단계에서 끝났는지 (조기 종료 효과 확인용)
+stage_counts = Counter()
+
+
+def bounded_indel_distance(a, b, max_distance):
+    """
+    삽입/삭제만 허용하는 편집 거리 (Myers O(ND) 알고리즘, 상한 초과 시 중단)
+
+    Returns:
+        int: 거리, max_distance를 넘으면 max_distance + 1
+    """
+    n, m = len(a), len(b)
+    if abs(n - m) > max_distance:
+        return max_distance + 1
+
+    offset = max_distance + 1
+    furthest = [0] * (2 * max_distance + 3)  # 대각선 k에서 도달한 최대 x
+    for d in range(max_distance + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and furthest[k - 1 + offset] < furthest[k + 1 + offset]):
+                x = furthest[k + 1 + offset]
+            else:
+                x = furthest[k - 1 + offset] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            furthest[k + offset] = x
+            if x >= n and y >= m:
+                return d
+    return max_distance + 1
+
+
+def is_similar(a, b, threshold):
+    """
+    SequenceMatcher(None, a, b).ratio() >= threshold 와 정확히 같은 판정
+
+    비싼 ratio() 계산 전에 항상 ratio() 이상인 상한값들로 먼저 거른다.
+    상한이 threshold보다 작으면 ratio()도 작으므로 바로 False를 반환하고,
+    모든 상한을 통과한 경우에만 ratio()로 확정한다.
+
+      1. 동일 문자열 → ratio() = 1.0
+      2. 길이 비율 (real_quick_ratio)
+      3. 문자 빈도 교집합 (quick_ratio)
+      4. 최장 공통 부분열 비율 = 1 - 삽입/삭제 거리 / 전체 길이 (허용 거리를 넘으면 중단)
+
+    Args:
+        a (str): 이전 텍스트
+        b (str): 현재 텍스트
+        threshold (float): 유사도 임계값
+
+    Returns:
+        bool: 유사도가 threshold 이상인지
+    """
+    if a == b:
+        stage_counts['identical'] += 1
+        return 1.0 >= threshold
+
+    total = len(a) + len(b)
+    if not total:
+        return 1.0 >= threshold
+
+    # 2. 길이만으로 가능한 최대 유사도
+    if 2.0 * min(len(a), len(b)) / total < threshold:
+        stage_counts['length'] += 1
+        return False
+
+    # 3. 문자 빈도 교집합 (순서 무시)
+    common = sum((Counter(a) & Counter(b)).values())
+    if 2.0 * common / total < threshold:
+        stage_counts['quick_ratio'] += 1
+        return False
+
+    # 4. 최장 공통 부분열: SequenceMatcher가 찾는 일치 블록은 공통 부분열이므로 ratio() 이하가 아님
+    #    부동소수점 오차로 잘못 거르지 않도록 허용 거리는 1 크게 잡는다
+    max_distance = int(total * (1 - threshold)) + 1
+    if total * max_distance <= MAX_INDEL_WORK:
+        distance = bounded_indel_distance(a, b, max_distance)
+        if distance > max_distance or (total - distance) / total < threshold:
+            stage_counts['indel'] += 1
+            return False
+
+    stage_counts['ratio'] += 1
+    return SequenceMatcher(None, a, b).ratio() >= threshold
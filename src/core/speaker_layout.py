@@ -0,0 +1,206 @@
+import re
+from collections import Counter
+
+# "JT:" 처럼 텍스트에 화자가 이미 적혀 있는 줄
+SPEAKER_PREFIX_PATTERN = re.compile(r'^\s*([A-Za-z][\w .\'-]{0,30}?)\s*:\s*(.+)$')
+
+# Zoom 채팅 헤더: "From John Smith to Everyone: 10:32 AM"
+ZOOM_HEADER_PATTERN = re.compile(r'^\s*From\s+(.+?)\s+to\s+.+?:?\s*(?:\d{1,2}:\d{2}\s*(?:[AaPp][Mm])?)?\s*$')
+
+# 이름 헤더 행: "John Smith", "John Smith 10:32 AM", "John Smith (Guest)"
+# (역할 표시/시각 그룹이 헤더 근거 - 없으면 이미 아는 참가자 이름일 때만 헤더로 봄)
+NAME_HEADER_PATTERN = re.compile(
+    r'^\s*([A-Z][\w.\'-]*(?:\s+[A-Z][\w.\'-]*){0,3})'
+    r'(\s*\((?:Guest|Host|Me|You|External)\))?'
+    r'(\s+\d{1,2}:\d{2}\s*(?:[AaPp][Mm])?)?\s*$'
+)
+
+# 이름 헤더로 오인하기 쉬운 짧은 대답
+NOT_A_NAME = {'yes', 'no', 'ok', 'okay', 'sure', 'thanks', 'thank you', 'great', 'hi', 'hello', 'bye'}
+
+
+class SpeakerAttributor:
+    """
+    채팅 말풍선 배치(정렬, 들여쓰기, 배경색, 이름 헤더)로 줄의 화자를 판별
+
+    채팅 앱은 대부분 내 메시지를 오른쪽에, 상대 메시지를 왼쪽에 그리고 말풍선
+    색도 화자별로 다르다. 캡처하는 사람(리크루터)이 곧 인터뷰어이므로 오른쪽
+    정렬 말풍선은 인터뷰어로 본다.
+    """
+
+    def __init__(self, local_speaker="Interviewer", remote_speaker="Candidate"):
+        """
+        Args:
+            local_speaker (str): 오른쪽 정렬(내 메시지) 화자 이름
+            remote_speaker (str): 판별 근거가 없을 때의 기본 화자 이름
+        """
+        self.local_speaker = local_speaker
+        self.remote_speaker = remote_speaker
+        self.right_align_ratio = 0.35  # 줄 왼쪽 끝이 프레임 폭의 이 비율보다 오른쪽이면 오른쪽 정렬
+        self.same_bubble_gap = 1.2  # 줄 높이 대비 이 배수 이하 간격이면 같은 말풍선
+        self.min_color_distance = 2  # 양자화 색 채널 차이가 이 이상이어야 화자별 색이 다르다고 봄
+        self.color_dominance = 0.8  # 색 하나에서 한 화자가 이 비율 이상이어야 색을 근거로 사용
+        self._color_speakers = {}  # 말풍선 색 → Counter(화자) (세션 동안 학습)
+        # 근거(시각/역할 표시, Zoom 헤더, "이름: 내용")가 있는 헤더에서 확인된 참가자 이름
+        self._participants = {local_speaker.lower(), remote_speaker.lower()}
+
+    def attribute(self, lines, frame_width):
+        """
+        줄 목록에 화자를 부여하고 연속된 같은 화자의 줄을 발화로 묶음
+
+        Args:
+            lines (list): {'text', 'top', 'bottom', 'left', 'right', 'color'} 딕셔너리 리스트
+                          (위에서 아래 순서, color는 양자화된 말풍선 배경색 또는 None)
+            frame_width (int): 캡처 프레임 폭
+
+        Returns:
+            tuple: (attributed_lines, utterances)
+                attributed_lines: {'speaker', 'content', 'is_interviewer'} 줄별 리스트 (헤더 행 제외)
+                utterances: 같은 형식, 연속된 같은 화자 줄을 하나로 합친 리스트
+        """
+        attributed = []
+        header_speaker = None
+        header_right = False
+        previous = None
+
+        for line in lines:
+            text = line['text'].strip()
+            if not text:
+                continue
+
+            # 1. 이름 헤더 행: 이후 줄들의 화자를 정하고 자신은 내용에서 제외
+            is_right = line['left'] > frame_width * self.right_align_ratio
+            header = self._match_header(text)
+            if header:
+                header_speaker = header
+                header_right = is_right
+                previous = None
+                continue
+
+            # 2. "이름: 내용" 형식이면 텍스트의 화자를 그대로 사용
+            speaker = None
+            content = text
+            prefix_match = SPEAKER_PREFIX_PATTERN.match(text)
+            if prefix_match and prefix_match.group(1).lower() not in ('http', 'https'):
+                speaker = prefix_match.group(1).strip()
+                content = prefix_match.group(2).strip()
+                self._participants.add(speaker.lower())
+
+            # 3. 바로 위 줄과 같은 말풍선이면 같은 화자
+            if speaker is None and previous is not None and self._same_bubble(previous, line):
+                speaker = previous['speaker']
+
+            # 4. 같은 쪽에 정렬된 헤더가 있으면 헤더 화자
+            if speaker is None and header_speaker and is_right == header_right:
+                speaker = header_speaker
+
+            # 5. 학습된 말풍선 색 (화자별 색이 뚜렷이 다를 때만)
+            color = line.get('color')
+            if speaker is None and color is not None:
+                speaker = self._color_speaker(color)
+
+            # 6. 정렬: 오른쪽 정렬은 내 메시지(인터뷰어)
+            if speaker is None:
+                if is_right:
+                    speaker = self.local_speaker
+                else:
+                    speaker = self.remote_speaker
+
+            if color is not None:
+                self._color_speakers.setdefault(color, Counter())[speaker] += 1
+
+            previous = dict(line, speaker=speaker)
+            attributed.append({
+                'speaker': speaker,
+                'content': content,
+                'is_interviewer': speaker.lower() == self.local_speaker.lower(),
+                'confidence': line.get('confidence'),
+            })
+
+        return attributed, self._merge_turns(attributed)
+
+    def reset(self):
+        """학습된 말풍선 색과 참가자 초기화 (다른 채팅창으로 전환 시)"""
+        self._color_speakers.clear()
+        self._participants = {self.local_speaker.lower(), self.remote_speaker.lower()}
+
+    def _match_header(self, text):
+        """
+        이름 헤더 행이면 화자 이름, 아니면 None
+
+        "Workday", "Absolutely" 같은 대문자로 시작하는 짧은 대답도 이름 모양이므로,
+        시각이나 역할 표시가 붙어 있거나 이미 확인된 참가자 이름일 때만 헤더로 본다.
+        """
+        zoom_match = ZOOM_HEADER_PATTERN.match(text)
+        if zoom_match:
+            name = zoom_match.group(1).strip()
+            if name.lower() in ('me', 'you'):
+                return self.local_speaker
+            self._participants.add(name.lower())
+            return name
+
+        name_match = NAME_HEADER_PATTERN.match(text)
+        if name_match and len(text) <= 40:
+            name = name_match.group(1).strip()
+            if name.lower() in NOT_A_NAME or name.lower().rstrip('.') in NOT_A_NAME:
+                return None
+            # 문장 끝 문장부호가 있으면 대답이지 헤더가 아님
+            if text.rstrip().endswith(('.', '!', '?')):
+                return None
+            has_marker = bool(name_match.group(2) or name_match.group(3))
+            if has_marker:
+                self._participants.add(name.lower())
+                return name
+            if name.lower() in self._participants:
+                return name
+        return None
+
+    def _color_speaker(self, color):
+        """
+        말풍선 색으로 정한 화자 (근거가 약하면 None)
+
+        배경색이 모두 같은 채팅창에서는 색이 화자를 구분하지 못하므로, 이 색에서 한 화자가
+        대부분이고 다른 화자가 뚜렷이 다른 색으로 학습되어 있을 때만 색을 믿는다.
+        """
+        counts = self._color_speakers.get(color)
+        if not counts:
+            return None
+        speaker, hits = counts.most_common(1)[0]
+        if hits < sum(counts.values()) * self.color_dominance:
+            return None
+        for other_color, other_counts in self._color_speakers.items():
+            if other_color == color:
+                continue
+            other_speaker, other_hits = other_counts.most_common(1)[0]
+            if (other_speaker != speaker
+                    and other_hits >= sum(other_counts.values()) * self.color_dominance
+                    and max(abs(a - b) for a, b in zip(color, other_color)) >= self.min_color_distance):
+                return speaker
+        return None
+
+    def _same_bubble(self, previous, line):
+        """두 줄이 같은 말풍선에 속하는지 (세로 간격, 들여쓰기, 배경색)"""
+        height = max(1, previous['bottom'] - previous['top'])
+        if line['top'] - previous['bottom'] > height * self.same_bubble_gap:
+            return False
+        if abs(line['left'] - previous['left']) > height * 2:
+            return False
+        if previous.get('color') is not None and line.get('color') is not None:
+            return previous['color'] == line['color']
+        return True
+
+    def _merge_turns(self, attributed):
+        """연속된 같은 화자의 줄을 하나의 발화로 합침"""
+        utterances = []
+        for item in attributed:
+            if utterances and utterances[-1]['speaker'] == item['speaker']:
+                utterances[-1]['content'] += " " + item['content']
+            else:
+                utterances.append(dict(item))
+        return utterances
+
+
+def quantize_color(rgb, levels=16):
+    """말풍선 배경색 비교용 색 양자화 (안티앨리어싱/압축 노이즈 무시)"""
+    step = 256 // levels
+    return tuple(int(channel) // step for channel in rgb)
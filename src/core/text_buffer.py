@@ -0,0 +1,100 @@
+class ChunkedTextBuffer:
+    """
+    조각 리스트 기반 텍스트 버퍼
+
+    문자열을 매번 이어 붙이지 않고 조각(보통 한 줄 또는 한 번에 추가된 텍스트)을
+    리스트에 쌓는다. 추가는 O(1)이고, 최근 N줄/K글자 같은 꼬리 구간은 끝 조각들만
+    보고 만들며, 전체 문자열은 실제로 필요할 때(내보내기 등) 한 번만 합친다.
+    """
+
+    def __init__(self, separator="\n"):
+        """
+        Args:
+            separator (str): 조각 사이 구분자
+        """
+        self.separator = separator
+        self._chunks = []
+        self._offsets = [0]  # _offsets[i] = _chunks[:i]의 글자 수 (구분자 제외)
+        self._joined = None  # 전체 문자열 캐시 (추가 시 무효화)
+
+    def __len__(self):
+        """전체 텍스트 길이 (구분자 포함)"""
+        return self.char_count()
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    @property
+    def chunk_count(self):
+        return len(self._chunks)
+
+    def append(self, text):
+        """조각 추가 (빈 문자열도 하나의 조각으로 셈)"""
+        self._chunks.append(text)
+        self._offsets.append(self._offsets[-1] + len(text))
+        self._joined = None
+
+    def text(self, start=0, end=None):
+        """
+        start번째 조각부터 end번째 조각 전까지 합친 텍스트
+
+        전체 텍스트는 다음 추가 전까지 캐시된다.
+        """
+        if end is not None:
+            return self.separator.join(self._chunks[max(0, start):end])
+        if start <= 0:
+            if self._joined is None:
+                self._joined = self.separator.join(self._chunks)
+            return self._joined
+        return self.separator.join(self._chunks[start:])
+
+    def char_count(self, start=0):
+        """start번째 조각부터 끝까지의 길이 (구분자 포함)"""
+        count = len(self._chunks) - max(0, start)
+        if count <= 0:
+            return 0
+        return self._offsets[-1] - self._offsets[max(0, start)] + len(self.separator) * (count - 1)
+
+    def tail_chunks(self, count):
+        """최근 count개 조각"""
+        return self._chunks[-count:] if count > 0 else []
+
+    def tail_lines(self, count):
+        """최근 count줄 텍스트 (조각 안의 줄바꿈도 줄로 셈)"""
+        if count <= 0:
+            return ""
+        parts = []
+        newlines = -self.separator.count("\n")  # 첫 조각 앞에는 구분자가 붙지 않음
+        for chunk in reversed(self._chunks):
+            parts.append(chunk)
+            newlines += chunk.count("\n") + self.separator.count("\n")
+            if newlines >= count:
+                break
+        return "\n".join(self.separator.join(reversed(parts)).split("\n")[-count:])
+
+    def tail_chars(self, count):
+        """최근 count글자 텍스트"""
+        if count <= 0:
+            return ""
+        parts = []
+        size = -len(self.separator)
+        for chunk in reversed(self._chunks):
+            parts.append(chunk)
+            size += len(chunk) + len(self.separator)
+            if size >= count:
+                break
+        return self.separator.join(reversed(parts))[-count:]
+
+    def drop_front(self, count):
+        """앞에서부터 count개 조각 제거 (인덱스는 남은 조각 기준으로 당겨짐)"""
+        if count <= 0:
+            return
+        removed = self._offsets[min(count, len(self._chunks))]
+        del self._chunks[:count]
+        self._offsets = [offset - removed for offset in self._offsets[count:]] or [0]
+        self._joined = None
+
+    def clear(self):
+        self._chunks.clear()
+        self._offsets = [0]
+        self._joined = None
@@ -0,0 +1,102 @@
+import re
+from collections import Counter
+
+# 기본 OCR 오류 교정 규칙: (이름, 패턴, 치환 문자열) - 대소문자 무시
+# 숫자 → 문자 규칙(0→O, 1→I, 5→S)과 rn→m 규칙은 "5 years", "1 year", "turn" 같은
+# 정상 텍스트를 망가뜨리므로 기본 규칙에서 제외
+DEFAULT_RULES = [
+    ('script_l', r'\bℓ\b', 'l'),
+    ('double_v', r'\bvv\b', 'w'),
+]
+
+# 통째로 지우는 문자 (번호 원문자, 도형 기호) - str.translate로 한 번에 제거
+DELETE_CHARS = '①②③④⑤⑥⑦⑧⑨⑩◆■□▲▼★☆'
+
+# 문장 끝 뒤에 붙어 나온 화자 태그 앞에서 줄바꿈 (e.g., "great! JT: I'm...")
+# 줄 맨 앞의 "John Smith:" 같은 여러 단어 이름은 나누지 않도록 문장부호 뒤에서만 적용
+SPEAKER_BREAK = r'(?<=[.!?])\s+(?=[A-Za-z]+:)'
+
+# 허용 문자 외 제거, 같은 글자 4번 이상 반복은 1개로
+JUNK_CHARS = r'[^\w\s가-힣.,!?:;()[\]{}"\'/-]'
+REPEATED_CHAR = r'(?P<_rep>[a-zA-Z가-힣])(?P=_rep){3,}'
+
+
+class CorrectionEngine:
+    """
+    OCR 텍스트 교정 엔진
+
+    모든 규칙을 생성 시 한 번만 컴파일하여 이름 있는 그룹의 단일 정규식으로
+    합치고, 삭제 문자는 변환 테이블로 처리한다. 프레임마다 텍스트를 한 번만 훑는다.
+    """
+
+    def __init__(self, rules=None, delete_chars=DELETE_CHARS):
+        """
+        Args:
+            rules (list): (이름, 패턴, 치환) 튜플 리스트, None이면 DEFAULT_RULES
+            delete_chars (str): 제거할 문자들
+        """
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.delete_table = str.maketrans('', '', delete_chars)
+        self.hits = Counter()
+
+        # 그룹 이름 → 치환 문자열
+        self._replacements = {'_break': '\n', '_junk': '', '_repeat': None}
+        alternatives = [f'(?P<_break>{SPEAKER_BREAK})']
+        for i, (name, pattern, replacement) in enumerate(self.rules):
+            group = f'r{i}'
+            re.compile(pattern)  # 잘못된 규칙은 여기서 바로 오류
+            alternatives.append(f'(?P<{group}>(?i:{pattern}))')
+            self._replacements[group] = replacement
+        alternatives.append(f'(?P<_junk>{JUNK_CHARS})')
+        alternatives.append(f'(?P<_repeat>{REPEATED_CHAR})')
+
+        self._group_names = {f'r{i}': name for i, (name, _, _) in enumerate(self.rules)}
+        self._group_names.update({'_break': 'speaker_break', '_junk': 'junk_char', '_repeat': 'repeated_char'})
+        self._pattern = re.compile('|'.join(alternatives))
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        설정으로 엔진 생성 (배포별 규칙)
+
+        settings['ocr']['corrections']: [[패턴, 치환], ...] 또는 [[이름, 패턴, 치환], ...]
+        settings['ocr']['use_default_corrections']: False면 기본 규칙 제외
+        """
+        ocr_settings = settings.get('ocr', {})
+        rules = list(DEFAULT_RULES) if ocr_settings.get('use_default_corrections', True) else []
+        for i, rule in enumerate(ocr_settings.get('corrections', [])):
+            if len(rule) == 2:
+                rules.append((f'custom_{i}', rule[0], rule[1]))
+            else:
+                rules.append(tuple(rule[:3]))
+        return cls(rules)
+
+    def apply(self, text):
+        """
+        교정 규칙을 한 번에 적용하고 줄 단위로 정리
+
+        Args:
+            text (str): 원본 텍스트
+
+        Returns:
+            str: 교정된 텍스트 (빈 줄 제거, 앞뒤 공백 제거)
+        """
+        if not text:
+            return ""
+
+        text = text.translate(self.delete_table)
+        text = self._pattern.sub(self._replace, text)
+
+        lines = (line.strip() for line in text.splitlines())
+        return "\n".join(line for line in lines if line)
+
+    def stats(self):
+        """규칙별 적용 횟수 반환"""
+        return dict(self.hits)
+
+    def _replace(self, match):
+        group = match.lastgroup
+        self.hits[self._group_names[group]] += 1
+        if group == '_repeat':
+            return match.group('_rep')
+        return self._replacements[group]
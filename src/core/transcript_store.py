@@ -0,0 +1,352 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+from src.core.overlap import normalize_line
+from src.core.segment_store import SegmentFile
+from src.core.text_buffer import ChunkedTextBuffer
+
+
+class RecentHashSet:
+    """최근에 추가한 max_size개 해시만 기억하는 집합 (다시 추가하면 최근으로 갱신, LRU)"""
+
+    def __init__(self, max_size):
+        self.max_size = max(1, max_size)
+        self._items = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, key):
+        if key in self._items:
+            self._items.move_to_end(key)
+        else:
+            self._items[key] = None
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+
+class TranscriptLine:
+    """전사 기록의 한 줄 (확정된 문장, 한 번 부여된 line_id는 바뀌지 않음)"""
+
+    __slots__ = ('line_id', 'text', 'speaker', 'timestamp')
+
+    def __init__(self, line_id, text, speaker=None, timestamp=None):
+        self.line_id = line_id
+        self.text = text
+        self.speaker = speaker
+        self.timestamp = timestamp  # 캡처 시각 (time.time())
+
+    def __repr__(self):
+        return f"TranscriptLine({self.line_id}, {self.text!r})"
+
+
+class TranscriptNote:
+    """전사 기록의 줄 구간 [start, end)에서 생성된 스크리닝 노트"""
+
+    __slots__ = ('note_id', 'start', 'end', 'category', 'text', 'start_time', 'end_time')
+
+    def __init__(self, note_id, start, end, category, text, start_time=None, end_time=None):
+        self.note_id = note_id
+        self.start = start
+        self.end = end
+        self.category = category
+        self.text = text
+        self.start_time = start_time
+        self.end_time = end_time
+
+    def __repr__(self):
+        return f"TranscriptNote({self.note_id}, lines {self.start}-{self.end}, {self.category!r})"
+
+
+class TranscriptView:
+    """
+    전사 기록 위의 읽기 위치 (요약 버퍼, 분석 대기 버퍼 등)
+
+    버퍼마다 문자열을 따로 이어 붙이지 않고, 같은 기록에서 자신이 아직 처리하지
+    않은 줄들(커서 이후)만 본다.
+    """
+
+    def __init__(self, store, position=0):
+        self.store = store
+        self.position = position
+
+    def __len__(self):
+        """커서 이후 텍스트 길이 (글자 수, 줄바꿈 포함)"""
+        return self.store.char_count(self.position)
+
+    def __bool__(self):
+        return self.position < len(self.store)
+
+    def lines(self):
+        return self.store.get_lines(self.position)
+
+    def text(self):
+        """커서 이후 텍스트"""
+        return self.store.span_text(self.position, len(self.store))
+
+    def take(self):
+        """커서 이후 텍스트를 반환하고 커서를 끝으로 이동"""
+        text = self.text()
+        self.clear()
+        return text
+
+    def clear(self):
+        """지금까지의 줄을 모두 처리한 것으로 표시"""
+        self.position = len(self.store)
+
+    def keep_last(self, count):
+        """최근 count줄만 남기고 커서 이동"""
+        self.position = max(self.position, len(self.store) - count)
+
+
+class TranscriptStore:
+    """
+    세션 전체의 추가 전용 전사 기록
+
+    확정된 문장마다 고정 ID를 부여하고, 화면에 나왔던 OCR 줄의 정규화 해시와
+    연속 n줄 블록 해시를 세션 전체에 걸쳐 색인한다. 리크루터가 채팅을 위로
+    스크롤해 예전 내용을 다시 보면 직전 프레임과는 겹치지 않아도 이 색인으로
+    O(1)에 알아보고 다시 추가하지 않는다.
+
+    줄마다 캡처 시각을 기록하고, 시각/노트 시작 줄을 정렬된 배열로 유지해
+    시간 구간 ↔ 줄 ↔ 노트를 이분 탐색(O(log n))으로 찾는다.
+
+    최근 hot_lines줄만 메모리에 두고, 그보다 오래된 줄은 추가 전용 세그먼트 파일로
+    옮긴다(spill). 줄 인덱스는 옮긴 뒤에도 그대로이며, 옮긴 줄은 메모리 맵으로 읽는다.
+    세션이 길어져도 메모리에는 줄별 오프셋/시각 배열만 늘어난다. 스크롤백 중복 색인도
+    최근 seen_window개 줄/블록 해시만 유지한다 (그보다 오래 전 화면으로 스크롤하면 다시
+    새 줄로 볼 수 있지만, 화면에 다시 보일 만큼 최근인 대화는 모두 덮는다).
+    """
+
+    def __init__(self, ngram_size=3, min_unique_line_chars=24, hot_lines=2000, spill_dir=None,
+                 seen_window=20000):
+        """
+        Args:
+            ngram_size (int): 블록 중복 판정에 쓰는 연속 줄 수
+            min_unique_line_chars (int): 이 길이 이상인 줄은 한 줄만 같아도 중복으로 본다
+                (짧은 줄 "Yes."/"Okay" 는 블록으로 겹칠 때만 중복)
+            hot_lines (int): 메모리에 유지할 최근 줄 수 (0이면 디스크로 옮기지 않음)
+            spill_dir (str): 세그먼트 파일 디렉터리 (None이면 시스템 임시 디렉터리)
+            seen_window (int): 스크롤백 중복 판정에 기억할 최근 줄/블록 해시 수
+        """
+        self.ngram_size = max(1, ngram_size)
+        self.min_unique_line_chars = min_unique_line_chars
+        self.hot_lines = hot_lines
+        self.spill_dir = spill_dir
+        self.segments = None  # 처음 옮길 때 생성
+        self.base = 0  # 세그먼트 파일로 옮긴 줄 수 (= lines[0]의 인덱스)
+        self.lines = []  # 메모리에 있는 최근 줄들
+        self.buffer = ChunkedTextBuffer("\n")  # 최근 줄 텍스트 (전체 문자열은 내보낼 때만 합침)
+        self._times = array('d')  # 줄별 캡처 시각 (단조 증가로 보정, 이분 탐색용)
+        self.notes = []
+        self._note_starts = []  # 노트별 시작 줄 (단조 증가, 이분 탐색용)
+        self._seen_lines = RecentHashSet(seen_window)
+        self._seen_blocks = RecentHashSet(seen_window)
+        self._recent = []  # 블록 해시용 최근 줄 해시
+        self.suppressed_lines = 0
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings['transcript'] 설정으로 생성"""
+        transcript_settings = settings.get('transcript', {})
+        return cls(
+            hot_lines=transcript_settings.get('hot_lines', 2000),
+            spill_dir=transcript_settings.get('spill_dir'),
+            seen_window=transcript_settings.get('seen_window', 20000),
+        )
+
+    def __len__(self):
+        return self.base + len(self.lines)
+
+    def append(self, text, speaker=None, timestamp=None):
+        """
+        확정된 줄 추가
+
+        Args:
+            timestamp (float): 캡처 시각 (없으면 현재 시각)
+
+        Returns:
+            TranscriptLine: 추가된 줄
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        line = TranscriptLine(len(self), text, speaker, timestamp)
+        self.lines.append(line)
+        self.buffer.append(text)
+        self._times.append(max(timestamp, self._times[-1]) if self._times else timestamp)
+        if self.hot_lines and len(self.lines) >= 2 * self.hot_lines:
+            self._spill(len(self.lines) - self.hot_lines)
+        return line
+
+    def append_text(self, text, timestamp=None):
+        """여러 줄 텍스트를 줄 단위로 추가"""
+        return [self.append(line.strip(), timestamp=timestamp) for line in text.splitlines() if line.strip()]
+
+    def line(self, index):
+        """index번째 줄 (디스크로 옮긴 줄은 화자 없이 다시 만듦)"""
+        if index >= self.base:
+            return self.lines[index - self.base]
+        return TranscriptLine(index, self.segments.line(index), None, self._times[index])
+
+    def get_lines(self, start=0, end=None):
+        """줄 구간 [start, end)의 TranscriptLine 리스트"""
+        end = len(self) if end is None else min(end, len(self))
+        return [self.line(index) for index in range(max(0, start), end)]
+
+    def text(self):
+        """전체 전사 텍스트 (긴 세션이면 iter_text()로 나눠 읽을 것)"""
+        if not self.base:
+            return self.buffer.text()
+        return "".join(self.iter_text())
+
+    def iter_text(self, start=0, end=None):
+        """
+        줄 구간 [start, end)의 텍스트를 조각으로 반환 (이어 붙이면 span_text와 같음)
+
+        디스크로 옮긴 구간은 세그먼트 파일에서 나눠 읽어 전체를 메모리에 올리지 않는다.
+        """
+        end = len(self) if end is None else max(0, min(end, len(self)))
+        start = max(0, min(start, end))
+        emitted = False
+        if start < self.base:
+            for chunk in self.segments.iter_text(start, min(end, self.base)):
+                emitted = True
+                yield chunk
+        if end > self.base:
+            if emitted:
+                yield "\n"
+            yield self.buffer.text(max(start, self.base) - self.base, end - self.base)
+
+    def view(self, from_start=False):
+        """
+        새 읽기 위치
+
+        Args:
+            from_start (bool): True면 처음부터, False면 지금 끝에서부터 읽음
+        """
+        return TranscriptView(self, 0 if from_start else len(self))
+
+    def span_text(self, start, end):
+        """줄 구간 [start, end)의 텍스트"""
+        if start >= self.base:
+            return self.buffer.text(start - self.base, max(0, end - self.base))
+        return "".join(self.iter_text(start, end))
+
+    def line_at(self, timestamp):
+        """해당 시각에 마지막으로 기록된 줄의 인덱스 (그 이전 줄이 없으면 None)"""
+        index = bisect_right(self._times, timestamp) - 1
+        return index if index >= 0 else None
+
+    def lines_between(self, start_time, end_time):
+        """시간 구간 [start_time, end_time]에 기록된 줄 구간 (start, end)"""
+        return bisect_left(self._times, start_time), bisect_right(self._times, end_time)
+
+    def add_note(self, start, end, category, text):
+        """
+        줄 구간 [start, end)에서 생성된 노트 기록
+
+        노트는 전사 순서대로 겹치지 않는 구간으로 추가한다 (요약 위치가 앞으로만 이동).
+        같은 구간을 다시 분석한 결과는 update_note()로 교체한다.
+
+        Returns:
+            TranscriptNote: 추가된 노트 (note_id는 notes의 인덱스)
+        """
+        start = max(0, min(start, len(self)))
+        end = max(start, min(end, len(self)))
+        note = TranscriptNote(
+            len(self.notes), start, end, category, text,
+            start_time=self._times[start] if start < end else None,
+            end_time=self._times[end - 1] if start < end else None,
+        )
+        self.notes.append(note)
+        self._note_starts.append(max(start, self._note_starts[-1]) if self._note_starts else start)
+        return note
+
+    def note_for_line(self, line_index):
+        """해당 줄을 출처로 하는 노트 (없으면 None)"""
+        position = bisect_right(self._note_starts, line_index) - 1
+        if position < 0:
+            return None
+        note = self.notes[position]
+        return note if note.start <= line_index < note.end else None
+
+    def update_note(self, note_id, category, text):
+        """재분석 결과로 노트 내용 교체 (출처 구간은 유지)"""
+        note = self.notes[note_id]
+        note.category = category
+        note.text = text
+        return note
+
+    def note_at(self, timestamp):
+        """해당 시각의 줄에서 생성된 노트 (없으면 None)"""
+        index = self.line_at(timestamp)
+        return self.note_for_line(index) if index is not None else None
+
+    def char_count(self, start=0):
+        """start번째 줄부터 끝까지의 텍스트 길이 (줄바꿈 포함)"""
+        if start >= self.base:
+            return self.buffer.char_count(start - self.base)
+        spilled = self.segments.char_count(start, self.base)
+        return spilled + (len(self.buffer) + 1 if self.buffer else 0)
+
+    def close(self):
+        """세그먼트 파일 정리"""
+        if self.segments is not None:
+            self.segments.close()
+
+    def _spill(self, count):
+        """가장 오래된 count줄을 세그먼트 파일로 옮김"""
+        if self.segments is None:
+            self.segments = SegmentFile(self.spill_dir)
+        self.segments.append([line.text for line in self.lines[:count]])
+        del self.lines[:count]
+        self.buffer.drop_front(count)
+        self.base += count
+        print(f"[Transcript] 오래된 {count}줄을 세그먼트 파일로 이동 (누적 {self.base}줄)")
+
+    def filter_seen_lines(self, lines):
+        """
+        이미 화면에 나왔던 OCR 줄 제거
+
+        길이가 충분한 줄은 한 줄 해시로, 짧은 줄은 연속 n줄 블록 해시로 판정한다.
+        입력 줄은 모두 색인에 기록된다.
+
+        Args:
+            lines (list): 프레임에서 새로 추출된 줄들
+
+        Returns:
+            list: 처음 보는 줄들 (순서 유지)
+        """
+        normalized = [normalize_line(line) for line in lines]
+        keys = [hash(text) for text in normalized]
+        seen = [
+            key in self._seen_lines and len(text) >= self.min_unique_line_chars
+            for key, text in zip(keys, normalized)
+        ]
+
+        n = self.ngram_size
+        history = self._recent + keys
+        offset = len(self._recent)
+        for start in range(len(history) - n + 1):
+            if hash(tuple(history[start:start + n])) in self._seen_blocks:
+                for i in range(max(start, offset), start + n):
+                    seen[i - offset] = True
+
+        # 색인 갱신 (중복으로 판정된 줄도 기록해 다음 스크롤에서 블록이 이어지도록)
+        for start in range(max(0, len(history) - n + 1 - len(keys)), len(history) - n + 1):
+            self._seen_blocks.add(hash(tuple(history[start:start + n])))
+        self._seen_lines.update(keys)
+        self._recent = history[-(n - 1):] if n > 1 else []
+
+        novel = [line for line, is_seen, text in zip(lines, seen, normalized) if not is_seen and text]
+        self.suppressed_lines += sum(1 for is_seen, text in zip(seen, normalized) if is_seen and text)
+        return novel
@@ -0,0 +1,131 @@
+import re
+import sys
+import time
+
+# "이름: 내용" 줄 (CaptureWidget.parse_speaker_text와 같은 형식)
+SPEAKER_LINE_PATTERN = re.compile(r'^([^:]+):\s*(.+)')
+
+
+class Utterance:
+    """화자 한 명의 연속된 발화 (요약 버퍼 청크 경계를 넘어 유지되는 최소 레코드)"""
+
+    __slots__ = ('uid', 'speaker_id', 'speaker', 'text', 'first_seen', 'is_interviewer', 'reply_to')
+
+    def __init__(self, uid, speaker_id, speaker, text, first_seen, is_interviewer, reply_to=None):
+        self.uid = uid
+        self.speaker_id = speaker_id
+        self.speaker = speaker
+        self.text = text
+        self.first_seen = first_seen
+        self.is_interviewer = is_interviewer
+        self.reply_to = reply_to  # 후보자 답변이면 직전 인터뷰어 질문 Utterance
+
+    def __repr__(self):
+        return f"Utterance({self.uid}, {self.speaker!r}, {self.text!r})"
+
+    def format(self):
+        role = "Interviewer" if self.is_interviewer else "Candidate"
+        return f"{self.speaker} ({role}): {self.text}"
+
+
+class SpeakerTurnParser:
+    """
+    증분 화자 턴 파서
+
+    요약 버퍼 청크를 받을 때마다 새 줄만 파싱하고, 마지막 화자와 마지막 인터뷰어
+    질문을 청크 사이에 유지한다. 화자 표시가 없는 줄은 직전 화자의 발화가 이어지는
+    것으로 보며, 후보자 답변은 직전 인터뷰어 질문과 연결되어 "Yes, absolutely" 같은
+    짧은 대답도 질문이 이전 청크에 있었을 때 문맥을 잃지 않는다.
+    """
+
+    def __init__(self, interviewer_name="Interviewer", default_speaker="Candidate"):
+        """
+        Args:
+            interviewer_name (str): 인터뷰어 이름
+            default_speaker (str): 첫 줄에 화자 표시가 없을 때의 화자
+        """
+        self.interviewer_name = interviewer_name
+        self.default_speaker = sys.intern(default_speaker)
+        self._speaker_ids = {}  # 소문자 이름 → speaker_id
+        self._last = None  # 마지막 발화
+        self._last_question = None  # 마지막 인터뷰어 발화
+        self._next_uid = 0
+
+    def set_interviewer_name(self, name):
+        self.interviewer_name = name
+
+    def feed(self, text, timestamp=None):
+        """
+        새 청크 파싱
+
+        Args:
+            text (str): "이름: 내용" 줄들로 된 텍스트
+            timestamp (float): 처음 본 시각 (None이면 현재 시각)
+
+        Returns:
+            list: 이 청크에서 새로 시작된 Utterance 리스트 (연속된 같은 화자 줄은 하나로 합침)
+        """
+        first_seen = time.time() if timestamp is None else timestamp
+        utterances = []
+
+        for line in text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            speaker_match = SPEAKER_LINE_PATTERN.match(line)
+            if speaker_match:
+                speaker = speaker_match.group(1).strip()
+                content = speaker_match.group(2).strip()
+            else:
+                # 화자 표시가 없으면 직전 화자의 발화가 이어지는 것으로 간주
+                speaker = self._last.speaker if self._last else self.default_speaker
+                content = line
+
+            # 이 청크 안에서 같은 화자가 이어 말하면 같은 발화로 합침
+            if utterances and utterances[-1].speaker.lower() == speaker.lower():
+                utterances[-1].text += " " + content
+                continue
+
+            utterances.append(self._start_utterance(speaker, content, first_seen))
+
+        return utterances
+
+    def format_for_ai(self, utterances):
+        """
+        AI 전달용 대화 텍스트
+
+        첫 후보자 답변이 이전 청크의 질문에 대한 것이면 그 질문을 앞에 붙인다.
+        """
+        lines = []
+        if utterances and not utterances[0].is_interviewer:
+            question = utterances[0].reply_to
+            if question is not None and question.uid not in {utterance.uid for utterance in utterances}:
+                lines.append(question.format())
+        lines.extend(utterance.format() for utterance in utterances)
+        return '\n'.join(lines)
+
+    def reset(self):
+        self._last = None
+        self._last_question = None
+
+    def _start_utterance(self, speaker, content, first_seen):
+        key = speaker.lower()
+        speaker_id = self._speaker_ids.setdefault(key, len(self._speaker_ids))
+        is_interviewer = key == self.interviewer_name.lower()
+
+        utterance = Utterance(
+            uid=self._next_uid,
+            speaker_id=speaker_id,
+            speaker=sys.intern(speaker),
+            text=content,
+            first_seen=first_seen,
+            is_interviewer=is_interviewer,
+            reply_to=None if is_interviewer else self._last_question,
+        )
+        self._next_uid += 1
+
+        if is_interviewer:
+            self._last_question = utterance
+        self._last = utterance
+        return utterance
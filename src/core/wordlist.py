@@ -0,0 +1,70 @@
+import os
+import threading
+
+# 기본 영어 단어 (기능어 + 대화/인터뷰에서 흔한 단어), 단어 목록 파일이 없을 때의 최소 사전
+COMMON_WORDS = """
+a about above after again all also always am an and any are around as ask asked at back be because
+been before being best better between both but by call came can could current currently day days
+did do does doing done down during each early else enough even ever every example feel few find
+first for from full get give go going good got great had has have having he her here him his how
+however i if in into is it its just know last later least let like little long look lot made make
+many may me mean might month months more most much must my need never new next no not now of off
+often old on once one only open or other our out over own part people per place plan please pretty
+previous probably question questions quite rather real really right role said same say see she
+should since so some something sometimes soon still such sure take team tell than thank thanks that
+the their them then there these they thing things think this those though through time to today too
+two under until up us use used very want was way we week weeks well were what when where whether
+which while who why will with within without work worked working would yeah year years yes yet you
+your absolutely definitely interview candidate position company experience salary
+""".split()
+
+# 사전 조회 전 떼어 보는 영어 어미
+SUFFIXES = ("'s", "n't", 'ing', 'ed', 'es', 's', 'ly', 'er')
+
+# wordlist_path를 지정하지 않았을 때 찾아보는 시스템 단어 목록 (Linux/macOS)
+SYSTEM_WORDLISTS = ('/usr/share/dict/words', '/usr/dict/words')
+
+_wordlists = {}
+_wordlists_lock = threading.Lock()
+
+
+def load_wordlist(path=None):
+    """
+    영어 단어 목록 로드 (한 줄에 한 단어, 경로별로 한 번만 읽음)
+
+    path가 없으면 시스템 단어 목록을 찾아보고, 읽을 파일이 없으면 COMMON_WORDS만 쓴다.
+    Windows에는 시스템 단어 목록이 없으므로 설정의 wordlist_path로 지정한다.
+
+    Args:
+        path (str): 단어 목록 파일 경로
+
+    Returns:
+        frozenset: 소문자 단어 집합 (COMMON_WORDS 포함)
+    """
+    if path is None:
+        path = next((candidate for candidate in SYSTEM_WORDLISTS if os.path.isfile(candidate)), None)
+    with _wordlists_lock:
+        if path not in _wordlists:
+            words = set(COMMON_WORDS)
+            if path:
+                try:
+                    with open(path, encoding='utf-8', errors='ignore') as f:
+                        words.update(line.strip().lower() for line in f if line.strip())
+                    print(f"[Wordlist] 단어 목록 로드: {path} ({len(words)}개)")
+                except OSError as e:
+                    print(f"[Wordlist] 단어 목록 로드 실패, 기본 단어만 사용: {e}")
+            _wordlists[path] = frozenset(words)
+        return _wordlists[path]
+
+
+def is_known_word(word, vocabulary):
+    """word가 vocabulary에 있는지 (영어 어미를 뗀 어간도 확인, word는 소문자)"""
+    word = word.strip("'-")
+    if word in vocabulary:
+        return True
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            stem = word[:-len(suffix)]
+            if stem in vocabulary or stem + 'e' in vocabulary:
+                return True
+    return False
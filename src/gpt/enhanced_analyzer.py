@@ -1,11 +1,11 @@
-import openai
 from datetime import datetime
-import os
-from dotenv import load_dotenv
 import json
 import re
 from typing import Dict, List, Optional, Tuple
 
+from src.gpt.llm_service import get_llm_service
+from src.gpt.token_budget import TRANSCRIPT_SLOT, TokenBudgeter
+
 class EnhancedInterviewAnalyzer:
     """향상된 인터뷰 분석기 - 모든 포지션에 대응 가능한 범용 분석"""
     
@@ -16,8 +16,9 @@ class EnhancedInterviewAnalyzer:
         self.temperature = settings['gpt'].get('temperature', 0.3)  # 일관성을 위해 낮춤
         self.max_tokens = settings['gpt'].get('max_tokens', 2000)  # 증가
         
-        load_dotenv()
-        self.client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.llm = get_llm_service(settings)
+        # 전사 텍스트를 단계별 토큰 예산에 맞추고 출력 한도를 응답 스키마로 정함
+        self.token_budget = TokenBudgeter.from_settings(settings, self.model)
         
         # 위치별 핵심 평가 영역 정의
         self.position_frameworks = {
@@ -39,7 +40,7 @@ From the interview transcript below, identify the candidate's name and extract t
 
 **Interview Transcript:**
 ---
-{interview_text}
+{TRANSCRIPT_SLOT}
 ---
 
 **Instructions:**
@@ -68,14 +69,11 @@ From the interview transcript below, identify the candidate's name and extract t
 """
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in accurately extracting candidate information from interview transcripts. Prioritize explicitly stated information, but include contextually clear inferences when available."},
-                    {"role": "user", "content": extraction_prompt}
-                ],
-                temperature=0.1,  # Low temperature for accuracy
-                max_tokens=1000
+            response = self._budgeted_completion('profile', [
+                {"role": "system", "content": "You are an expert in accurately extracting candidate information from interview transcripts. Prioritize explicitly stated information, but include contextually clear inferences when available."},
+                {"role": "user", "content": extraction_prompt}
+            ], interview_text,
+                temperature=0.1  # Low temperature for accuracy
             )
             
             result = response.choices[0].message.content
@@ -91,6 +89,22 @@ From the interview transcript below, identify the candidate's name and extract t
             print(f"[EnhancedAnalyzer] 후보자 정보 추출 실패: {e}")
             return self._extract_basic_info_fallback(interview_text)
     
+    def _budgeted_completion(self, step: str, messages: List[Dict], transcript: str, items: int = 0, **kwargs):
+        """
+        토큰 예산에 맞춘 chat completion 호출
+        
+        출력이 max_tokens에서 잘리면 (잘린 JSON은 파싱할 수 없으므로) 한도를 두 배로
+        (컨텍스트 창이 허용하는 만큼) 늘려 한 번 다시 호출한다.
+        """
+        messages, max_tokens, planned_tokens = self.token_budget.plan(step, messages, transcript, items=items)
+        response = self.llm.chat_completion(model=self.model, messages=messages, max_tokens=max_tokens, **kwargs)
+        if self.token_budget.record(step, planned_tokens, max_tokens, response):
+            max_tokens = min(max_tokens * 2, self.token_budget.context_tokens - planned_tokens - self.token_budget.safety_margin)
+            print(f"[EnhancedAnalyzer] {step}: 출력 한도 {max_tokens}로 다시 호출")
+            response = self.llm.chat_completion(model=self.model, messages=messages, max_tokens=max_tokens, **kwargs)
+            self.token_budget.record(step, planned_tokens, max_tokens, response)
+        return response
+    
     def _extract_basic_info_fallback(self, text: str) -> Dict:
         """기본 정보 추출 실패시 폴백 방법"""
         # 간단한 정규식으로 기본 정보 추출 시도
@@ -277,7 +291,7 @@ Yes, I'm comfortable with an onsite work structure. In terms of compensation, I'
 
 **Interview Transcript to Analyze:**
 ```
-{interview_text}
+{TRANSCRIPT_SLOT}
 ```
 
 **Evaluation Areas (Categories):**
@@ -341,14 +355,11 @@ Yes, I'm comfortable with an onsite work structure. In terms of compensation, I'
 """
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": f"You are a specialized {position_type} recruitment analyst. Your task is to produce a comprehensive candidate evaluation in a structured JSON format, based *only* on the candidate's statements in the provided transcript."},
-                    {"role": "user", "content": analysis_prompt}
-                ],
+            response = self._budgeted_completion('comprehensive', [
+                {"role": "system", "content": f"You are a specialized {position_type} recruitment analyst. Your task is to produce a comprehensive candidate evaluation in a structured JSON format, based *only* on the candidate's statements in the provided transcript."},
+                {"role": "user", "content": analysis_prompt}
+            ], interview_text, items=len(evaluation_areas),
                 temperature=0.2, # Lower temperature for consistency
-                max_tokens=self.max_tokens,
                 response_format={ "type": "json_object" } # Enforce JSON output
             )
             
@@ -408,7 +419,7 @@ Please improve the existing screening notes based on the complete interview tran
 {json.dumps(current_notes, indent=2, ensure_ascii=False)}
 
 【COMPLETE INTERVIEW TRANSCRIPT】
-{interview_text}
+{TRANSCRIPT_SLOT}
 
 【IMPROVEMENT OBJECTIVES】
 1. Add missing important information
@@ -443,14 +454,12 @@ Please provide improved notes in the following format:
 """
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a screening notes quality improvement specialist. Your goal is to identify missing information, clarify ambiguous expressions, and enhance overall completeness."},
-                    {"role": "user", "content": improvement_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=1500
+            # 기존 카테고리 + 새로 찾을 카테고리 몇 개
+            response = self._budgeted_completion('improve_notes', [
+                {"role": "system", "content": "You are a screening notes quality improvement specialist. Your goal is to identify missing information, clarify ambiguous expressions, and enhance overall completeness."},
+                {"role": "user", "content": improvement_prompt}
+            ], interview_text, items=len(current_notes or {}) + 2,
+                temperature=0.2
             )
             
             result = response.choices[0].message.content
@@ -0,0 +1,263 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _KeyState:
+    """키별 제출/전달 순번과 먼저 끝난 결과"""
+
+    __slots__ = ('submitted', 'delivered', 'finished')
+
+    def __init__(self):
+        self.submitted = 0
+        self.delivered = 0
+        self.finished = {}  # 순번 → (future, on_result, on_error)
+
+
+class LLMExecutor:
+    """
+    LLM 호출용 워커 스레드 풀
+
+    호출은 워커 스레드에서 실행되고 Future를 반환한다. 같은 key로 제출한 작업의
+    콜백은 완료 순서와 관계없이 제출 순서대로 호출된다 (예: 카테고리별 결과를
+    순서대로 적용). 콜백은 워커 스레드에서 호출되므로 UI 위젯은 콜백에서 Qt
+    시그널을 emit하여 UI 스레드로 결과를 넘긴다.
+    """
+
+    def __init__(self, max_workers=4):
+        """
+        Args:
+            max_workers (int): 동시에 실행할 호출 수
+        """
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="LLM")
+        self._lock = threading.Lock()
+        self._keys = {}
+
+    def submit(self, fn, *args, key=None, on_result=None, on_error=None, **kwargs):
+        """
+        호출 제출
+
+        Args:
+            fn (callable): 워커 스레드에서 실행할 함수
+            key (str): 순서 보장 키 (None이면 완료 즉시 콜백)
+            on_result (callable): on_result(result) - 성공 시 (워커 스레드)
+            on_error (callable): on_error(exception) - 실패 시 (워커 스레드)
+
+        Returns:
+            Future: 호출 결과
+        """
+        with self._lock:
+            if key is not None:
+                state = self._keys.setdefault(key, _KeyState())
+                sequence = state.submitted
+                state.submitted += 1
+            future = self._pool.submit(fn, *args, **kwargs)
+
+        if key is None:
+            future.add_done_callback(lambda done: self._deliver(done, on_result, on_error))
+        else:
+            future.add_done_callback(
+                lambda done: self._finish_in_order(key, sequence, done, on_result, on_error)
+            )
+        return future
+
+    def pending(self, key):
+        """key로 제출되어 아직 콜백이 호출되지 않은 작업 수"""
+        with self._lock:
+            state = self._keys.get(key)
+            return state.submitted - state.delivered if state else 0
+
+    def shutdown(self, wait=False):
+        self._pool.shutdown(wait=wait)
+
+    def _finish_in_order(self, key, sequence, future, on_result, on_error):
+        """앞선 작업이 모두 전달된 경우에만 전달 (락 안에서 전달해 순서 유지)"""
+        with self._lock:
+            state = self._keys[key]
+            state.finished[sequence] = (future, on_result, on_error)
+            while state.delivered in state.finished:
+                ready = state.finished.pop(state.delivered)
+                state.delivered += 1
+                self._deliver(*ready)
+            if state.delivered == state.submitted:
+                del self._keys[key]
+
+    @staticmethod
+    def _deliver(future, on_result, on_error):
+        if future.cancelled():
+            return
+        error = future.exception()
+        try:
+            if error is None:
+                if on_result:
+                    on_result(future.result())
+            elif on_error:
+                on_error(error)
+            else:
+                print(f"[LLMExecutor] 호출 실패: {error}")
+        except Exception as e:
+            print(f"[LLMExecutor] 결과 전달 실패: {e}")
+
+
+class _Stream:
+    """스트림의 실행 중 작업과 대기 작업 (작업 = (payload, identity, fn, on_result, on_error))"""
+
+    __slots__ = ('running', 'waiting')
+
+    def __init__(self):
+        self.running = None
+        self.waiting = None
+
+
+class CoalescingQueue:
+    """
+    스트림별 LLM 작업 큐 (병합/중복 제거/대체)
+
+    스트림마다 한 번에 하나의 호출만 실행한다. 실행 중에 들어온 작업은 대기 작업
+    하나로 병합되어 앞 호출이 끝나면 한 번에 실행되고, 병합된 이전 대기 작업은 새
+    작업에 흡수되어 따로 호출되지 않는다. 실행 중이거나 대기 중인 작업과 내용이 같은
+    작업은 버린다. LLM 응답보다 입력이 빨리 들어와도 호출 수가 늘지 않고 호출당
+    입력이 커진다.
+    """
+
+    def __init__(self, executor):
+        """
+        Args:
+            executor (LLMExecutor): 호출을 실행할 실행기
+        """
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._streams = {}
+        self.submitted = 0
+        self.calls = 0
+        self.merged = 0
+        self.duplicates = 0
+
+    def submit(self, stream, payload, fn, merge=None, identity=None, on_result=None, on_error=None):
+        """
+        작업 제출
+
+        Args:
+            stream (str): 스트림 이름 (스트림마다 한 번에 하나씩 실행)
+            payload: 작업 내용 (워커 스레드에서 fn(payload)로 호출)
+            fn (callable): 실행할 함수
+            merge (callable): merge(대기 payload, 새 payload) → 병합 payload
+                              (None이면 새 payload가 대기 작업을 대체)
+            identity (callable): 같은 작업 판별 값 identity(payload) (None이면 payload 자체)
+            on_result (callable): on_result(payload, result) - 성공 시 (워커 스레드)
+            on_error (callable): on_error(payload, exception) - 실패 시 (워커 스레드)
+
+        Returns:
+            str: 'started' (바로 실행), 'queued' (대기), 'merged' (대기 작업에 병합),
+                 'duplicate' (같은 작업이 실행/대기 중이라 버림)
+        """
+        identify = identity or (lambda value: value)
+        with self._lock:
+            self.submitted += 1
+            state = self._streams.setdefault(stream, _Stream())
+            key = identify(payload)
+            if any(job is not None and job[1] == key for job in (state.running, state.waiting)):
+                self.duplicates += 1
+                return 'duplicate'
+
+            if state.running is None:
+                state.running = (payload, key, fn, on_result, on_error)
+                status = 'started'
+            elif state.waiting is None:
+                state.waiting = (payload, key, fn, on_result, on_error)
+                return 'queued'
+            else:
+                # 앞선 대기 작업은 새 작업에 흡수되어 따로 실행하지 않음
+                if merge is not None:
+                    payload = merge(state.waiting[0], payload)
+                self.merged += 1
+                state.waiting = (payload, identify(payload), fn, on_result, on_error)
+                return 'merged'
+        self._start(stream, state.running)
+        return status
+
+    def busy(self, stream):
+        """스트림에 실행 중이거나 대기 중인 작업이 있는지"""
+        with self._lock:
+            state = self._streams.get(stream)
+            return state is not None and state.running is not None
+
+    def stats(self):
+        """제출 수, 실제 호출 수, 병합 수, 중복으로 버린 수"""
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'calls': self.calls,
+                'merged': self.merged,
+                'duplicates': self.duplicates,
+            }
+
+    def _start(self, stream, job):
+        payload, _, fn, on_result, on_error = job
+        with self._lock:
+            self.calls += 1
+        self.executor.submit(
+            fn, payload,
+            on_result=lambda result: self._finish(stream, job, on_result, result),
+            on_error=lambda error: self._finish(stream, job, on_error, error),
+        )
+
+    def _finish(self, stream, job, callback, value):
+        """결과 전달 후 대기 작업 실행"""
+        try:
+            if callback:
+                callback(job[0], value)
+            elif isinstance(value, Exception):
+                print(f"[LLMQueue] '{stream}' 호출 실패: {value}")
+        finally:
+            with self._lock:
+                state = self._streams[stream]
+                state.running, state.waiting = state.waiting, None
+                next_job = state.running
+                if next_job is None:
+                    del self._streams[stream]
+            if next_job is not None:
+                self._start(stream, next_job)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_llm_executor(settings):
+    """
+    공유 LLMExecutor 반환 (워커 수는 settings['gpt']['max_concurrency'])
+
+    Args:
+        settings (dict): 전체 설정
+
+    Returns:
+        LLMExecutor: 프로세스 전체에서 공유하는 실행기
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = LLMExecutor(settings.get('gpt', {}).get('max_concurrency', 4))
+    return _executor
+
+
+_queue = None
+
+
+def get_llm_queue(settings):
+    """
+    공유 CoalescingQueue 반환 (공유 LLMExecutor 위에서 실행)
+
+    Args:
+        settings (dict): 전체 설정
+
+    Returns:
+        CoalescingQueue: 프로세스 전체에서 공유하는 작업 큐
+    """
+    global _queue
+    if _queue is None:
+        executor = get_llm_executor(settings)
+        with _executor_lock:
+            if _queue is None:
+                _queue = CoalescingQueue(executor)
+    return _queue
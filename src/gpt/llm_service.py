@@ -0,0 +1,173 @@
+import os
+import threading
+import time
+
+import httpx
+import openai
+from dotenv import load_dotenv
+from openai.types.chat import ChatCompletion
+
+from src.gpt.response_cache import ResponseCache, request_key
+
+
+def cached_tokens(usage):
+    """응답 usage에서 서버 프롬프트 캐시가 적용된 입력 토큰 수 (정보가 없으면 0)"""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    return (getattr(details, 'cached_tokens', None) or 0) if details is not None else 0
+
+
+class LLMService:
+    """
+    프로세스 전체에서 공유하는 LLM 호출 서비스
+
+    OpenAI 클라이언트 하나(keep-alive HTTP 연결 풀 하나)와 동시 호출 수 제한,
+    공통 설정을 가진다. 요약기/분석기/위젯의 모든 chat completions 호출은
+    chat_completion()을 거치므로 연결이 재사용되고 호출 통계를 한곳에서 집계한다.
+
+    온도가 cache_max_temperature 이하인 (결과가 거의 결정적인) 호출은 디스크
+    응답 캐시를 먼저 확인하므로, 같은 대화를 다시 분석해도 비용이 들지 않는다.
+    """
+
+    def __init__(self, settings):
+        """
+        Args:
+            settings (dict): 전체 설정 (settings['gpt'] 사용)
+        """
+        gpt_settings = settings.get('gpt', {})
+        self.model = gpt_settings.get('model', 'gpt-3.5-turbo')
+        self.max_concurrency = max(1, gpt_settings.get('max_concurrency', 4))
+        self.timeout = gpt_settings.get('timeout', 60)
+
+        load_dotenv()
+        max_connections = gpt_settings.get('max_connections', self.max_concurrency * 2)
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=gpt_settings.get('keepalive_expiry', 60),
+            ),
+            timeout=self.timeout,
+        )
+        self.client = openai.OpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            http_client=self.http_client,
+            max_retries=gpt_settings.get('max_retries', 2),
+        )
+        self.cache = ResponseCache.from_settings(settings)
+        self.cache_max_temperature = gpt_settings.get('cache', {}).get('max_temperature', 0.3)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0  # 서버 프롬프트 접두사 캐시가 적용된 입력 토큰
+        self.completion_tokens = 0
+
+    def chat_completion(self, messages, model=None, temperature=None, max_tokens=None,
+                        use_cache=True, **kwargs):
+        """
+        chat completions 호출 (동시 호출 수 제한, 낮은 온도 호출은 응답 캐시 사용)
+
+        Args:
+            messages (list): 메시지 리스트
+            model (str): 모델 (None이면 설정 모델)
+            temperature (float): 생성 온도 (None이면 생략)
+            max_tokens (int): 최대 토큰 수 (None이면 생략)
+            use_cache (bool): False면 캐시를 확인하지 않고 새로 호출 (재분석 등)
+            **kwargs: response_format 등 그대로 전달할 인자
+
+        Returns:
+            ChatCompletion: OpenAI 응답
+        """
+        request = dict(kwargs, model=model or self.model, messages=messages)
+        if temperature is not None:
+            request['temperature'] = temperature
+        if max_tokens is not None:
+            request['max_tokens'] = max_tokens
+
+        cache_key = None
+        if (self.cache is not None and not request.get('stream')
+                and request.get('temperature', 1.0) <= self.cache_max_temperature):
+            cache_key = request_key(request)
+            if use_cache:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return ChatCompletion.model_validate_json(cached)
+
+        with self._semaphore:
+            started = time.monotonic()
+            try:
+                response = self.client.chat.completions.create(**request)
+            except Exception:
+                with self._stats_lock:
+                    self.errors += 1
+                raise
+            latency = time.monotonic() - started
+
+        usage = getattr(response, 'usage', None)
+        with self._stats_lock:
+            self.calls += 1
+            self.total_latency += latency
+            if usage is not None:
+                self.prompt_tokens += usage.prompt_tokens or 0
+                self.cached_prompt_tokens += cached_tokens(usage)
+                self.completion_tokens += usage.completion_tokens or 0
+
+        # max_tokens에서 잘린 응답은 저장하지 않음 (잘린 결과를 다시 쓰면 재시도가 소용없음)
+        choices = getattr(response, 'choices', None) or []
+        if cache_key is not None and not (choices and choices[0].finish_reason == 'length'):
+            try:
+                self.cache.put(
+                    cache_key, request['model'], response.model_dump_json(),
+                    prompt_tokens=usage.prompt_tokens if usage else 0,
+                    completion_tokens=usage.completion_tokens if usage else 0,
+                )
+            except Exception as e:
+                print(f"[LLMService] 응답 캐시 저장 실패: {e}")
+        return response
+
+    def stats(self):
+        """호출 수, 실패 수, 평균 지연(초), 토큰 사용량 (캐시된/캐시되지 않은 입력 토큰), 응답 캐시 통계"""
+        with self._stats_lock:
+            stats = {
+                'calls': self.calls,
+                'errors': self.errors,
+                'avg_latency': self.total_latency / self.calls if self.calls else 0.0,
+                'prompt_tokens': self.prompt_tokens,
+                'cached_prompt_tokens': self.cached_prompt_tokens,
+                'uncached_prompt_tokens': self.prompt_tokens - self.cached_prompt_tokens,
+                'prompt_cache_rate': self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0,
+                'completion_tokens': self.completion_tokens,
+            }
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+    def close(self):
+        """연결 풀과 응답 캐시 정리"""
+        self.http_client.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_llm_service(settings):
+    """
+    공유 LLMService 반환 (처음 호출할 때의 설정으로 한 번만 생성)
+
+    Args:
+        settings (dict): 전체 설정
+
+    Returns:
+        LLMService: 프로세스 전체에서 공유하는 서비스
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = LLMService(settings)
+    return _service
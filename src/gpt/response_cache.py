@@ -0,0 +1,162 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+# 모델별 토큰 단가 (USD / 100만 토큰: 입력, 출력) - 절약 금액 추정용
+MODEL_PRICES = {
+    'gpt-3.5-turbo': (0.50, 1.50),
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4-turbo': (10.00, 30.00),
+    'gpt-4': (30.00, 60.00),
+}
+
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    """토큰 사용량의 추정 비용 (USD, 단가를 모르는 모델은 0)"""
+    prices = MODEL_PRICES.get(model)
+    if prices is None:
+        # 날짜가 붙은 스냅샷 이름 (gpt-4o-2024-08-06 등)
+        prices = next((value for name, value in sorted(MODEL_PRICES.items(), key=lambda item: -len(item[0]))
+                       if model.startswith(name)), (0.0, 0.0))
+    return (prompt_tokens * prices[0] + completion_tokens * prices[1]) / 1_000_000
+
+
+def request_key(request):
+    """(model, messages, temperature, response_format, max_tokens) 해시"""
+    payload = {
+        'model': request.get('model'),
+        'messages': request.get('messages'),
+        'temperature': request.get('temperature'),
+        'response_format': request.get('response_format'),
+        'max_tokens': request.get('max_tokens'),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResponseCache:
+    """
+    디스크 기반 LLM 응답 캐시 (SQLite)
+
+    응답 JSON을 압축해 저장하고, 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지
+    않은 항목부터 지운다(LRU). ttl_seconds가 지난 항목은 사용하지 않는다.
+    적중 시 원래 호출의 토큰 사용량으로 절약한 금액을 추정한다.
+    """
+
+    def __init__(self, path, max_bytes=50 * 1024 * 1024, ttl_seconds=7 * 24 * 3600):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+            max_bytes (int): 저장할 응답의 최대 총 크기 (압축 후)
+            ttl_seconds (float): 항목 유효 기간 (초)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, model TEXT, value BLOB, size INTEGER,"
+            " created REAL, accessed REAL, prompt_tokens INTEGER, completion_tokens INTEGER)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_usd = 0.0
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings['gpt']['cache'] 설정으로 생성 (비활성화면 None)"""
+        cache_settings = settings.get('gpt', {}).get('cache', {})
+        if not cache_settings.get('enabled', True):
+            return None
+        return cls(
+            cache_settings.get('path', 'config/llm_cache.sqlite'),
+            max_bytes=cache_settings.get('max_bytes', 50 * 1024 * 1024),
+            ttl_seconds=cache_settings.get('ttl_seconds', 7 * 24 * 3600),
+        )
+
+    def get(self, key):
+        """
+        캐시된 응답 JSON (없거나 만료되었으면 None)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT model, value, created, prompt_tokens, completion_tokens FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl_seconds:
+                if row is not None:
+                    self._delete(key)
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            model, value, _, prompt_tokens, completion_tokens = row
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            self.saved_usd += estimate_cost(model, prompt_tokens, completion_tokens)
+        return zlib.decompress(value).decode('utf-8')
+
+    def put(self, key, model, response_json, prompt_tokens=0, completion_tokens=0):
+        """응답 JSON 저장 후 크기 제한을 넘으면 LRU 항목 제거"""
+        value = zlib.compress(response_json.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._delete(key)
+            self._conn.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, model, value, len(value), now, now, prompt_tokens, completion_tokens)
+            )
+            self._total_bytes += len(value)
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        """적중/실패 수, 적중률, 추정 절약 금액, 저장 크기"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'saved_usd': round(self.saved_usd, 4),
+            'bytes': self._total_bytes,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, key):
+        row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+
+    def _evict(self):
+        """총 크기가 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 제거"""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT 32"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    return
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
@@ -1,10 +1,16 @@
-import openai
 from datetime import datetime
-import os
-from dotenv import load_dotenv
 import json
 from typing import Optional, Dict
 
+from src.gpt.llm_service import get_llm_service
+from src.gpt.token_budget import TokenBudgeter
+from src.gpt.prompts import (
+    INCREMENTAL_CONTENT, INCREMENTAL_GUIDELINE, INCREMENTAL_SYSTEM_PROMPT,
+    QUICK_CATEGORIZE_GUIDELINE, QUICK_CATEGORIZE_SYSTEM_PROMPT, QUICK_CATEGORIZE_TEXT,
+    SPEAKER_NOTE_CONVERSATION, SPEAKER_NOTE_GUIDELINE, SPEAKER_NOTE_SYSTEM_PROMPT,
+    static_prefix_messages,
+)
+
 class GPTSummarizer:
     """GPT 기반 텍스트 요약 클래스"""
     
@@ -20,9 +26,9 @@ class GPTSummarizer:
         self.temperature = settings['gpt']['temperature']
         self.max_tokens = settings['gpt']['max_tokens']
         
-        # OpenAI API 키 로드
-        load_dotenv()
-        self.client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # 공유 LLM 서비스 (클라이언트/연결 풀/동시 호출 제한을 프로세스 전체에서 공유)
+        self.llm = get_llm_service(settings)
+        self.token_budget = TokenBudgeter.from_settings(settings, self.model)
         
         # Enhanced Analyzer 초기화
         try:
@@ -63,7 +69,7 @@ class GPTSummarizer:
 단순한 업무 나열을 피하고, 경력 이동과 직무에 대한 관심 이면에 있는 *이유*를 파악해 주세요."""
 
             # GPT API 호출
-            response = self.client.chat.completions.create(
+            response = self.llm.chat_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 채용 관리자를 위해 후보자 프로필에 대한 통찰력 있고 사람이 읽기 쉬운 요약 보고서를 작성하는 전문 HR 분석가입니다."},
@@ -166,80 +172,14 @@ class GPTSummarizer:
             if not new_text.strip():
                 return {"summary": "새로운 내용이 없습니다.", "key_points": []}
             
-            # 커스텀 가이드라인 기반 프롬프트
-            custom_prompt = f"""
-The following is newly mentioned content from an interview:
-
-{new_text}
-
-📘 **Please organize according to Screening Note Summary Guideline v2.0:**
-
-**🎯 Select only relevant categories from the 9 core categories:**
-1. **Work Experience**: Total years of experience, job titles, company names, relevant industry
-2. **Technical Skills**: Systems, platforms, tools, certifications, real-world usage
-3. **Project/Achievements**: Specific projects led/participated in, problems solved, outcomes achieved
-4. **Industry Expertise**: Industry or product domain familiarity
-5. **Global/Cultural Exposure**: Cross-country/regional collaboration, Korean or multinational team experience
-6. **Job Motivation/Fit**: Interest in company/position, career alignment
-7. **Relocation/Work Mode**: Current location, relocation willingness, onsite/remote preference
-8. **Availability**: Current employment status, possible start date
-9. **Compensation**: Previous compensation, salary expectations, bonus information
-
-**📝 Few-Shot Learning Examples:**
-
-**Example 1:**
-Input: "I have been working at Johnson & Johnson for 13 years in payroll management and HR systems."
-Output: {{"category": "Work Experience", "note": "13+ years of payroll management and HR systems experience at Johnson & Johnson."}}
-
-**Example 2:**
-Input: "I'm experienced with SAP SuccessFactors, Workday, and I have certifications in Project Management."
-Output: {{"category": "Technical Skills", "note": "Hands-on with SAP SuccessFactors and Workday; certified in Project Management."}}
-
-**Example 3:**
-Input: "I led a major integration project that reduced processing time by 30% and solved data mapping issues."
-Output: {{"category": "Project/Achievements", "note": "Led integration project reducing processing time by 30% and resolving data mapping issues."}}
-
-**Example 4:**
-Input: "I work with teams from LATAM, EMEA, and APAC. I'm comfortable with Korean leadership."
-Output: {{"category": "Global/Cultural Exposure", "note": "Collaborated with LATAM, EMEA, and APAC teams; comfortable working with Korean leadership."}}
-
-**Example 5:**
-Input: "My last salary was $53.26 per hour. I'm looking for around $120K base salary."
-Output: {{"category": "Compensation", "note": "Last comp: $53.26/hour; targeting $120K base salary."}}
-
-**📋 Sentence Construction Principles:**
-- Be specific (avoid vague terms without context)
-- Include numeric values whenever possible (years, salary, team size, etc.)
-- Avoid repeating the same content
-- Do not abbreviate key technical terms (e.g., always write "SAP SuccessFactors" in full)
-- One sentence per key idea
-
-**If the content is not important or not applicable, respond with "Not Applicable".**
-
-Please respond in JSON format:
-{{
-    "category": "Category name (one of the 9 above, or 'Not Applicable')",
-    "note": "One sentence summary following guidelines (empty string if not applicable)",
-    "summary": "Complete screening note"
-}}
-"""
-            
-            response = self.client.chat.completions.create(
+            # 커스텀 가이드라인 기반 프롬프트 (고정 가이드라인이 앞, 새 내용은 마지막 메시지)
+            response = self.llm.chat_completion(
                 model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": """You are a professional Screening Note specialist trained on Screening Note Summary Guideline v2.0 for English interviews. 
-
-Your expertise:
-- Creating structured, specific, and numeric-rich summaries in professional English
-- Following exact sentence construction principles for enterprise recruitment
-- Using recommended templates for consistency across all candidates
-- Avoiding vague or abstract language in favor of concrete details
-- Ensuring technical terms are accurate and complete (no abbreviations)
-- Focusing on English interview context and North American business standards
-
-You MUST follow the provided guidelines exactly and produce professional-quality screening notes that meet enterprise recruitment standards for English-speaking candidates."""},
-                    {"role": "user", "content": custom_prompt}
-                ],
+                messages=static_prefix_messages(
+                    INCREMENTAL_SYSTEM_PROMPT,
+                    INCREMENTAL_GUIDELINE,
+                    INCREMENTAL_CONTENT.format(new_text=new_text),
+                ),
                 max_tokens=800,
                 temperature=0.1  # 매우 일관성 있는 결과
             )
@@ -266,103 +206,22 @@ You MUST follow the provided guidelines exactly and produce professional-quality
                 "summary": "Unable to process content."
             } 
 
-    def generate_screening_note_with_speaker(self, conversation_text, interviewer_name):
-        """화자 구분이 포함된 대화에서 스크리닝 노트 생성"""
+    def generate_screening_note_with_speaker(self, conversation_text, interviewer_name, use_cache=True):
+        """화자 구분이 포함된 대화에서 스크리닝 노트 생성 (use_cache=False면 응답 캐시를 건너뜀)"""
         try:
-            # 화자 구분 기반 프롬프트
-            speaker_aware_prompt = f"""
-The following is a conversation from an English interview where "{interviewer_name}" is the interviewer:
-
-{conversation_text}
-
-📘 **Please organize according to Screening Note Summary Guideline v2.0:**
-
-**🚨 CRITICAL INSTRUCTION: Only extract information from CANDIDATE responses. 
-Interviewer statements provide context but should NEVER be included in the candidate's background/experience.**
-
-**🎯 Select only relevant categories from the 9 core categories:**
-1. **Work Experience**: Total years of experience, job titles, company names, relevant industry
-2. **Technical Skills**: Systems, platforms, tools, certifications, real-world usage
-3. **Project/Achievements**: Specific projects led/participated in, problems solved, outcomes achieved
-4. **Industry Expertise**: Industry or product domain familiarity
-5. **Global/Cultural Exposure**: Cross-country/regional collaboration, Korean or multinational team experience
-6. **Job Motivation/Fit**: Interest in company/position, career alignment
-7. **Relocation/Work Mode**: Current location, relocation willingness, onsite/remote preference
-8. **Availability**: Current employment status, possible start date
-9. **Compensation**: Previous compensation, salary expectations, bonus information
-
-**📝 Few-Shot Learning Examples:**
-
-**Example 1:**
-Conversation:
-{interviewer_name}: Tell me about your experience with payroll systems.
-Candidate: I have been working at Johnson & Johnson for 13 years in payroll management and HR systems.
-
-Output: {{"category": "Work Experience", "note": "13+ years of payroll management and HR systems experience at Johnson & Johnson."}}
-
-**Example 2:**
-Conversation:
-{interviewer_name}: What tools have you worked with?
-Candidate: I'm experienced with SAP SuccessFactors, Workday, and I have certifications in Project Management.
-
-Output: {{"category": "Technical Skills", "note": "Hands-on with SAP SuccessFactors and Workday; certified in Project Management."}}
-
-**Example 3: Short Answer with Context**
-Conversation:
-{interviewer_name}: Are you open to relocate?
-Candidate: Yes, absolutely
-
-Output: {{"category": "Relocation/Work Mode", "note": "Willing to relocate based on interviewer question about relocation openness."}}
-
-**Example 4: Multiple Short Answers**
-Conversation:
-{interviewer_name}: Are you comfortable with onsite work?
-Candidate: Yes, definitely
-{interviewer_name}: What about overtime when needed?
-Candidate: No problem, I understand the demands
-
-Output: {{"category": "Relocation/Work Mode", "note": "Comfortable with onsite work and overtime when needed."}}
-
-**📋 Sentence Construction Principles:**
-- Extract ONLY from candidate responses, never from interviewer statements
-- For short answers (Yes/No), ALWAYS use interviewer's question as context to explain what the answer refers to
-- Be specific (avoid vague terms without context) 
-- Include numeric values whenever possible (years, salary, team size, etc.)
-- Avoid repeating the same content
-- Do not abbreviate key technical terms (e.g., always write "SAP SuccessFactors" in full)
-- One sentence per key idea
-- When candidate gives brief responses, interpret them in context of interviewer's question
-
-**If the candidate content is not important or not applicable, respond with "Not Applicable".**
-
-Please respond in JSON format:
-{{
-    "category": "Category name (one of the 9 above, or 'Not Applicable')",
-    "note": "One sentence summary following guidelines (empty string if not applicable)",
-    "summary": "Complete screening note"
-}}
-"""
-            
-            response = self.client.chat.completions.create(
+            # 화자 구분 기반 프롬프트 (면접관 이름과 대화는 마지막 메시지에만 넣어 앞부분을 고정)
+            response = self.llm.chat_completion(
                 model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": f"""You are a professional Screening Note specialist trained on Screening Note Summary Guideline v2.0 for English interviews with speaker differentiation.
-
-Your expertise:
-- Analyzing interview conversations between interviewer ({interviewer_name}) and candidate
-- Creating structured summaries ONLY from candidate responses
-- Completely ignoring interviewer statements when building candidate profiles
-- **CONTEXT INTERPRETATION**: When candidates give short answers (Yes/No/brief responses), use interviewer's question as context to understand what the answer means
-- Following exact sentence construction principles for enterprise recruitment
-- Using recommended templates for consistency across all candidates
-- Ensuring technical terms are accurate and complete (no abbreviations)
-- Focusing on English interview context and North American business standards
-
-CRITICAL RULE: You MUST distinguish between interviewer and candidate statements. NEVER include interviewer's background, experience, or statements as part of the candidate's profile. However, USE interviewer questions as context to interpret candidate's short answers."""},
-                    {"role": "user", "content": speaker_aware_prompt}
-                ],
+                messages=static_prefix_messages(
+                    SPEAKER_NOTE_SYSTEM_PROMPT,
+                    SPEAKER_NOTE_GUIDELINE,
+                    SPEAKER_NOTE_CONVERSATION.format(
+                        interviewer_name=interviewer_name, conversation_text=conversation_text
+                    ),
+                ),
                 max_tokens=800,
-                temperature=0.1  # 매우 일관성 있는 결과
+                temperature=0.1,  # 매우 일관성 있는 결과
+                use_cache=use_cache
             )
             
             result = response.choices[0].message.content.strip()
@@ -540,8 +399,9 @@ CRITICAL RULE: You MUST distinguish between interviewer and candidate statements
     def _fallback_analysis(self, interview_script: str, template: dict, screening_data: dict) -> dict:
         """Basic analysis when Enhanced Analyzer fails"""
         try:
-            # Perform basic summary
-            basic_summary = self.summarize(interview_script[:2000])  # Length limit
+            # Perform basic summary (앞/뒤 부분을 남기고 토큰 예산에 맞춤)
+            fallback_tokens = self.token_budget.step_budgets.get('fallback', 1500)
+            basic_summary = self.summarize(self.token_budget.fit(interview_script, fallback_tokens))
             
             return {
                 "type": "basic_analysis",
@@ -646,50 +506,14 @@ CRITICAL RULE: You MUST distinguish between interviewer and candidate statements
         try:
             print(f"[GPTSummarizer] ⚡ 빠른 카테고리 분석 시작 (텍스트 길이: {len(text)}자)")
             
-            # 카테고리 목록을 문자열로 변환
-            categories_str = ", ".join(categories)
-            
-            # 영어 전용 분류 프롬프트
-            quick_prompt = f"""Please categorize the following interview text into the most appropriate category based on the definitions below and provide a brief summary in ENGLISH ONLY.
-
-**--- CATEGORY DEFINITIONS ---**
-
-*   **`Expertise`**: Core professional skills, specific accomplishments, and direct job-related experiences. (e.g., "Managed payroll for 500 employees," "Developed a new sales pipeline.")
-*   **`Industry/Product/Technical Familiarity`**: Knowledge of the specific industry, markets, products, or technologies. (e.g., "Familiar with the automotive sector," "Experience with SAP and Workday.")
-*   **`Leadership/Cultural Fit`**: Leadership style, team collaboration, and adaptability to the work environment. (e.g., "Led a team of 5 engineers," "Comfortable in a fast-paced startup.")
-*   **`Motivation/Reason for Interest`**: Why the candidate is seeking a new role and their interest in this specific company. (e.g., "Seeking more growth opportunities," "Attracted to the company's mission.")
-*   **`Logistics`**: Practical details like salary, location, and availability. (e.g., "Looking for $120K base," "Can start in 2 weeks.")
-
-**--- INTERVIEW TEXT ---**
-{text}
-
-**--- RESPONSE FORMAT (JSON) ---**
-Response in JSON format (ALL TEXT MUST BE IN ENGLISH):
-{{
-    "Category_Name": {{
-        "assessment": ["Summary point 1 in English", "Summary point 2 in English"]
-    }}
-}}
-
-**--- CRITICAL REQUIREMENTS ---**
-- **Adhere strictly to the category definitions above.**
-- **ALL output text must be in English only.**
-- **CAPTURE BOTH OBJECTIVE FACTS AND SUBJECTIVE EXPRESSIONS** (emotions, motivations, values, thoughts).
-- **USE RESUME-STYLE BULLET POINTS**: Start directly with action verbs, NO SUBJECTS (he/she/candidate).
-    - ✅ Good: "Manages HR operations for 700+ employees."
-    - ✅ Good: "Expresses passion for the automotive industry."
-    - ❌ Avoid: "He manages HR operations..."
-- **IF NO CONCRETE INFORMATION EXISTS FOR A CATEGORY, SIMPLY SKIP THAT CATEGORY.**
-- Use specific numbers when mentioned (e.g., "3-year" instead of "multi-year").
-- Keep summaries concise and action-oriented.
-"""
-            
-            response = self.client.chat.completions.create(
+            # 영어 전용 분류 프롬프트 (고정 카테고리 정의가 앞, 인터뷰 텍스트는 마지막 메시지)
+            response = self.llm.chat_completion(
                 model="gpt-3.5-turbo",  # 빠른 모델 사용
-                messages=[
-                    {"role": "system", "content": "You are a professional interview content categorizer. You MUST respond ONLY in English. Analyze and categorize interview content accurately and concisely in English only."},
-                    {"role": "user", "content": quick_prompt}
-                ],
+                messages=static_prefix_messages(
+                    QUICK_CATEGORIZE_SYSTEM_PROMPT,
+                    QUICK_CATEGORIZE_GUIDELINE,
+                    QUICK_CATEGORIZE_TEXT.format(text=text),
+                ),
                 temperature=0.1,
                 max_tokens=800,
                 response_format={ "type": "json_object" }
@@ -0,0 +1,209 @@
+import math
+import re
+
+try:
+    import tiktoken
+except ImportError:  # 설치되지 않았으면 UTF-8 바이트 수로 토큰 수 추정
+    tiktoken = None
+
+# 프롬프트에서 전사 텍스트가 들어갈 자리 (plan()이 예산에 맞춘 전사로 바꿈)
+TRANSCRIPT_SLOT = "\x00TRANSCRIPT\x00"
+
+# 모델별 컨텍스트 창 크기 (토큰)
+MODEL_CONTEXT_TOKENS = {
+    'gpt-3.5-turbo': 16385,
+    'gpt-4o-mini': 128000,
+    'gpt-4o': 128000,
+    'gpt-4-turbo': 128000,
+    'gpt-4': 8192,
+}
+
+# 단계별 예상 출력 크기 (토큰): 고정 필드 + 반복 항목(카테고리 등)당 크기
+OUTPUT_BUDGETS = {
+    'profile': {'base': 800, 'per_item': 0},  # 14개 필드 JSON (자유 서술 필드와 key_skills 목록 포함, 여유분 포함)
+    'comprehensive': {'base': 700, 'per_item': 260},  # 요약/강점/우려/추천 + 평가 영역별 bullet 5개 안팎
+    'improve_notes': {'base': 350, 'per_item': 220},  # 전체 평가 + 카테고리별 original/improved/additions/rationale
+}
+
+_SPACES = re.compile(r"[ \t\f\v]+")
+
+
+class TokenBudgeter:
+    """
+    LLM 호출 전 토큰 예산 계산기
+
+    프롬프트 토큰을 로컬에서 세고(tiktoken이 없으면 추정), 전사 텍스트를 단계별 예산과
+    컨텍스트 창에 맞게 압축/절단한다. 출력 한도(max_tokens)는 단계의 응답 스키마 크기로
+    정하고, 호출 후 계획한 토큰과 실제 사용량을 함께 기록한다.
+    """
+
+    def __init__(self, model, context_tokens=None, step_budgets=None, safety_margin=256):
+        """
+        Args:
+            model (str): 모델 이름 (토크나이저와 컨텍스트 창 크기 결정)
+            context_tokens (int): 컨텍스트 창 크기 (None이면 모델 기본값)
+            step_budgets (dict): 단계별 전사 텍스트 최대 토큰 수
+            safety_margin (int): 토큰 수 오차에 대비해 남겨 둘 토큰 수
+        """
+        self.model = model
+        self.context_tokens = context_tokens or self._model_context_tokens(model)
+        self.step_budgets = dict(step_budgets or {})
+        self.safety_margin = safety_margin
+        self._encoding = self._load_encoding(model)
+
+    @classmethod
+    def from_settings(cls, settings, model=None):
+        """settings['gpt']['token_budget'] 설정으로 생성"""
+        gpt_settings = settings.get('gpt', {})
+        budget_settings = gpt_settings.get('token_budget', {})
+        return cls(
+            model or gpt_settings.get('model', 'gpt-3.5-turbo'),
+            context_tokens=budget_settings.get('context_tokens'),
+            step_budgets=budget_settings.get('steps', {}),
+            safety_margin=budget_settings.get('safety_margin', 256),
+        )
+
+    @property
+    def exact(self):
+        """토큰 수를 토크나이저로 세는지 (False면 추정)"""
+        return self._encoding is not None
+
+    def count(self, text):
+        """텍스트의 토큰 수"""
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        # 영문은 약 4바이트, 한글(3바이트)은 약 1토큰이므로 UTF-8 바이트 / 4로 추정
+        return math.ceil(len(text.encode('utf-8')) / 4)
+
+    def count_messages(self, messages):
+        """chat 메시지 리스트의 프롬프트 토큰 수 (메시지당 형식 토큰 포함)"""
+        return sum(self.count(message.get('content') or "") + 4 for message in messages) + 3
+
+    def output_tokens(self, step, items=0):
+        """단계의 응답 스키마로 정한 출력 한도 (items: 반복 항목 수)"""
+        budget = OUTPUT_BUDGETS.get(step, {'base': 1000, 'per_item': 0})
+        return budget['base'] + budget['per_item'] * items
+
+    def compact(self, text):
+        """연속 공백, 빈 줄, 연속으로 중복된 줄 제거 (OCR 전사에서 흔함)"""
+        lines = []
+        for line in text.splitlines():
+            line = _SPACES.sub(" ", line).strip()
+            if line and (not lines or lines[-1] != line):
+                lines.append(line)
+        return "\n".join(lines)
+
+    def fit(self, text, max_tokens):
+        """
+        텍스트를 max_tokens 이하로 맞춤
+
+        먼저 compact()로 압축하고, 그래도 넘으면 앞부분(자기소개 등)과 뒷부분(연봉, 입사
+        가능일 등 마무리 질문)을 남기고 가운데 줄을 생략 표시로 바꾼다.
+        """
+        if self.count(text) <= max_tokens:
+            return text
+        text = self.compact(text)
+        if self.count(text) <= max_tokens:
+            return text
+
+        lines = text.split("\n")
+        if len(lines) == 1:
+            head, _ = self._take_lines(lines, max(0, max_tokens - 2))
+            return f"{head[0]} [...]" if head else ""
+        marker_tokens = self.count("[... 000000 lines omitted to fit the token budget ...]") + 1
+        remaining = max(0, max_tokens - marker_tokens)
+        head_budget = remaining // 3
+        head, used = self._take_lines(lines, head_budget)
+        tail, _ = self._take_lines(reversed(lines[len(head):]), remaining - used)
+        tail.reverse()
+
+        omitted = len(lines) - len(head) - len(tail)
+        marker = f"[... {omitted} lines omitted to fit the token budget ...]"
+        return "\n".join(head + [marker] + tail)
+
+    def plan(self, step, messages, transcript, items=0):
+        """
+        호출 계획: 전사 텍스트를 예산에 맞춰 메시지의 TRANSCRIPT_SLOT에 넣고 출력 한도를 정함
+
+        전사 토큰 한도 = min(단계 예산, 컨텍스트 창 - 나머지 프롬프트 - 출력 한도 - 여유분)
+
+        Args:
+            step (str): 단계 이름 (step_budgets, OUTPUT_BUDGETS 키)
+            messages (list): TRANSCRIPT_SLOT이 한 곳에 들어 있는 메시지 리스트
+            transcript (str): 전사 텍스트
+            items (int): 응답의 반복 항목 수 (출력 한도 계산용)
+
+        Returns:
+            tuple: (메시지 리스트, max_tokens, 계획한 프롬프트 토큰 수)
+        """
+        max_tokens = self.output_tokens(step, items)
+        fixed_tokens = self.count_messages(
+            [dict(message, content=message['content'].replace(TRANSCRIPT_SLOT, "")) for message in messages]
+        )
+        available = self.context_tokens - fixed_tokens - max_tokens - self.safety_margin
+        if step in self.step_budgets:
+            available = min(available, self.step_budgets[step])
+
+        original_tokens = self.count(transcript)
+        fitted = self.fit(transcript, max(0, available))
+        if fitted is not transcript:
+            print(f"[TokenBudget] {step}: 전사 {original_tokens} → {self.count(fitted)} 토큰으로 축소 (한도 {available})")
+
+        planned = [dict(message, content=message['content'].replace(TRANSCRIPT_SLOT, fitted)) for message in messages]
+        return planned, max_tokens, self.count_messages(planned)
+
+    def record(self, step, planned_prompt_tokens, max_tokens, response):
+        """
+        계획한 토큰과 실제 사용량 기록
+
+        Returns:
+            bool: 출력이 max_tokens에서 잘렸는지
+        """
+        choices = getattr(response, 'choices', None) or []
+        truncated = bool(choices) and choices[0].finish_reason == 'length'
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return truncated
+        estimate = "" if self.exact else " (추정)"
+        print(f"[TokenBudget] {step}: 입력 계획 {planned_prompt_tokens}{estimate} / 실제 {usage.prompt_tokens}, "
+              f"출력 한도 {max_tokens} / 실제 {usage.completion_tokens}")
+        if truncated:
+            print(f"[TokenBudget] {step}: 출력이 한도({max_tokens})에서 잘림")
+        return truncated
+
+    def _take_lines(self, lines, budget):
+        """budget 토큰 안에 들어가는 앞쪽 줄들 (첫 줄이 넘치면 글자 비율로 자름)"""
+        taken = []
+        used = 0
+        for line in lines:
+            tokens = self.count(line) + 1  # 줄바꿈
+            if used + tokens > budget:
+                if not taken and budget > 1:
+                    taken.append(line[:len(line) * (budget - 1) // tokens])
+                    used = budget
+                break
+            taken.append(line)
+            used += tokens
+        return taken, used
+
+    @staticmethod
+    def _model_context_tokens(model):
+        for name in sorted(MODEL_CONTEXT_TOKENS, key=len, reverse=True):
+            if model.startswith(name):
+                return MODEL_CONTEXT_TOKENS[name]
+        return MODEL_CONTEXT_TOKENS['gpt-3.5-turbo']
+
+    @staticmethod
+    def _load_encoding(model):
+        if tiktoken is None:
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                return tiktoken.get_encoding('cl100k_base')
+        except Exception as e:  # 인코딩 파일을 내려받지 못한 경우 등
+            print(f"[TokenBudget] tiktoken 인코딩 로드 실패, 추정치 사용: {e}")
+            return None
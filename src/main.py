@@ -1,3 +1,4 @@
+import os
 import sys
 from PyQt6.QtWidgets import QApplication
 from src.ui.main_window import MainWindow
@@ -8,6 +9,11 @@ def main():
     # 설정 로드
     settings = load_settings()
     
+    # Tesseract 프로세스(환경 변수 상속)의 OpenMP 스레드 수 제한 - 줄 단위 병렬 인식과 겹치지 않도록
+    omp_thread_limit = settings['ocr'].get('omp_thread_limit', 1)
+    if omp_thread_limit:
+        os.environ.setdefault('OMP_THREAD_LIMIT', str(omp_thread_limit))
+    
     # Qt 애플리케이션 생성
     app = QApplication(sys.argv)
     app.setApplicationName("Rec Chart OCR")
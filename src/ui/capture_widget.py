@@ -5,33 +5,72 @@ from PyQt6.QtCore import QTimer, pyqtSignal
 from PyQt6.QtGui import QTextCursor
 from src.core.screen_capture import ScreenCapture
 from src.core.ocr_engine import OCREngine
+from src.core.ocr_scheduler import OCRScheduler
+from src.core.sentence_stream import StreamingSentenceSegmenter
+from src.core.utterance import SpeakerTurnParser
+from src.core.overlap import find_line_overlap
+from src.core.similarity import is_similar
+from src.core.transcript_store import TranscriptStore
+from src.core.consensus import LineConsensus
 from src.gpt.summarizer import GPTSummarizer
-from difflib import SequenceMatcher
+from src.gpt.llm_executor import get_llm_executor, get_llm_queue
 from datetime import datetime
 import re
+import time
 
 class CaptureWidget(QWidget):
     """화면 캡처 및 OCR 처리 위젯"""
     
     # 텍스트 캡처 시그널
     text_captured = pyqtSignal(str)
+    # OCR 워커 스레드 → UI 스레드 결과 전달 시그널
+    ocr_finished = pyqtSignal(object)
+    # LLM 워커 스레드 → UI 스레드 노트 결과 전달 시그널 (source_start, source_end, result)
+    note_finished = pyqtSignal(object)
+    # 재분석 결과 전달 시그널 (transcript, note_id, result 또는 예외)
+    reanalysis_finished = pyqtSignal(object)
     
-    def __init__(self, settings):
+    def __init__(self, settings, transcript_store=None, summarizer=None):
         super().__init__()
         self.settings = settings
         self.screen_capture = ScreenCapture()
         self.ocr_engine = OCREngine(settings)
-        self.summarizer = GPTSummarizer(settings)
+        self.summarizer = summarizer if summarizer is not None else GPTSummarizer(settings)
+        
+        # LLM 호출은 워커 스레드에서 실행하고 결과는 시그널로 UI 스레드에 전달
+        self.llm_executor = get_llm_executor(settings)
+        self.llm_queue = get_llm_queue(settings)
+        self.note_finished.connect(self.handle_note_result)
+        self.reanalysis_finished.connect(self.handle_reanalysis_result)
+        
+        # OCR 스케줄러 (최신 프레임 우선, 오래된 프레임은 버림)
+        frame_deadline = settings['ocr'].get('frame_deadline', settings['capture'].get('interval', 2.0))
+        self.ocr_scheduler = OCRScheduler(
+            self.ocr_engine,
+            on_result=lambda job, result: self.ocr_finished.emit(self._stamp_result(job, result)),
+            deadline=frame_deadline
+        )
+        self.ocr_finished.connect(self.handle_ocr_result)
         
         # 캡처 상태 관리
         self.capturing = False
-        self.extracted_text = ""    # 전체 대화 로그
         self.previous_text = ""
+        self.frame_time = None  # 처리 중인 프레임의 캡처 시각 (전사 줄 타임스탬프)
+        self.applied_frame_id = 0  # 마지막으로 적용한 OCR 프레임 ID (늦게 도착한 이전 프레임 결과 무시)
         self.capture_region = None  # 캡처 영역
-        self.summary_buffer = ""    # 요약할 텍스트를 임시 저장하는 버퍼
+        
+        # 전체 대화 기록 (확정된 문장, 스크롤백 중복 색인 포함) - 인터뷰 위젯과 공유 가능
+        self.transcript = transcript_store if transcript_store is not None else TranscriptStore.from_settings(settings)
+        self.summary_view = self.transcript.view()  # 아직 요약하지 않은 문장들
+        self.sentence_stream = StreamingSentenceSegmenter()  # 프레임 경계에서 잘린 문장 이어 붙이기
+        
+        # 다중 프레임 합의 (같은 줄의 여러 판독을 투표로 합쳐 안정되면 확정)
+        consensus_enabled = settings['ocr'].get('consensus', {}).get('enabled', True)
+        self.consensus = LineConsensus.from_settings(settings) if consensus_enabled else None
         
         # 화자 구분 설정
         self.interviewer_name = "Interviewer"  # 기본값
+        self.turn_parser = SpeakerTurnParser(self.interviewer_name)
         
         # 타이머 설정
         self.timer = QTimer()
@@ -134,8 +173,27 @@ class CaptureWidget(QWidget):
         self.summary_display = QTextEdit(self)
         self.summary_display.setMinimumHeight(300)
         self.summary_display.setStyleSheet("border: 1px solid #ccc; padding: 5px; background-color: #f9f9f9;")
+        self.summary_display.cursorPositionChanged.connect(self.show_note_source)
         layout.addWidget(self.summary_display)
         
+        # 선택한 노트의 출처 (전사 구간) 표시
+        source_layout = QHBoxLayout()
+        source_label = QLabel("Note Source:")
+        source_layout.addWidget(source_label)
+        source_layout.addStretch()
+        
+        self.reanalyze_btn = QPushButton("Re-analyze Note", self)
+        self.reanalyze_btn.setEnabled(False)
+        self.reanalyze_btn.clicked.connect(self.reanalyze_note)
+        source_layout.addWidget(self.reanalyze_btn)
+        layout.addLayout(source_layout)
+        
+        self.source_display = QTextEdit(self)
+        self.source_display.setReadOnly(True)
+        self.source_display.setMaximumHeight(120)
+        self.source_display.setStyleSheet("border: 1px solid #ccc; padding: 5px; color: #444;")
+        layout.addWidget(self.source_display)
+        
         # 저장 버튼
         self.save_btn = QPushButton("Save Screening Note", self)
         self.save_btn.clicked.connect(self.save_documents)
@@ -173,6 +231,8 @@ class CaptureWidget(QWidget):
         if ok and name.strip():
             self.interviewer_name = name.strip()
             self.interviewer_label.setText(f"Interviewer: {self.interviewer_name}")
+            self.ocr_engine.set_interviewer_name(self.interviewer_name)
+            self.turn_parser.set_interviewer_name(self.interviewer_name)
             print(f"Interviewer name set to: {self.interviewer_name}")
     
     def select_capture_region(self):
@@ -191,62 +251,20 @@ class CaptureWidget(QWidget):
             QMessageBox.warning(self, "Error", f"Failed to select capture region: {str(e)}")
     
     def parse_speaker_text(self, text):
-        """화자 구분하여 텍스트 파싱"""
-        lines = text.split('\n')
-        parsed_content = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # "이름:" 패턴 감지
-            speaker_match = re.match(r'^([^:]+):\s*(.+)', line)
-            if speaker_match:
-                speaker = speaker_match.group(1).strip()
-                content = speaker_match.group(2).strip()
-                
-                # Interviewer인지 확인
-                is_interviewer = (speaker.lower() == self.interviewer_name.lower())
-                
-                parsed_content.append({
-                    'speaker': speaker,
-                    'content': content,
-                    'is_interviewer': is_interviewer
-                })
-            else:
-                # 화자 구분이 없는 경우 후보자 발언으로 간주
-                parsed_content.append({
-                    'speaker': 'Candidate',
-                    'content': line,
-                    'is_interviewer': False
-                })
-        
-        return parsed_content
+        """화자 구분하여 텍스트 파싱 (이전 청크의 화자/질문 상태 유지)"""
+        return self.turn_parser.feed(text)
     
-    def format_conversation_for_ai(self, parsed_content):
-        """AI를 위한 대화 포맷팅"""
-        formatted_lines = []
-        
-        for item in parsed_content:
-            speaker = item['speaker']
-            content = item['content']
-            
-            if item['is_interviewer']:
-                formatted_lines.append(f"{speaker} (Interviewer): {content}")
-            else:
-                formatted_lines.append(f"{speaker} (Candidate): {content}")
-        
-        return '\n'.join(formatted_lines)
+    def format_conversation_for_ai(self, utterances):
+        """AI를 위한 대화 포맷팅 (이전 청크의 질문에 대한 답이면 질문 포함)"""
+        return self.turn_parser.format_for_ai(utterances)
     
     def is_duplicate_text(self, current_text):
         """중복 텍스트 확인"""
         if not self.previous_text:
             return False
         
-        # 85% 이상 유사하면 중복으로 판단
-        similarity = SequenceMatcher(None, self.previous_text, current_text).ratio()
-        return similarity >= 0.85
+        # 85% 이상 유사하면 중복으로 판단 (SequenceMatcher 비율과 같은 판정, 조기 종료)
+        return is_similar(self.previous_text, current_text, 0.85)
     
     def extract_incremental_content(self, current_text):
         """증분 콘텐츠 추출 (스크롤 대응 알고리즘)"""
@@ -259,19 +277,9 @@ class CaptureWidget(QWidget):
         if not prev_lines or not curr_lines:
             return current_text
 
-        # 스크롤 감지를 위한 최적의 중첩 구간 탐색
-        max_overlap = 0
-        # 가능한 중첩 길이 (최소 1줄, 최대 텍스트 길이)로 반복
-        for overlap_len in range(min(len(prev_lines), len(curr_lines)), 0, -1):
-            # 이전 텍스트의 끝 부분과 현재 텍스트의 시작 부분
-            prev_suffix = prev_lines[-overlap_len:]
-            curr_prefix = curr_lines[:overlap_len]
-
-            # 70% 이상 유사도를 보이면 신뢰할 수 있는 중첩으로 간주
-            # OCR 오류나 약간의 수정에도 대응 가능
-            if SequenceMatcher(None, prev_suffix, curr_prefix).ratio() > 0.7:
-                max_overlap = overlap_len
-                break
+        # 스크롤 감지: 이전 텍스트의 끝 줄들과 현재 텍스트의 시작 줄들이 겹치는 최대 길이
+        # (정규화된 줄 해시 + KMP, OCR 오류로 깨진 줄은 최대 2줄까지 허용 - 70% 초과 일치)
+        max_overlap = find_line_overlap(prev_lines, curr_lines, min_match_ratio=0.7, max_mismatches=2)
         
         # 중첩 구간을 찾았다면, 그 이후의 내용만 '새로운' 것으로 간주
         if max_overlap > 0:
@@ -338,7 +346,8 @@ class CaptureWidget(QWidget):
         self.capturing = True
         self.status_label.setText("Status: Interview capture started...")
         
-        # 타이머 시작
+        # OCR 워커 및 타이머 시작
+        self.ocr_scheduler.start()
         self.timer.start(2000)  # 2초마다 캡처
         self.summary_timer.start(4000)  # 4초마다 요약
         
@@ -347,12 +356,26 @@ class CaptureWidget(QWidget):
         self.capturing = False
         self.status_label.setText("Status: Interview capture stopped")
         
-        # 타이머 중지
+        # 타이머 및 OCR 워커 중지
         self.timer.stop()
         self.summary_timer.stop()
+        self.ocr_scheduler.stop()
+        
+        # 합의 대기 중인 줄과 마지막 프레임에서 끝나지 않은 문장도 전달
+        if self.consensus:
+            self.commit_lines(self.consensus.flush())
+            print(f"[Consensus] 통계: {self.consensus.stats()}")
+        self.emit_sentences(self.sentence_stream.flush())
+        print(f"[OCRScheduler] 통계: {self.ocr_scheduler.stats()}")
+        print(f"[QualityGate] 통계: {self.ocr_engine.quality_gate.stats()}")
 
-    def perform_ocr(self):
-        """OCR 수행"""
+    def perform_ocr(self, wait=False):
+        """
+        화면을 캡처하여 OCR 스케줄러에 제출
+        
+        Args:
+            wait (bool): True면 현재 스레드에서 즉시 처리 (캡처 종료 직전 마지막 프레임용)
+        """
         if not self.capturing:
             return
             
@@ -363,49 +386,92 @@ class CaptureWidget(QWidget):
             else:
                 screenshot = self.screen_capture.capture_screen()
             
-            # OCR 수행
-            ocr_result = self.ocr_engine.extract_text(screenshot)
+            if screenshot is None:
+                return
             
+            if wait:
+                self.handle_ocr_result(self._stamp_result(*self.ocr_scheduler.process_now(screenshot)))
+            else:
+                # 처리 중인 프레임이 있으면 대기 중인 이전 프레임은 버려짐
+                self.ocr_scheduler.submit(screenshot)
+                
+        except Exception as e:
+            print(f"OCR Error: {e}")
+    
+    @staticmethod
+    def _stamp_result(job, result):
+        """OCR 결과에 프레임 ID와 캡처 시각 기록 (워커 스레드, 시그널 emit 전)"""
+        if isinstance(result, dict):
+            result['frame_id'] = job.frame_id
+            result['captured_at'] = job.captured_at
+        return result
+
+    def handle_ocr_result(self, ocr_result):
+        """OCR 결과 처리 (UI 스레드)"""
+        try:
             if not ocr_result or not ocr_result.get('text'):
                 return
+            
+            # 캡처 중지 후 도착했거나, 더 새로운 프레임(마지막 동기 처리 프레임)보다 늦게 도착한 결과는 무시
+            frame_id = ocr_result.get('frame_id', 0)
+            if not self.capturing or frame_id < self.applied_frame_id:
+                print(f"[OCRScheduler] 늦게 도착한 프레임 #{frame_id} 결과 무시")
+                return
+            self.applied_frame_id = frame_id
                 
             current_text = ocr_result['text'].strip()
             confidence = ocr_result.get('confidence', 0)
+            self.frame_time = ocr_result.get('captured_at', time.time())
             
             # confidence 정보 표시
             confidence_info = f"[Confidence: {confidence:.1f}%] "
             
-            # OCR 신뢰도 정보만 로깅 (필터링하지 않음 - AI가 판단)
-            print(f"[OCR] 신뢰도: {confidence:.1f}% - 모든 텍스트를 AI에게 전달")
-            
             if current_text and len(current_text) >= 15:  # 최소 15자
+                # 품질 게이트: 신뢰도/사전 적중률이 낮은 프레임은 요약/분석 버퍼로 보내지 않음
+                valid, reason = self.ocr_engine.quality_gate.check(
+                    current_text, ocr_result.get('word_confidences')
+                )
+                if not valid:
+                    print(f"[QualityGate] 프레임 거부 ({reason}, Confidence: {confidence:.1f}%)")
+                    return
+                
+                if self.consensus:
+                    # 프레임마다 모든 줄을 투표에 반영하고, 안정된 줄만 확정
+                    # 합의가 줄 단위로 같은 줄을 한 번만 확정하므로 프레임 단위 중복 체크
+                    # (is_duplicate_text)와 증분 추출(extract_incremental_content)은 거치지 않음
+                    # - 같은 프레임의 반복이 곧 투표이므로 건너뛰면 줄이 확정되지 않는다
+                    self.current_text_display.setText(confidence_info + current_text)
+                    self.previous_text = current_text
+                    committed = self.consensus.feed(
+                        current_text.splitlines(), ocr_result.get('line_confidences')
+                    )
+                    if committed:
+                        self.commit_lines(committed)
+                        print(f"[Consensus] {len(committed)}줄 확정 (Confidence: {confidence:.1f}%): {committed[0]}")
+                    return
+                
                 # 중복 체크
                 if not self.is_duplicate_text(current_text):
                     # 증분 추출 (이전 텍스트를 넘어서는 새로운 부분만)
                     new_content = self.extract_incremental_content(current_text)
                     
+                    if new_content:
+                        # 세션 중 이미 나왔던 줄/블록 제거 (위로 스크롤해 예전 대화를 다시 본 경우)
+                        novel_lines = self.transcript.filter_seen_lines(new_content.splitlines())
+                        if len(novel_lines) < len(new_content.splitlines()):
+                            print(f"[Transcript] 이미 기록된 줄 {len(new_content.splitlines()) - len(novel_lines)}개 제외 (스크롤백)")
+                        new_content = "\n".join(novel_lines)
+                    
                     if new_content and len(new_content) >= 15:  # 새 내용이 15자 이상
                         # 현재 텍스트 표시
                         display_text = confidence_info + current_text
                         self.current_text_display.setText(display_text)
-                        
-                        # 전체 로그에 증분 텍스트 축적
-                        if self.extracted_text:
-                            self.extracted_text += "\n" + new_content
-                        else:
-                            self.extracted_text = new_content
-                        
-                        # 요약 버퍼에 추가
-                        if self.summary_buffer:
-                            self.summary_buffer += "\n" + new_content
-                        else:
-                            self.summary_buffer = new_content
 
                         # 이전 텍스트 업데이트
                         self.previous_text = current_text
                         
-                        # 새로운 텍스트 캡처 시그널 발생
-                        self.text_captured.emit(new_content)
+                        # 완성된 문장만 요약/분석으로 전달 (잘린 문장은 다음 프레임까지 대기)
+                        self.emit_sentences(self.sentence_stream.feed(new_content))
                         
                         print(f"New content added (Confidence: {confidence:.1f}%): {new_content.splitlines()[0]}")
                     else:
@@ -418,72 +484,240 @@ class CaptureWidget(QWidget):
         except Exception as e:
             print(f"OCR Error: {e}")
 
+    def commit_lines(self, lines):
+        """합의로 확정된 줄을 스크롤백 필터와 문장 분할을 거쳐 전달"""
+        novel_lines = self.transcript.filter_seen_lines(lines)
+        if len(novel_lines) < len(lines):
+            print(f"[Transcript] 이미 기록된 줄 {len(lines) - len(novel_lines)}개 제외 (스크롤백)")
+        if novel_lines:
+            self.emit_sentences(self.sentence_stream.feed("\n".join(novel_lines)))
+
+    def set_transcript(self, transcript_store):
+        """새 인터뷰의 전사 기록으로 전환 (이전 프레임/문장 상태 초기화)"""
+        self.transcript = transcript_store
+        self.summary_view = transcript_store.view()
+        self.previous_text = ""
+        self.sentence_stream.reset()
+        if self.consensus:
+            self.consensus.reset()
+    
+    @property
+    def extracted_text(self):
+        """전체 대화 로그"""
+        return self.transcript.text()
+    
+    @property
+    def summary_buffer(self):
+        """아직 요약하지 않은 텍스트"""
+        return self.summary_view.text()
+
+    def emit_sentences(self, sentences):
+        """완성된 문장을 전사 기록에 추가하고 텍스트 캡처 시그널 발생"""
+        if not sentences:
+            return
+        
+        for sentence in sentences:
+            self.transcript.append(
+                StreamingSentenceSegmenter.format([sentence]), sentence['speaker'], timestamp=self.frame_time
+            )
+        sentence_text = StreamingSentenceSegmenter.format(sentences)
+        
+        # 새로운 텍스트 캡처 시그널 발생
+        self.text_captured.emit(sentence_text)
+
     def perform_summary(self):
-        """스크리닝 노트 생성 (증분 방식)"""
+        """스크리닝 노트 생성 요청 (증분 방식, LLM 호출은 워커 스레드에서 실행)"""
         # 버퍼에 내용이 없으면 실행하지 않음
-        if not self.capturing or not self.summary_buffer.strip():
+        if not self.capturing or not self.summary_view:
             return
         
-        # 처리할 내용을 가져오고 버퍼를 즉시 비움
-        text_to_process = self.summary_buffer
-        self.summary_buffer = ""
+        # 처리할 내용을 가져오고 요약 위치를 즉시 끝으로 이동 (노트 출처 구간 기록)
+        source_start = self.summary_view.position
+        text_to_process = self.summary_view.take()
+        source_end = self.summary_view.position
             
         try:
-            # 화자 구분 파싱 (새로운 청크만 처리)
-            parsed_content = self.parse_speaker_text(text_to_process)
+            # 화자 구분 파싱 (새로운 청크만 처리, 화자 턴 상태는 파서가 유지)
+            utterances = self.parse_speaker_text(text_to_process)
             
             # AI를 위한 포맷팅
-            formatted_conversation = self.format_conversation_for_ai(parsed_content)
+            formatted_conversation = self.format_conversation_for_ai(utterances)
             
-            # 요약 생성 (화자 구분된 대화 전달)
-            result = self.summarizer.generate_screening_note_with_speaker(
-                formatted_conversation, 
-                self.interviewer_name
+            # 요약 생성 (화자 구분된 대화 전달), 결과는 handle_note_result로 전달
+            # 이전 호출이 끝나지 않았으면 대기 중인 청크와 합쳐 다음 호출 한 번으로 보냄
+            status = self.llm_queue.submit(
+                'screening_note',
+                (source_start, source_end, formatted_conversation),
+                self._generate_note,
+                merge=self._merge_note_chunks,
+                identity=lambda payload: payload[2],
+                on_result=lambda payload, result: self.note_finished.emit((payload[0], payload[1], result)),
+                on_error=lambda payload, e: print(f"Screening note generation error: {e}"),
             )
-            
-            if result and isinstance(result, dict):
-                category = result.get('category', 'Unknown')
-                note = result.get('note', '')
-                
-                if category != 'Not Applicable' and note:
-                    # 타임스탬프 추가
-                    timestamp = datetime.now().strftime("[%H:%M:%S]")
-                    formatted_note = f"{timestamp} **{category}**: {note}"
-                    
-                    # 스크리닝 노트에 추가
-                    current_content = self.summary_display.toPlainText()
-                    if current_content:
-                        new_content = current_content + "\n\n" + formatted_note
-                    else:
-                        new_content = formatted_note
-                    
-                    self.summary_display.setText(new_content)
-                    
-                    # 스크롤을 최하단으로
-                    cursor = self.summary_display.textCursor()
-                    cursor.movePosition(QTextCursor.MoveOperation.End)
-                    self.summary_display.setTextCursor(cursor)
-                    
-                    print(f"Screening note added: [{category}] {note}")
-                else:
-                    print(f"Content not applicable or empty note: {category}")
+            if status != 'started':
+                print(f"[스크리닝] 이전 노트 생성 진행 중 - 청크 {status} (lines {source_start}-{source_end})")
                     
         except Exception as e:
             print(f"Screening note generation error: {e}")
 
+    def _generate_note(self, payload):
+        """청크 (source_start, source_end, 대화)의 스크리닝 노트 생성 (워커 스레드)"""
+        return self.summarizer.generate_screening_note_with_speaker(payload[2], self.interviewer_name)
+
+    @staticmethod
+    def _merge_note_chunks(waiting, newer):
+        """대기 중인 청크와 새 청크를 하나의 출처 구간으로 병합"""
+        return (waiting[0], newer[1], f"{waiting[2]}\n{newer[2]}")
+
+    def handle_note_result(self, payload):
+        """스크리닝 노트 결과 처리 (UI 스레드)"""
+        source_start, source_end, result = payload
+        if result and isinstance(result, dict):
+            category = result.get('category', 'Unknown')
+            note = result.get('note', '')
+            
+            if category != 'Not Applicable' and note:
+                transcript_note = self.transcript.add_note(source_start, source_end, category, note)
+                self.append_note(transcript_note)
+                print(f"Screening note added: [{category}] {note} (lines {source_start}-{source_end})")
+            else:
+                print(f"Content not applicable or empty note: {category}")
+
+    def append_note(self, transcript_note):
+        """
+        스크리닝 노트 표시 영역 끝에 노트 추가
+        
+        노트가 차지하는 텍스트 블록에 note_id를 기록해 두어, 커서가 놓인 블록에서
+        바로 노트(와 출처 전사 구간)를 찾는다.
+        """
+        # 타임스탬프 추가
+        timestamp = datetime.now().strftime("[%H:%M:%S]")
+        
+        # 문서 끝에 삽입 (기존 노트 전체를 다시 읽고 쓰지 않음)
+        cursor = self.summary_display.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.summary_display.document().isEmpty():
+            cursor.insertText("\n\n")
+        self._insert_note(cursor, transcript_note, timestamp)
+        
+        # 스크롤을 최하단으로
+        self.summary_display.setTextCursor(cursor)
+    
+    def replace_note(self, transcript_note):
+        """표시 중인 노트 블록의 내용을 노트의 현재 내용으로 교체 (블록이 없으면 끝에 추가)"""
+        document = self.summary_display.document()
+        first = last = None
+        block = document.begin()
+        while block.isValid():
+            if block.userState() == transcript_note.note_id:
+                if first is None:
+                    first = block
+                last = block
+            elif first is not None:
+                break
+            block = block.next()
+        if first is None:
+            self.append_note(transcript_note)
+            return
+        
+        # 처음 표시한 시각은 유지
+        timestamp_match = re.match(r"\[\d{2}:\d{2}:\d{2}\]", first.text())
+        timestamp = timestamp_match.group(0) if timestamp_match else datetime.now().strftime("[%H:%M:%S]")
+        
+        cursor = QTextCursor(document)
+        cursor.setPosition(first.position())
+        cursor.setPosition(last.position() + last.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        self._insert_note(cursor, transcript_note, timestamp)
+    
+    def _insert_note(self, cursor, transcript_note, timestamp):
+        """커서 위치에 노트를 쓰고, 노트가 차지하는 블록들에 note_id 기록"""
+        start_position = cursor.position()
+        cursor.insertText(f"{timestamp} **{transcript_note.category}**: {transcript_note.text}")
+        
+        block = self.summary_display.document().findBlock(start_position)
+        while block.isValid() and block.position() <= cursor.position():
+            block.setUserState(transcript_note.note_id)
+            block = block.next()
+    
+    def selected_note(self):
+        """스크리닝 노트 영역에서 커서가 놓인 노트 (없으면 None)"""
+        note_id = self.summary_display.textCursor().block().userState()
+        if 0 <= note_id < len(self.transcript.notes):
+            return self.transcript.notes[note_id]
+        return None
+    
+    def show_note_source(self):
+        """커서가 놓인 노트의 출처 전사 구간 표시"""
+        note = self.selected_note()
+        self.reanalyze_btn.setEnabled(note is not None and note.start < note.end)
+        if note is None:
+            self.source_display.clear()
+            return
+        
+        if note.start_time is not None:
+            start = datetime.fromtimestamp(note.start_time).strftime("%H:%M:%S")
+            end = datetime.fromtimestamp(note.end_time).strftime("%H:%M:%S")
+            header = f"[{start} - {end}] lines {note.start + 1}-{note.end}"
+        else:
+            header = "(no source lines)"
+        self.source_display.setPlainText(f"{header}\n{self.transcript.span_text(note.start, note.end)}")
+    
+    def reanalyze_note(self):
+        """선택한 노트의 출처 구간만 다시 분석 요청 (결과는 handle_reanalysis_result에서 교체)"""
+        note = self.selected_note()
+        if note is None or note.start >= note.end:
+            return
+        
+        try:
+            # 출처 구간만 별도 파서로 포맷 (실시간 화자 턴 상태에 영향을 주지 않음)
+            parser = SpeakerTurnParser(self.interviewer_name)
+            utterances = parser.feed(self.transcript.span_text(note.start, note.end))
+            note_id = note.note_id
+            transcript = self.transcript  # 결과가 올 때 같은 인터뷰인지 확인
+            self.reanalyze_btn.setEnabled(False)
+            self.llm_executor.submit(
+                self.summarizer.generate_screening_note_with_speaker,
+                parser.format_for_ai(utterances),
+                self.interviewer_name,
+                use_cache=False,  # 같은 구간의 이전 응답이 아닌 새 분석
+                key=f'note-{note_id}',
+                on_result=lambda result: self.reanalysis_finished.emit((transcript, note_id, result)),
+                on_error=lambda e: self.reanalysis_finished.emit((transcript, note_id, e)),
+            )
+                
+        except Exception as e:
+            print(f"Screening note re-analysis error: {e}")
+
+    def handle_reanalysis_result(self, payload):
+        """재분석 결과로 노트 교체 (UI 스레드, 실패해도 버튼 상태 복구)"""
+        transcript, note_id, result = payload
+        if transcript is not self.transcript:
+            print("Re-analysis result dropped: transcript changed")
+        elif isinstance(result, Exception):
+            print(f"Screening note re-analysis error: {result}")
+        elif result and isinstance(result, dict) and result.get('note'):
+            note = self.transcript.notes[note_id]
+            self.transcript.update_note(note_id, result.get('category', note.category), result['note'])
+            self.replace_note(note)
+            print(f"Screening note re-analyzed: [{note.category}] {note.text} (lines {note.start}-{note.end})")
+        else:
+            print("Re-analysis returned no note")
+        self.show_note_source()
+
     def save_documents(self):
         """문서 저장"""
         try:
-            if not self.extracted_text and not self.summary_display.toPlainText():
+            if not self.transcript and self.summary_display.document().isEmpty():
                 QMessageBox.warning(self, "Warning", "No content to save.")
                 return
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            # 원본 텍스트 저장
-            if self.extracted_text:
+            # 원본 텍스트 저장 (세그먼트 파일에서 나눠 읽어 기록)
+            if self.transcript:
                 text_filename = f"extracted_text_{timestamp}.txt"
-                self.document_saver.save_text(self.extracted_text, text_filename)
+                self.document_saver.save_text(self.transcript.iter_text(), text_filename)
             
             # 스크리닝 노트 저장
             screening_note = self.summary_display.toPlainText()
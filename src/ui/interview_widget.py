@@ -9,6 +9,9 @@ from PyQt6.QtGui import QFont, QTextCharFormat, QTextCursor, QTextDocument
 import json
 import os
 from datetime import datetime
+from src.core.content_filters import ContentFilters
+from src.core.transcript_store import TranscriptStore
+from src.gpt.llm_executor import get_llm_queue
 
 class AutoResizeTextEdit(QTextEdit):
     """텍스트 양에 따라 자동으로 높이가 조절되는 TextEdit"""
@@ -232,7 +235,7 @@ If one mentions "700 employees" and another "7 employees", choose based on compa
 Return ONLY the most accurate statement in resume bullet point format (no subjects like "he/she/candidate").
 """
             
-            response = gpt.client.chat.completions.create(
+            response = gpt.llm.chat_completion(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a data validation expert. Choose the most accurate information from conflicting data points."},
@@ -303,7 +306,10 @@ Return ONLY the most accurate statement in resume bullet point format (no subjec
 class InterviewWidget(QWidget):
     """템플릿 기반 실시간 인터뷰 위젯"""
     
-    def __init__(self, template, settings, parent=None):
+    # LLM 워커 스레드 → UI 스레드 카테고리 분류 결과 전달 시그널 (end, manual, result)
+    categorization_finished = pyqtSignal(object)
+    
+    def __init__(self, template, settings, parent=None, transcript_store=None):
         super().__init__(parent)
         self.template = template
         self.settings = settings
@@ -311,11 +317,22 @@ class InterviewWidget(QWidget):
         self.category_status_labels = {}  # 카테고리 상태 라벨들
         self.other_notes = []
         
-        # 누적 분석을 위한 버퍼 추가
-        self.pending_analysis_buffer = ""  # 분석 대기 중인 텍스트 누적
+        # 누적 분석: 전사 기록에서 아직 분석하지 않은 문장들 (pending_analysis_buffer)
+        # 캡처 위젯과 기록을 공유하면 캡처 위젯이 문장을 추가하고, 아니면 받은 텍스트를 직접 추가
+        self.transcript = transcript_store if transcript_store is not None else TranscriptStore.from_settings(settings)
+        self.owns_transcript = transcript_store is None
+        self.analysis_view = self.transcript.view()
+        self._retry_spans = []  # 분류에 실패해 다음 분석에 다시 보낼 (시작 줄, 끝 줄) 구간
         self.min_analysis_length = 150    # 최소 분석 길이 (글자 수)
         self.max_buffer_size = 1000      # 최대 버퍼 크기
         
+        # 내용 필터 (키워드/문구/구체적 정보 패턴을 템플릿마다 한 번만 컴파일)
+        self.content_filters = ContentFilters()
+        
+        # LLM 호출은 워커 스레드에서 실행하고 결과는 시그널로 UI 스레드에 전달
+        self.llm_queue = get_llm_queue(settings)
+        self.categorization_finished.connect(self._apply_categorization)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -356,6 +373,10 @@ class InterviewWidget(QWidget):
         # 1. 실시간 대화 텍스트 박스 (가장 큰 비율)
         self.live_text_edit = QTextEdit()
         self.live_text_edit.setMaximumHeight(35)
+        # 전체 기록은 전사 저장소에 있으므로 표시 영역은 최근 문단만 유지
+        self.live_text_edit.document().setMaximumBlockCount(
+            self.settings.get('transcript', {}).get('live_view_max_blocks', 500)
+        )
         self.live_text_edit.setPlaceholderText("실시간 대화 내용...")
         self.live_text_edit.setStyleSheet("""
             QTextEdit {
@@ -914,17 +935,14 @@ class InterviewWidget(QWidget):
             # ** 마크다운 제거
             clean_text = new_text.replace("**", "")
             
-            current_text = self.live_text_edit.toPlainText()
-            if current_text:
-                updated_text = current_text + "\n\n" + clean_text
-            else:
-                updated_text = clean_text
-                
-            self.live_text_edit.setPlainText(updated_text)
-            
-            # 스크롤을 맨 아래로 이동
+            # 문서 끝에 삽입 (전체 텍스트를 다시 읽고 쓰지 않음)
             cursor = self.live_text_edit.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.End)
+            if not self.live_text_edit.document().isEmpty():
+                clean_text = "\n\n" + clean_text
+            cursor.insertText(clean_text)
+            
+            # 스크롤을 맨 아래로 이동
             self.live_text_edit.setTextCursor(cursor)
     
     def process_text_for_categories(self, text):
@@ -952,141 +970,33 @@ class InterviewWidget(QWidget):
                 print(f"[스크리닝] GPT 분석기 연결됨: {type(main_window.gpt_summarizer)}")
                 gpt = main_window.gpt_summarizer
                 
-                # 새 텍스트를 버퍼에 추가
-                if self.pending_analysis_buffer:
-                    self.pending_analysis_buffer += "\n" + text
-                else:
-                    self.pending_analysis_buffer = text
+                # 새 텍스트를 버퍼에 추가 (공유 기록이면 캡처 위젯이 이미 추가함)
+                if self.owns_transcript:
+                    self.transcript.append_text(text)
                 
                 # 버퍼 크기 제한
-                if len(self.pending_analysis_buffer) > self.max_buffer_size:
+                if len(self.analysis_view) > self.max_buffer_size:
                     # 앞부분 잘라내기 (최근 텍스트 유지)
-                    lines = self.pending_analysis_buffer.split('\n')
-                    self.pending_analysis_buffer = '\n'.join(lines[-10:])  # 최근 10줄만 유지
-                    print(f"[스크리닝] 버퍼 크기 초과로 정리됨 (현재 길이: {len(self.pending_analysis_buffer)})")
+                    self.analysis_view.keep_last(10)  # 최근 10줄만 유지
+                    print(f"[스크리닝] 버퍼 크기 초과로 정리됨 (현재 길이: {len(self.analysis_view)})")
                 
-                print(f"[스크리닝] 누적 버퍼 길이: {len(self.pending_analysis_buffer)}")
+                print(f"[스크리닝] 누적 버퍼 길이: {len(self.analysis_view)}")
                 
                 # 충분한 양이 누적되었거나 의미있는 키워드가 있을 때만 분석
                 should_analyze = (
-                    len(self.pending_analysis_buffer) >= self.min_analysis_length or
+                    len(self.analysis_view) >= self.min_analysis_length or
                     self._has_meaningful_content(self.pending_analysis_buffer)
                 )
                 
                 if should_analyze:
-                    print(f"[스크리닝] 누적 분석 시작 (버퍼 길이: {len(self.pending_analysis_buffer)})")
-                    
-                    # 빠른 카테고리 분류 사용 (Enhanced Analyzer 대신)
-                    categories = list(self.template.get("screening_categories", []))
-                    if "Other" not in categories:
-                        categories.append("Other")
-                    
-                    categorized_result = gpt.quick_categorize_text(self.pending_analysis_buffer, categories)
+                    print(f"[스크리닝] 누적 분석 시작 (버퍼 길이: {len(self.analysis_view)})")
                     
-                    if categorized_result:
-                        print(f"[스크리닝] 빠른 분석 완료: {len(categorized_result)}개 카테고리")
-                        
-                        # 분석 결과를 각 카테고리에 추가
-                        for category, analysis_data in categorized_result.items():
-                            if category in self.category_widgets:
-                                # assessment 리스트에서 내용 추출
-                                if isinstance(analysis_data, dict) and "assessment" in analysis_data:
-                                    assessment_list = analysis_data["assessment"]
-                                    if isinstance(assessment_list, list):
-                                        valid_items = []
-                                        for item in assessment_list:
-                                            if self._is_meaningful_assessment(item):
-                                                valid_items.append(item)
-                                                self.category_widgets[category].add_content(item)
-                                        if valid_items:
-                                            print(f"[스크리닝] '{category}' 카테고리에 {len(valid_items)}개 항목 추가")
-                                        else:
-                                            print(f"[스크리닝] '{category}' 카테고리: 의미있는 내용 없음, 추가하지 않음")
-                                    else:
-                                        if self._is_meaningful_assessment(str(assessment_list)):
-                                            self.category_widgets[category].add_content(str(assessment_list))
-                                            print(f"[스크리닝] '{category}' 카테고리에 내용 추가")
-                                        else:
-                                            print(f"[스크리닝] '{category}' 카테고리: 의미있는 내용 없음, 추가하지 않음")
-                                else:
-                                    if self._is_meaningful_assessment(str(analysis_data.get("assessment", analysis_data))):
-                                        self.category_widgets[category].add_content(str(analysis_data.get("assessment", analysis_data)))
-                                        print(f"[스크리닝] '{category}' 카테고리에 내용 추가")
-                                    else:
-                                        print(f"[스크리닝] '{category}' 카테고리: 의미있는 내용 없음, 추가하지 않음")
-                            else:
-                                # 매칭되지 않는 카테고리는 GPT에게 재분류 요청
-                                if category != "Other":
-                                    # GPT에게 더 적절한 카테고리 찾기 요청
-                                    reassigned_category = self._reassign_category_with_gpt(
-                                        category, analysis_data, list(self.template.get("screening_categories", []))
-                                    )
-                                    
-                                    if reassigned_category and reassigned_category in self.category_widgets:
-                                        # 재분류 성공 시 해당 카테고리에 추가
-                                        if isinstance(analysis_data, dict) and "assessment" in analysis_data:
-                                            assessment_list = analysis_data["assessment"]
-                                            if isinstance(assessment_list, list):
-                                                for item in assessment_list:
-                                                    if self._is_meaningful_assessment(item):
-                                                        self.category_widgets[reassigned_category].add_content(item)
-                                                        print(f"[스크리닝] '{category}' → '{reassigned_category}'로 GPT 재분류")
-                                            else:
-                                                if self._is_meaningful_assessment(str(assessment_list)):
-                                                    self.category_widgets[reassigned_category].add_content(str(assessment_list))
-                                                    print(f"[스크리닝] '{category}' → '{reassigned_category}'로 GPT 재분류")
-                                        else:
-                                            content_str = str(analysis_data)
-                                            if self._is_meaningful_assessment(content_str):
-                                                self.category_widgets[reassigned_category].add_content(content_str)
-                                                print(f"[스크리닝] '{category}' → '{reassigned_category}'로 GPT 재분류")
-                                    else:
-                                        # 재분류 실패 시에만 Other에 추가 (원시 카테고리 태그 없이)
-                                        if "Other" in self.category_widgets:
-                                            if isinstance(analysis_data, dict) and "assessment" in analysis_data:
-                                                assessment_list = analysis_data["assessment"]
-                                                if isinstance(assessment_list, list):
-                                                    for item in assessment_list:
-                                                        if self._is_meaningful_assessment(item):
-                                                            self.category_widgets["Other"].add_content(item)  # 태그 제거
-                                                            print(f"[스크리닝] '{category}' → '기타'로 분류됨 (재분류 실패)")
-                                                else:
-                                                    if self._is_meaningful_assessment(str(assessment_list)):
-                                                        self.category_widgets["Other"].add_content(str(assessment_list))  # 태그 제거
-                                                        print(f"[스크리닝] '{category}' → '기타'로 분류됨 (재분류 실패)")
-                                            else:
-                                                content_str = str(analysis_data)
-                                                if self._is_meaningful_assessment(content_str):
-                                                    self.category_widgets["Other"].add_content(content_str)  # 태그 제거
-                                                    print(f"[스크리닝] '{category}' → '기타'로 분류됨 (재분류 실패)")
-                                else:
-                                    # Other 카테고리 자체는 그대로 처리
-                                    if "Other" in self.category_widgets:
-                                        if isinstance(analysis_data, dict) and "assessment" in analysis_data:
-                                            assessment_list = analysis_data["assessment"]
-                                            if isinstance(assessment_list, list):
-                                                for item in assessment_list:
-                                                    if self._is_meaningful_assessment(item):
-                                                        self.category_widgets["Other"].add_content(item)
-                                                        print(f"[스크리닝] 'Other' 카테고리에 직접 추가")
-                                            else:
-                                                if self._is_meaningful_assessment(str(assessment_list)):
-                                                    self.category_widgets["Other"].add_content(str(assessment_list))
-                                                    print(f"[스크리닝] 'Other' 카테고리에 직접 추가")
-                                        else:
-                                            content_str = str(analysis_data)
-                                            if self._is_meaningful_assessment(content_str):
-                                                self.category_widgets["Other"].add_content(content_str)
-                                                print(f"[스크리닝] 'Other' 카테고리에 직접 추가")
-                        
-                        # 분석 완료 후 버퍼 비우기
-                        self.pending_analysis_buffer = ""
-                        print(f"[스크리닝] 빠른 분석 완료, 버퍼 초기화")
-                        
-                    else:
-                        print(f"[스크리닝] 빠른 분석 결과 없음 - 계속 누적")
+                    # 이전 분석이 진행 중이면 최신 버퍼로 대기 작업을 대체 (누적 버퍼가 이전 내용을 포함)
+                    status = self._submit_categorization(gpt)
+                    if status != 'started':
+                        print(f"[스크리닝] 이전 분석 진행 중 - 최신 버퍼 {status}")
                 else:
-                    print(f"[스크리닝] 충분하지 않은 내용 - 계속 누적 (현재 {len(self.pending_analysis_buffer)}/{self.min_analysis_length})")
+                    print(f"[스크리닝] 충분하지 않은 내용 - 계속 누적 (현재 {len(self.analysis_view)}/{self.min_analysis_length})")
                         
             else:
                 print(f"[스크리닝] GPT 분석기 없음 - 원본 텍스트를 기타에 저장")
@@ -1104,24 +1014,207 @@ class InterviewWidget(QWidget):
             except:
                 pass
     
+    def _submit_categorization(self, gpt, manual=False):
+        """
+        누적 버퍼의 카테고리 분류를 워커 스레드에 제출
+        
+        큐가 받아들이면 분석 위치를 버퍼 끝으로 옮기므로 (perform_summary와 같은 방식) 각 작업은
+        이전 작업 이후의 새 문장만 가진다. 카테고리 분류는 한 번에 하나만 실행하고, 실행 중에
+        제출한 구간들은 하나의 대기 작업으로 이어 붙인다. 실행 중이거나 대기 중인 작업과 같은
+        내용은 다시 보내지 않고 분석 위치도 그대로 둔다. 분류에 실패하거나 결과가 없던 구간은
+        다음 분석에 앞쪽에 붙여 다시 보낸다. 결과는 categorization_finished 시그널로 UI 스레드의
+        _apply_categorization에 전달된다.
+        
+        Args:
+            gpt (GPTSummarizer): 공유 요약기
+            manual (bool): 수동 분석 여부 (결과 메시지 표시, 재분류 생략)
+        
+        Returns:
+            str: 큐 상태 ('started', 'queued', 'merged', 'duplicate')
+        """
+        # 빠른 카테고리 분류 사용 (Enhanced Analyzer 대신)
+        categories = list(self.template.get("screening_categories", []))
+        if "Other" not in categories:
+            categories.append("Other")
+        known_categories = set(self.category_widgets)
+        template_categories = list(self.template.get("screening_categories", []))
+        
+        # 다시 보낼 구간 + 분석 위치 이후의 새 구간 (큐가 받아들인 뒤에만 위치를 옮김)
+        end = len(self.transcript)
+        spans = tuple(self._retry_spans) + ((self.analysis_view.position, end),)
+        text = self._spans_text(spans)
+        
+        status = self.llm_queue.submit(
+            'categories',
+            (spans, text, manual),
+            lambda payload: self._categorize_job(
+                gpt, payload[1], categories, known_categories, template_categories, reassign=not payload[2]
+            ),
+            # 대기 구간 뒤에 새 구간을 이어 붙임, 수동 요청이었으면 결과 메시지는 유지
+            merge=lambda waiting, newer: (waiting[0] + newer[0], f"{waiting[1]}\n{newer[1]}", waiting[2] or newer[2]),
+            identity=lambda payload: payload[1],
+            on_result=lambda payload, result: self.categorization_finished.emit((payload[0], payload[2], result)),
+            on_error=lambda payload, e: self.categorization_finished.emit((payload[0], payload[2], e)),
+        )
+        if status != 'duplicate':
+            self._retry_spans = []
+            self.analysis_view.position = max(self.analysis_view.position, end)
+        return status
+    
+    def _spans_text(self, spans):
+        """구간들의 텍스트 (빈 구간 제외)"""
+        return "\n".join(self.transcript.span_text(start, end) for start, end in spans if start < end)
+    
+    def _retry_later(self, spans):
+        """분류하지 못한 구간을 다음 분석에 다시 보내도록 보관 (오래된 구간부터 버퍼 크기 안으로 제한)"""
+        self._retry_spans = [span for span in list(spans) + self._retry_spans if span[0] < span[1]]
+        self._retry_spans.sort()
+        while len(self._retry_spans) > 1 and len(self._spans_text(self._retry_spans)) > self.max_buffer_size:
+            self._retry_spans.pop(0)
+    
+    def _categorize_job(self, gpt, text, categories, known_categories, template_categories, reassign=True):
+        """
+        카테고리 분류 + 알 수 없는 카테고리 재분류 (워커 스레드, 위젯에 접근하지 않음)
+        
+        Returns:
+            tuple: (분류 결과, {원래 카테고리: 재분류된 카테고리})
+        """
+        categorized_result = gpt.quick_categorize_text(text, categories)
+        reassigned = {}
+        if categorized_result and reassign:
+            for category, analysis_data in categorized_result.items():
+                if category not in known_categories and category != "Other":
+                    reassigned[category] = self._reassign_category_with_gpt(
+                        category, analysis_data, template_categories, gpt=gpt
+                    )
+        return categorized_result, reassigned
+    
+    def _apply_categorization(self, payload):
+        """카테고리 분류 결과를 각 카테고리 위젯에 적용 (UI 스레드)"""
+        spans, manual, result = payload
+        end = spans[-1][1]
+        if isinstance(result, Exception):
+            print(f"[ERROR] 스크리닝 분석 실패: {result} - 다음 분석에 다시 포함")
+            self._retry_later(spans)
+            if manual:
+                QMessageBox.warning(self, "분석 실패", f"분석 중 오류가 발생했습니다:\n{result}")
+            return
+        
+        categorized_result, reassigned = result
+        if not categorized_result:
+            print(f"[스크리닝] 빠른 분석 결과 없음 - 계속 누적")
+            self._retry_later(spans)
+            if manual:
+                QMessageBox.warning(self, "분석 실패", "분석 결과를 가져올 수 없습니다.")
+            return
+        
+        print(f"[스크리닝] 빠른 분석 완료: {len(categorized_result)}개 카테고리")
+        
+        # 분석 결과를 각 카테고리에 추가
+        for category, analysis_data in categorized_result.items():
+            if category in self.category_widgets:
+                # assessment 리스트에서 내용 추출
+                if isinstance(analysis_data, dict) and "assessment" in analysis_data:
+                    assessment_list = analysis_data["assessment"]
+                    if isinstance(assessment_list, list):
+                        valid_items = []
+                        for item in assessment_list:
+                            if self._is_meaningful_assessment(item):
+                                valid_items.append(item)
+                                self.category_widgets[category].add_content(item)
+                        if valid_items:
+                            print(f"[스크리닝] '{category}' 카테고리에 {len(valid_items)}개 항목 추가")
+                        else:
+                            print(f"[스크리닝] '{category}' 카테고리: 의미있는 내용 없음, 추가하지 않음")
+                    else:
+                        if self._is_meaningful_assessment(str(assessment_list)):
+                            self.category_widgets[category].add_content(str(assessment_list))
+                            print(f"[스크리닝] '{category}' 카테고리에 내용 추가")
+                        else:
+                            print(f"[스크리닝] '{category}' 카테고리: 의미있는 내용 없음, 추가하지 않음")
+                else:
+                    if self._is_meaningful_assessment(str(analysis_data.get("assessment", analysis_data))):
+                        self.category_widgets[category].add_content(str(analysis_data.get("assessment", analysis_data)))
+                        print(f"[스크리닝] '{category}' 카테고리에 내용 추가")
+                    else:
+                        print(f"[스크리닝] '{category}' 카테고리: 의미있는 내용 없음, 추가하지 않음")
+            else:
+                # 매칭되지 않는 카테고리는 GPT에게 재분류 요청
+                if category != "Other":
+                    # 워커 스레드에서 GPT가 미리 찾아 둔 더 적절한 카테고리
+                    reassigned_category = reassigned.get(category)
+                    
+                    if reassigned_category and reassigned_category in self.category_widgets:
+                        # 재분류 성공 시 해당 카테고리에 추가
+                        if isinstance(analysis_data, dict) and "assessment" in analysis_data:
+                            assessment_list = analysis_data["assessment"]
+                            if isinstance(assessment_list, list):
+                                for item in assessment_list:
+                                    if self._is_meaningful_assessment(item):
+                                        self.category_widgets[reassigned_category].add_content(item)
+                                        print(f"[스크리닝] '{category}' → '{reassigned_category}'로 GPT 재분류")
+                            else:
+                                if self._is_meaningful_assessment(str(assessment_list)):
+                                    self.category_widgets[reassigned_category].add_content(str(assessment_list))
+                                    print(f"[스크리닝] '{category}' → '{reassigned_category}'로 GPT 재분류")
+                        else:
+                            content_str = str(analysis_data)
+                            if self._is_meaningful_assessment(content_str):
+                                self.category_widgets[reassigned_category].add_content(content_str)
+                                print(f"[스크리닝] '{category}' → '{reassigned_category}'로 GPT 재분류")
+                    else:
+                        # 재분류 실패 시에만 Other에 추가 (원시 카테고리 태그 없이)
+                        if "Other" in self.category_widgets:
+                            if isinstance(analysis_data, dict) and "assessment" in analysis_data:
+                                assessment_list = analysis_data["assessment"]
+                                if isinstance(assessment_list, list):
+                                    for item in assessment_list:
+                                        if self._is_meaningful_assessment(item):
+                                            self.category_widgets["Other"].add_content(item)  # 태그 제거
+                                            print(f"[스크리닝] '{category}' → '기타'로 분류됨 (재분류 실패)")
+                                else:
+                                    if self._is_meaningful_assessment(str(assessment_list)):
+                                        self.category_widgets["Other"].add_content(str(assessment_list))  # 태그 제거
+                                        print(f"[스크리닝] '{category}' → '기타'로 분류됨 (재분류 실패)")
+                            else:
+                                content_str = str(analysis_data)
+                                if self._is_meaningful_assessment(content_str):
+                                    self.category_widgets["Other"].add_content(content_str)  # 태그 제거
+                                    print(f"[스크리닝] '{category}' → '기타'로 분류됨 (재분류 실패)")
+                else:
+                    # Other 카테고리 자체는 그대로 처리
+                    if "Other" in self.category_widgets:
+                        if isinstance(analysis_data, dict) and "assessment" in analysis_data:
+                            assessment_list = analysis_data["assessment"]
+                            if isinstance(assessment_list, list):
+                                for item in assessment_list:
+                                    if self._is_meaningful_assessment(item):
+                                        self.category_widgets["Other"].add_content(item)
+                                        print(f"[스크리닝] 'Other' 카테고리에 직접 추가")
+                            else:
+                                if self._is_meaningful_assessment(str(assessment_list)):
+                                    self.category_widgets["Other"].add_content(str(assessment_list))
+                                    print(f"[스크리닝] 'Other' 카테고리에 직접 추가")
+                        else:
+                            content_str = str(analysis_data)
+                            if self._is_meaningful_assessment(content_str):
+                                self.category_widgets["Other"].add_content(content_str)
+                                print(f"[스크리닝] 'Other' 카테고리에 직접 추가")
+        
+        # 분석 위치는 제출할 때 이미 옮겼음 (분석 중 새로 들어온 문장은 다음 분석 대상)
+        print(f"[스크리닝] 빠른 분석 결과 적용 완료 ({end}번째 줄까지)")
+        
+        if manual:
+            QMessageBox.information(self, "분석 완료", f"빠른 분석이 완료되었습니다!\n{len(categorized_result)}개 카테고리로 분류됨")
+    
+    @property
+    def pending_analysis_buffer(self):
+        """분석 대기 중인 텍스트 (다시 보낼 구간 + 전사 기록에서 아직 분석하지 않은 부분)"""
+        return self._spans_text(self._retry_spans + [(self.analysis_view.position, len(self.transcript))])
+    
     def _has_meaningful_content(self, text):
         """텍스트에 의미있는 내용이 있는지 확인"""
-        # 인터뷰에서 중요한 키워드들
-        meaningful_keywords = [
-            # 직업/경력 관련
-            "manager", "director", "experience", "years", "company", "work", "job", "position", "role",
-            # 기술/스킬 관련
-            "skills", "technical", "project", "system", "tools", "software", "certification",
-            # 교육/자격 관련
-            "education", "degree", "university", "college", "training", "certification",
-            # 급여/조건 관련
-            "salary", "compensation", "benefits", "location", "relocate", "remote", "onsite",
-            # 한국어 키워드들
-            "경험", "회사", "연봉", "기술", "프로젝트", "관리", "팀", "업무", "담당", "개발"
-        ]
-        
-        text_lower = text.lower()
-        keyword_count = sum(1 for keyword in meaningful_keywords if keyword in text_lower)
+        keyword_count = self.content_filters.meaningful_keyword_count(text)
         
         # 키워드가 2개 이상 있거나, 텍스트가 길면 분석할 가치가 있다고 판단
         return keyword_count >= 2 or len(text) >= 200
@@ -1133,66 +1226,11 @@ class InterviewWidget(QWidget):
         
         assessment_lower = assessment_text.lower().strip()
         
-        # 의미 없는 표준 문구들 (더 강화)
-        meaningless_phrases = [
-            "no specific information provided",
-            "not provided in the transcript",
-            "no information available",
-            "information not specified",
-            "details not mentioned",
-            "not discussed in detail",
-            "no relevant information",
-            "information unavailable",
-            "not covered in interview",
-            "transcript does not contain",
-            "no data available",
-            "insufficient information",
-            "candidate did not provide",
-            "not applicable",
-            "not relevant",
-            "analysis error",
-            "analysis failed",
-            "processing failed",
-            "[category_name]",
-            "{'other':",
-            "{\"other\":",
-            "content not provided",
-            "information was not mentioned",
-            # 새로운 의미없는 패턴들 추가
-            "briefly introduced himself",
-            "mentioned his current role",
-            "introduced herself", 
-            "mentioned her current role",
-            "candidate introduced",
-            "mentioned their role",
-            "general introduction",
-            "basic introduction",
-            "candidate briefly",
-            "mentioned working at",
-            "talked about their",
-            "discussed their current",
-            "provided general information",
-            "gave an overview",
-            "shared basic details",
-            # 메타 코멘트 차단
-            "interview text appears to be",
-            "does not provide any meaningful information",
-            "text appears garbled",
-            "no meaningful information",
-            "appears to be garbled",
-            "does not provide meaningful",
-            "text does not provide",
-            "information appears to be",
-            "content appears to be",
-            "seems to be garbled",
-            "analysis appears incomplete"
-        ]
-        
         # 의미 없는 문구가 포함되어 있으면 False
-        for phrase in meaningless_phrases:
-            if phrase in assessment_lower:
-                print(f"[의미없는 내용 필터] 차단된 문구: '{phrase}' in '{assessment_text[:50]}...'")
-                return False
+        phrase = self.content_filters.find_meaningless_phrase(assessment_lower)
+        if phrase:
+            print(f"[의미없는 내용 필터] 차단된 문구: '{phrase}' in '{assessment_text[:50]}...'")
+            return False
         
         # 너무 짧은 내용도 의미 없음 (15자 미만으로 강화)
         if len(assessment_lower) < 15:
@@ -1212,82 +1250,19 @@ class InterviewWidget(QWidget):
         return True
 
     def _has_specific_information(self, text):
-        """텍스트에 구체적인 정보가 있는지 확인 (개선된 버전 - 감정/동기 포함)"""
-        import re
-        
-        # 구체적 정보 패턴들 (감정/동기/가치관 추가)
-        specific_patterns = [
-            r'\d+',  # 숫자
-            r'\$[\d,]+',  # 금액
-            r'[A-Z][a-zA-Z\s&]+(Inc|Corp|LLC|Company|Solutions|Logistics|Group)',  # 회사명
-            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # 사람 이름 (First Last)
-            r'\b(?:manager|director|analyst|specialist|coordinator|supervisor|lead|executive)\b',  # 직책
-            r'\b(?:years?|months?)\s+(?:of\s+)?(?:experience|work)',  # 경험 기간
-            r'\b(?:bachelor|master|mba|phd|degree|certification)\b',  # 학력/자격
-            r'\b(?:payroll|HRIS|SAP|Oracle|Workday|SuccessFactors)\b',  # 시스템/도구
-            r'\b(?:onsite|remote|hybrid|relocate|travel)\b',  # 근무 조건
-            # HR 전문 용어
-            r'\b(?:benefits|compensation|labor\s+relations|union|grievance|compliance|OSHA|FMLA|EEOC)\b',
-            r'\b(?:recruitment|hiring|onboarding|training|performance|appraisal)\b',
-            r'\b(?:policies|procedures|handbook|documentation|audit)\b',
-            r'\b(?:coordination|administration|management|oversight|supervision)\b',
-            r'\b(?:multi-state|multi-site|cross-functional|direct\s+reports)\b',
-            r'\b(?:negotiation|contract|agreement|policy)\b',
-            # 동작/행위 관련 구체적 표현
-            r'\b(?:led|managed|coordinated|administered|supervised|implemented|developed|established)\b',
-            r'\b(?:expertise|experience|proficient|skilled|knowledgeable)\b',
-            
-            # 🎯 감정/동기/가치관 패턴 추가
-            r'\b(?:passionate|excited|motivated|enthusiastic|interested|drawn|attracted)\b',  # 감정 표현
-            r'\b(?:believe|value|prioritize|focus|emphasize|commit)\b',  # 가치관/신념
-            r'\b(?:goal|aspiration|vision|mission|purpose|objective)\b',  # 목표/비전
-            r'\b(?:challenging|opportunity|growth|development|learning|improvement)\b',  # 성장 지향
-            r'\b(?:culture|environment|team|collaboration|relationship|communication)\b',  # 문화적 적합성
-            r'\b(?:innovation|creativity|problem-solving|solution|strategic)\b',  # 사고방식
-            r'\b(?:leadership|responsibility|accountability|integrity|transparency)\b',  # 리더십 가치
-            r'\b(?:work-life|balance|flexibility|autonomy|empowerment)\b',  # 근무 가치관
-            
-            # 감정 표현 구문 패턴
-            r'(?:I\s+(?:am|feel|think|believe|want|hope|enjoy|love|prefer))',  # "I am passionate", "I believe" 등
-            r'(?:what\s+(?:excites|motivates|drives|inspires)\s+me)',  # "What excites me"
-            r'(?:(?:my|our)\s+(?:goal|mission|vision|approach|philosophy))',  # "My goal is"
-            r'(?:looking\s+for|seeking|hoping\s+to|wanting\s+to)',  # 추구하는 것
-            
-            # 추가 구체적 정보 패턴 (스크립트 기반)
-            r'\b(?:Savannah|Atlanta|Chicago|New York|Los Angeles|relocate|relocation)\b',  # 위치/이주 정보
-            r'\b(?:notice|timeline|available|start|transition)\b',  # 타이밍 정보
-            r'\b(?:Kenco|Hyundai|Glovis|automotive|manufacturing|packaging)\b',  # 회사/산업 정보
-            r'\b\d+\s*(?:week|staff|member|direct\s+report)',  # 구체적 수치 정보
-            r'\b(?:VP|General\s+Manager|Director|accessibility|diverse)',  # 리더십 정보
-        ]
-        
-        text_lower = text.lower()
-        specific_count = 0
-        matched_patterns = []
-        
-        for pattern in specific_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                specific_count += len(matches)
-                matched_patterns.append(pattern)
-        
-        # 임계값을 1개로 유지 (감정 표현도 중요한 정보)
-        is_specific = specific_count >= 1
-        
-        if not is_specific:
-            print(f"[구체성 검사] 구체적 정보 부족: {specific_count}개 발견")
-            print(f"  텍스트: '{text[:60]}...'")
-        else:
-            print(f"[구체성 검사] 구체적 정보 충분: {specific_count}개 발견 (감정/동기 포함)")
-            print(f"  매칭 패턴: {matched_patterns[:3]}...")  # 처음 3개만 표시
-        
-        return is_specific
+        """텍스트에 구체적인 정보가 있는지 확인 (감정/동기 포함, 패턴은 ContentFilters 참고)"""
+        # 임계값 1개: 패턴 하나라도 일치하면 충분 (감정 표현도 중요한 정보)
+        return self.content_filters.has_specific_information(text)
     
-    def _reassign_category_with_gpt(self, unknown_category, content_data, available_categories):
-        """GPT를 사용하여 알 수 없는 카테고리를 적절한 카테고리로 재분류"""
+    def _reassign_category_with_gpt(self, unknown_category, content_data, available_categories, gpt=None):
+        """
+        GPT를 사용하여 알 수 없는 카테고리를 적절한 카테고리로 재분류
+        
+        gpt를 넘기면 위젯 계층을 탐색하지 않으므로 워커 스레드에서 호출할 수 있다.
+        """
         try:
             # GPT Summarizer 가져오기 (이미 위에서 확인했으므로 간단하게)
-            current_widget = self
+            current_widget = self if gpt is None else None
             level = 0
             main_window = None
             
@@ -1298,12 +1273,12 @@ class InterviewWidget(QWidget):
                 current_widget = current_widget.parent()
                 level += 1
             
-            if not main_window or not hasattr(main_window, 'gpt_summarizer'):
+            if gpt is None and main_window is not None:
+                gpt = main_window.gpt_summarizer
+            if gpt is None:
                 print(f"[재분류] GPT 분석기 없음 - 재분류 실패")
                 return None
             
-            gpt = main_window.gpt_summarizer
-            
             # 내용 추출
             if isinstance(content_data, dict) and "assessment" in content_data:
                 content_text = str(content_data["assessment"])
@@ -1323,7 +1298,7 @@ Return ONLY the most appropriate category name from the available list. If none
 Response format: [Category_Name]
 """
             
-            response = gpt.client.chat.completions.create(
+            response = gpt.llm.chat_completion(
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a professional content categorization expert. Return only the most appropriate category name."},
@@ -1352,19 +1327,16 @@ Response format: [Category_Name]
             return None
     
     def manual_process(self):
-        """수동 분석 버튼 클릭 - 현재 텍스트와 누적 버퍼 모두 처리 (빠른 분석)"""
+        """수동 분석 버튼 클릭 - 현재 텍스트와 누적 버퍼 모두 처리 (빠른 분석, 결과는 비동기로 적용)"""
         current_text = self.live_text_edit.toPlainText()
         
-        # 현재 텍스트가 있으면 버퍼에 추가
-        if current_text:
-            if self.pending_analysis_buffer:
-                self.pending_analysis_buffer += "\n" + current_text
-            else:
-                self.pending_analysis_buffer = current_text
+        # 현재 텍스트가 있으면 버퍼에 추가 (공유 기록이면 실시간 텍스트는 이미 기록에 있음)
+        if current_text and self.owns_transcript and not self.analysis_view:
+            self.transcript.append_text(current_text)
         
         # 누적된 버퍼가 있으면 강제로 분석 실행
         if self.pending_analysis_buffer.strip():
-            print(f"[수동분석] 빠른 분석 시작 (길이: {len(self.pending_analysis_buffer)})")
+            print(f"[수동분석] 빠른 분석 시작 (길이: {len(self.analysis_view)})")
             
             # MainWindow에서 GPT 분석기 찾기
             current_widget = self
@@ -1379,38 +1351,10 @@ Response format: [Category_Name]
                 level += 1
             
             if main_window and hasattr(main_window, 'gpt_summarizer'):
-                gpt = main_window.gpt_summarizer
-                
-                # 빠른 카테고리 분류 실행
-                categories = list(self.template.get("screening_categories", []))
-                if "Other" not in categories:
-                    categories.append("Other")
-                
-                categorized_result = gpt.quick_categorize_text(self.pending_analysis_buffer, categories)
-                
-                if categorized_result:
-                    print(f"[수동분석] 분석 완료: {len(categorized_result)}개 카테고리")
-                    
-                    # 분석 결과를 각 카테고리에 추가
-                    for category, analysis_data in categorized_result.items():
-                        if category in self.category_widgets:
-                            if isinstance(analysis_data, dict) and "assessment" in analysis_data:
-                                assessment_list = analysis_data["assessment"]
-                                if isinstance(assessment_list, list):
-                                    for item in assessment_list:
-                                        if self._is_meaningful_assessment(item):
-                                            self.category_widgets[category].add_content(item)
-                                else:
-                                    if self._is_meaningful_assessment(str(assessment_list)):
-                                        self.category_widgets[category].add_content(str(assessment_list))
-                    
-                    # 버퍼 비우기
-                    self.pending_analysis_buffer = ""
-                    print(f"[수동분석] 완료, 버퍼 초기화")
-                    
-                    QMessageBox.information(self, "분석 완료", f"빠른 분석이 완료되었습니다!\n{len(categorized_result)}개 카테고리로 분류됨")
-                else:
-                    QMessageBox.warning(self, "분석 실패", "분석 결과를 가져올 수 없습니다.")
+                # 빠른 카테고리 분류 실행 (완료되면 _apply_categorization에서 결과 메시지 표시)
+                status = self._submit_categorization(main_window.gpt_summarizer, manual=True)
+                if status == 'duplicate':
+                    QMessageBox.information(self, "알림", "같은 내용을 이미 분석 중입니다.")
             else:
                 QMessageBox.warning(self, "오류", "GPT 분석기를 찾을 수 없습니다.")
         else:
@@ -10,6 +10,8 @@ from src.ui.template_editor import TemplateEditor
 from src.ui.interview_widget import InterviewWidget
 from src.ui.capture_widget import CaptureWidget
 from src.ui.summary_widget import SummaryWidget
+from src.core.transcript_store import TranscriptStore
+from src.gpt.llm_executor import get_llm_queue
 
 class MainWindow(QMainWindow):
     def __init__(self, settings):
@@ -224,7 +226,11 @@ class MainWindow(QMainWindow):
             self.stacked_widget.removeWidget(self.interview_widget)
             self.interview_widget.deleteLater()
             
-        self.interview_widget = InterviewWidget(template, self.settings, parent=self)
+        # 인터뷰마다 새 전사 기록 (캡처 위젯과 인터뷰 위젯이 공유)
+        self.transcript_store = TranscriptStore.from_settings(self.settings)
+        self.interview_widget = InterviewWidget(
+            template, self.settings, parent=self, transcript_store=self.transcript_store
+        )
         self.stacked_widget.addWidget(self.interview_widget)
         
         # 인터뷰 모드로 전환
@@ -323,7 +329,9 @@ class MainWindow(QMainWindow):
             
         # 기존 CaptureWidget 기능을 InterviewWidget와 연동
         if not hasattr(self, 'capture_widget'):
-            self.capture_widget = CaptureWidget(self.settings)
+            self.capture_widget = CaptureWidget(
+                self.settings, transcript_store=self.interview_widget.transcript, summarizer=self.gpt_summarizer
+            )
             # 캡처된 텍스트를 인터뷰 위젯으로 전달하는 연결
             self.capture_widget.text_captured.connect(self.on_text_captured)
             
@@ -334,6 +342,10 @@ class MainWindow(QMainWindow):
                 print(f"[MainWindow] 저장된 캡처 범위 적용: {w}x{h} at ({x}, {y})")
                 delattr(self, 'temp_capture_region')
             
+        # 새 인터뷰면 캡처 위젯도 새 전사 기록에 기록
+        if self.capture_widget.transcript is not self.interview_widget.transcript:
+            self.capture_widget.set_transcript(self.interview_widget.transcript)
+            
         self.capture_widget.start_capture()
         
         # 버튼 상태 업데이트
@@ -348,7 +360,7 @@ class MainWindow(QMainWindow):
             # 1. 마지막 캡처 한 번 더 수행
             print("[MainWindow] 마지막 캡처 수행 중...")
             try:
-                self.capture_widget.perform_ocr()
+                self.capture_widget.perform_ocr(wait=True)
                 print("[MainWindow] 마지막 캡처 완료")
             except Exception as e:
                 print(f"[MainWindow] 마지막 캡처 실패: {e}")
@@ -508,4 +520,6 @@ class MainWindow(QMainWindow):
         """창 닫기 이벤트"""
         if hasattr(self, 'capture_widget'):
             self.capture_widget.stop_capture()
+        print(f"[LLMService] 통계: {self.gpt_summarizer.llm.stats()}")
+        print(f"[LLMQueue] 통계: {get_llm_queue(self.settings).stats()}")
         event.accept() 
\ No newline at end of file
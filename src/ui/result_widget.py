@@ -1,22 +1,37 @@
+from collections import deque
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QTextEdit, QPushButton, QComboBox, QFileDialog
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from src.gpt.summarizer import GPTSummarizer
+from src.gpt.llm_executor import get_llm_queue
 from src.utils.document_saver import DocumentSaver
-import re
+from src.core.sentence_stream import StreamingSentenceSegmenter
+from src.core.text_buffer import ChunkedTextBuffer
+
+# 중복으로 보는 최근 표시 문장 수 (같은 프레임 텍스트가 다시 들어온 경우만 거름)
+RECENT_SENTENCES = 3
 
 class ResultWidget(QWidget):
     """OCR 결과 및 요약 표시 위젯"""
     
-    def __init__(self, settings):
+    # 요약 결과 전달 시그널 (워커 스레드 → UI 스레드)
+    summary_finished = pyqtSignal(object)
+    
+    def __init__(self, settings, summarizer=None):
         super().__init__()
         self.settings = settings
-        self.current_text = ""
+        self.current_text = ChunkedTextBuffer("\n")
         self.current_summary = {}
+        self.sentence_stream = StreamingSentenceSegmenter()
+        # 최근 표시한 문장 (화자, 정규화한 문장) 키 - 나중에 다시 나온 같은 대답("Yes.")은 표시
+        self._recent_sentences = deque(maxlen=RECENT_SENTENCES)
         
-        self.gpt_summarizer = GPTSummarizer(settings)
+        self.gpt_summarizer = summarizer if summarizer is not None else GPTSummarizer(settings)
+        # 요약 호출은 워커 스레드에서 실행하고 결과는 시그널로 UI 스레드에 전달
+        self.llm_queue = get_llm_queue(settings)
+        self.summary_finished.connect(self.apply_summary)
         self.document_saver = DocumentSaver()
         
         self.init_ui()
@@ -28,6 +43,9 @@ class ResultWidget(QWidget):
         # 텍스트 표시 영역
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
+        self.text_edit.document().setMaximumBlockCount(
+            self.settings.get('transcript', {}).get('live_view_max_blocks', 500)
+        )
         layout.addWidget(self.text_edit)
         
         # 요약 표시 영역
@@ -51,19 +69,33 @@ class ResultWidget(QWidget):
     def update_text(self, text):
         """텍스트 업데이트"""
         print(f'[ResultWidget] update_text 호출됨, 텍스트 길이: {len(text)}')
-        # OCR 결과 누적 (중복 방지)
-        text = text.strip()
-        if text and text not in self.current_text:
-            if self.current_text:
-                self.current_text += "\n" + text
-            else:
-                self.current_text = text
-        # 문장 단위로 분리
-        sentences = re.split(r'(?<=[.!?])\s+', self.current_text)
-        pretty_text = '\n'.join([s.strip() for s in sentences if s.strip()])
-        self.text_edit.setText(pretty_text)
-        # GPT 요약 수행 (누적 텍스트 기준)
-        self.current_summary = self.gpt_summarizer.summarize(self.current_text)
+        # 새 텍스트를 한 번만 문장으로 나누고, 직전에 표시한 문장과 같으면 건너뜀
+        # (잘린 문장의 재판독은 분할기가 대기 문장으로 처리)
+        added = False
+        for sentence in self.sentence_stream.feed(text):
+            key = (sentence['speaker'], " ".join(sentence['text'].lower().split()))
+            if key in self._recent_sentences:
+                continue
+            self._recent_sentences.append(key)
+            line = StreamingSentenceSegmenter.format([sentence])
+            self.current_text.append(line)
+            self.text_edit.append(line)
+            added = True
+        if added:
+            # GPT 요약 (누적 텍스트 기준, 진행 중이면 최신 텍스트가 대기 작업을 대체)
+            self.llm_queue.submit(
+                'result_summary',
+                self.current_text.text(),
+                self.gpt_summarizer.summarize,
+                on_result=lambda payload, result: self.summary_finished.emit(result),
+                on_error=lambda payload, e: print(f"[ResultWidget] 요약 실패: {e}"),
+            )
+    
+    def apply_summary(self, summary):
+        """요약 결과 적용 (UI 스레드)"""
+        if not summary:
+            return
+        self.current_summary = summary
         self.update_summary()
         
     def update_summary(self):
@@ -100,12 +132,12 @@ class ResultWidget(QWidget):
         try:
             if format_type == 'docx':
                 filepath = self.document_saver.save_docx(
-                    self.current_text,
+                    self.current_text.text(),
                     self.current_summary
                 )
             else:
                 filepath = self.document_saver.save_txt(
-                    self.current_text,
+                    self.current_text.text(),
                     self.current_summary
                 )
                 
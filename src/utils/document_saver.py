@@ -3,6 +3,14 @@ from datetime import datetime
 from docx import Document
 
 class DocumentSaver:
+    def save_text(self, text, filename):
+        """Save text (a string or an iterable of string chunks) to a file, writing chunk by chunk"""
+        chunks = [text] if isinstance(text, str) else text
+        with open(filename, 'w', encoding='utf-8-sig', errors='replace') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        return os.path.abspath(filename)
+
     def save_txt(self, text, summary):
         """Save as text file"""
         filename = f"ocr_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"